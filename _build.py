@@ -19,7 +19,9 @@ from packaging.version import Version
 from pygit2 import Repository
 from pytia.console import Console
 
-from pytia_quick_export.const import APP_NAME, APP_VERSION
+from pytia_quick_export.bundle import dump_bundle, read_configs
+from pytia_quick_export.const import APP_NAME, APP_VERSION, CONFIG_BUNDLE
+from pytia_quick_export.resources import Resources
 
 console = Console()
 settings_path = Path("./pytia_quick_export/resources/settings.json").resolve()
@@ -130,19 +132,46 @@ class Build:
             f.write(catvbs)
         console.info(f"Saved new launcher as {str(self.build_launcher_path)!r}")
 
+    def create_config_bundle(self) -> Path:
+        console.info("Creating config bundle ...")
+        resources_folder = Path(self.source_folder, "resources")
+        bundle_path = Path(resources_folder, CONFIG_BUNDLE)
+        if os.path.exists(bundle_path):
+            os.remove(bundle_path)
+
+        # The bundle is built from the json files, which are validated against the dataclasses
+        # of the resources first.
+        try:
+            configs = read_configs(resources_folder)
+            Resources(configs=configs).validate()
+            bundle = dump_bundle(configs)
+        except Exception as e:
+            console.error(f"Failed building app: Config files are not valid: {e}")
+            sys.exit()
+
+        with open(bundle_path, "wb") as f:
+            f.write(bundle)
+        console.info(f"Saved config bundle as {str(bundle_path)!r}")
+        return bundle_path
+
     def build(self):
         console.info(f"Building {APP_NAME} {APP_VERSION}")
         self.provide()
         self.test()
         self.create_launcher()
-        zipapp.create_archive(
-            source=self.source_folder,
-            target=self.build_app_path,
-            interpreter=None,
-            main=None,
-            filter=None,
-            compressed=False,
-        )
+        bundle_path = self.create_config_bundle()
+        try:
+            zipapp.create_archive(
+                source=self.source_folder,
+                target=self.build_app_path,
+                interpreter=None,
+                main=None,
+                filter=None,
+                compressed=False,
+            )
+        finally:
+            # The bundle is only valid inside the app, the source folder uses the json files.
+            os.remove(bundle_path)
         console.ok(f"Built app into {str(self.build_folder)!r}")
 
 
@@ -6,6 +6,8 @@ from pathlib import Path
 from pathlib import WindowsPath
 from tkinter import Tk
 from tkinter import filedialog
+from typing import TYPE_CHECKING
+from typing import Optional
 
 from app.frames import Frames
 from app.layout import Layout
@@ -17,7 +19,9 @@ from pytia.log import log
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from pytia_ui_tools.helper.values import add_current_value_to_combobox_list
 from resources import resource
-from worker import Worker
+
+if TYPE_CHECKING:
+    from worker import Worker
 
 
 class Callbacks:
@@ -49,6 +53,7 @@ class Callbacks:
         self.workspace = workspace
         self.doc_helper = doc_helper
         self.set_ui = ui_setter
+        self.worker: Optional["Worker"] = None
         self.readonly = bool(
             not resource.logon_exists()
             and not resource.settings.restrictions.allow_all_users
@@ -112,7 +117,11 @@ class Callbacks:
         """
         log.info("Callback for button 'Export'.")
         self.set_ui.working()
-        worker = Worker(
+
+        # The worker imports all exporters, import it on the first export only.
+        from worker import Worker  # pylint: disable=C0415
+
+        self.worker = Worker(
             main_ui=self.root,
             layout=self.layout,
             ui_setter=self.set_ui,
@@ -121,7 +130,7 @@ class Callbacks:
             frames=self.frames,
             workspace=self.workspace,
         )
-        self.root.after(100, worker.run)
+        self.root.after(100, self.worker.run)
 
     def on_btn_upload(self) -> None:
         """
@@ -139,8 +148,14 @@ class Callbacks:
         self.root.after(100, rps.upload_bought_item)
 
     def on_btn_abort(self) -> None:
-        """Callback function for the abort button. Closes the app."""
+        """
+        Callback function for the abort button. Cancels the export if it's running, closes
+        the app otherwise.
+        """
         log.info("Callback for button 'Abort'.")
+        if self.worker is not None and self.worker.running:
+            self.worker.cancel()
+            return
         self.root.withdraw()
         self.root.destroy()
 
@@ -4,7 +4,6 @@
 
 import os
 
-import validators
 from app.layout import Layout
 from app.state_setter import UISetter
 from app.vars import Variables
@@ -79,6 +78,8 @@ class Traces:
 
     def trace_mail(self, *_) -> None:
         """Mail variable trace. Verifies the user input for setting the export button."""
+        import validators  # pylint: disable=C0415
+
         self.layout.input_mail.configure(
             foreground=self.style.colors.fg if validators.email(self.vars.mail.get()) else self.style.colors.danger  # type: ignore
         )
@@ -0,0 +1,136 @@
+"""
+    Pre-parsed config bundle.
+
+    The build step parses and validates all config files and writes them into a single bundle
+    file, which is loaded with one read at runtime instead of opening every json from the zipped
+    app. The bundle is only valid for the app version and python version that built it.
+
+    This module doesn't import the resources, hence the build script can create the bundle
+    without initializing the runtime resources.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Dict
+from typing import Tuple
+
+from const import APP_VERSION
+from const import CONFIG_DOCKET
+from const import CONFIG_EXCEL
+from const import CONFIG_EXCEL_DEFAULT
+from const import CONFIG_KEYWORDS
+from const import CONFIG_PROPS
+from const import CONFIG_PROPS_DEFAULT
+from const import CONFIG_RPS
+from const import CONFIG_SETTINGS
+from const import CONFIG_USERS
+
+BUNDLE_MAGIC = b"PQEB"
+BUNDLE_FORMAT = 1
+
+# The config files by their name. The first existing file of a config is read, the last one is
+# the fallback (e.g. the default file that ships with the app).
+CONFIG_RESOURCES: Dict[str, Tuple[str, ...]] = {
+    "settings": (CONFIG_SETTINGS,),
+    "rps": (CONFIG_RPS,),
+    "keywords": (CONFIG_KEYWORDS,),
+    "users": (CONFIG_USERS,),
+    "docket": (CONFIG_DOCKET,),
+    "props": (CONFIG_PROPS, CONFIG_PROPS_DEFAULT),
+    "excel": (CONFIG_EXCEL, CONFIG_EXCEL_DEFAULT),
+}
+
+
+def read_configs(folder: Path) -> Dict[str, dict | list]:
+    """
+    Reads the json config files from the given folder. Configs without any file are omitted,
+    e.g. the optional docket.json.
+
+    Args:
+        folder (Path): The folder of the config files.
+
+    Raises:
+        ValueError: Raised if a config file isn't valid json.
+
+    Returns:
+        Dict[str, dict | list]: The parsed content of the config files by their name.
+    """
+    configs = {}
+    for name, files in CONFIG_RESOURCES.items():
+        if path := next(
+            (Path(folder, f) for f in files if os.path.exists(Path(folder, f))), None
+        ):
+            with open(path, "rb") as f:
+                configs[name] = json.loads(f.read())
+    return configs
+
+
+def dump_bundle(configs: Dict[str, dict | list]) -> bytes:
+    """
+    Serializes the parsed config files into a bundle.
+
+    Args:
+        configs (Dict[str, dict | list]): The parsed content of the config files by their name.
+
+    Returns:
+        bytes: The bundle: Magic, format, sha256 checksum of the payload and the payload.
+    """
+    payload = marshal.dumps(
+        {
+            "app_version": APP_VERSION,
+            "python_version": list(sys.version_info[:2]),
+            "configs": configs,
+        }
+    )
+    return (
+        BUNDLE_MAGIC
+        + bytes([BUNDLE_FORMAT])
+        + hashlib.sha256(payload).digest()
+        + payload
+    )
+
+
+def load_bundle(raw: bytes) -> Dict[str, dict | list]:
+    """
+    Loads the parsed config files from a bundle.
+
+    Args:
+        raw (bytes): The bundle as written by `dump_bundle`.
+
+    Raises:
+        ValueError: Raised if the bundle is corrupted or has been built for another app or \
+            python version.
+
+    Returns:
+        Dict[str, dict | list]: The parsed content of the config files by their name.
+    """
+    header_size = len(BUNDLE_MAGIC) + 1 + 32
+    if len(raw) < header_size or not raw.startswith(BUNDLE_MAGIC):
+        raise ValueError("The config bundle is not valid.")
+    if raw[len(BUNDLE_MAGIC)] != BUNDLE_FORMAT:
+        raise ValueError("The config bundle format is not supported.")
+
+    checksum = raw[len(BUNDLE_MAGIC) + 1 : header_size]
+    payload = raw[header_size:]
+    if hashlib.sha256(payload).digest() != checksum:
+        raise ValueError("The config bundle checksum doesn't match.")
+
+    try:
+        bundle = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError) as e:
+        raise ValueError(f"The config bundle cannot be read: {e}") from e
+
+    if bundle["python_version"] != list(sys.version_info[:2]):
+        raise ValueError(
+            "The config bundle has been built with another python version."
+        )
+    if bundle["app_version"] != APP_VERSION:
+        raise ValueError("The config bundle has been built for another app version.")
+    return bundle["configs"]
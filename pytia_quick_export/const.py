@@ -22,6 +22,8 @@ TEMP_TEMPLATES = Path(TEMP, PYTIA_QUICK_EXPORT, "templates")
 APPDATA = f"{str(os.environ.get('APPDATA'))}\\{PYTIA}\\{PYTIA_QUICK_EXPORT}"
 LOGS = f"{APPDATA}\\logs"
 LOG = "app.log"
+LOG_TIMING = "timing.json"
+LOG_METRICS = "metrics.jsonl"
 PID = os.getpid()
 PID_FILE = f"{TEMP}\\{PYTIA_QUICK_EXPORT}.pid"
 VENV = f"\\.env\\{APP_VERSION}"
@@ -41,6 +43,7 @@ CONFIG_PROPS = "properties.json"
 CONFIG_PROPS_DEFAULT = "properties.default.json"
 CONFIG_USERS = "users.json"
 CONFIG_DOCKET = "docket.json"
+CONFIG_BUNDLE = "config.bundle"
 
 PROP_DRAWING_PATH = "pytia.drawing_path"
 
@@ -27,12 +27,14 @@ from pytia.exceptions import PytiaDocumentNotSavedError
 from pytia.exceptions import PytiaNoDocumentOpenError
 from pytia.exceptions import PytiaPropertyNotFoundError
 from pytia.exceptions import PytiaWrongDocumentTypeError
+from pytia.log import log
 from pytia_ui_tools.exceptions import PytiaUiToolsOutsideWorkspaceError
 from pytia_ui_tools.handlers.error_handler import ErrorHandler
 from pytia_ui_tools.handlers.mail_handler import MailHandler
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from pytia_ui_tools.window_manager import WindowManager
 from resources import resource
+from timing import timer
 
 
 class GUI(tk.Tk):
@@ -114,38 +116,47 @@ class GUI(tk.Tk):
 
     def _run(self) -> None:
         """Runs all controllers. Initializes all lazy loaders, bindings and traces."""
-        self.doc_helper = LazyDocumentHelper()
-        self.workspace = Workspace(
-            path=self.doc_helper.path,
-            filename=resource.settings.files.workspace,
-            allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
-        )
-        self.workspace.read_yaml()
-        if ws_title := self.workspace.elements.title:
-            self.title(f"{self.title()}  -  {ws_title} (Workspace)")
-
-        self.set_ui = UISetter(
-            root=self,
-            layout=self.layout,
-            variables=self.vars,
-            workspace=self.workspace,
-            source=self.doc_helper.source,
-        )
-
-        controller = Controller(
-            root=self,
-            doc_helper=self.doc_helper,
-            layout=self.layout,
-            vars=self.vars,
-            ui_setter=self.set_ui,
-            workspace=self.workspace,
-        )
-        controller.run_all_controllers()
-
-        self.callbacks()
-        self.traces()
-        self.bindings()
-        self.tooltips()
+        try:
+            with timer.span("Document"):
+                self.doc_helper = LazyDocumentHelper()
+
+            with timer.span("Workspace"):
+                self.workspace = Workspace(
+                    path=self.doc_helper.path,
+                    filename=resource.settings.files.workspace,
+                    allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
+                )
+                self.workspace.read_yaml()
+            if ws_title := self.workspace.elements.title:
+                self.title(f"{self.title()}  -  {ws_title} (Workspace)")
+
+            with timer.span("Controllers"):
+                self.set_ui = UISetter(
+                    root=self,
+                    layout=self.layout,
+                    variables=self.vars,
+                    workspace=self.workspace,
+                    source=self.doc_helper.source,
+                )
+
+                controller = Controller(
+                    root=self,
+                    doc_helper=self.doc_helper,
+                    layout=self.layout,
+                    vars=self.vars,
+                    ui_setter=self.set_ui,
+                    workspace=self.workspace,
+                )
+                controller.run_all_controllers()
+
+            with timer.span("Bindings"):
+                self.callbacks()
+                self.traces()
+                self.bindings()
+                self.tooltips()
+        finally:
+            log.info(timer.format_report())
+            timer.dump()
 
     def bindings(self) -> None:
         """Key bindings."""
@@ -0,0 +1,115 @@
+"""
+    Render context of an export.
+
+    The values that depend on the user input and on the users config (the selected project, the
+    condition overwrites and the translated usernames) are resolved once per export. The EXCEL
+    data, the docket, the mail and the RPS upload are all rendered from the same context.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from types import MappingProxyType
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+
+from const import LOGON
+from helper.snapshot import PropertySnapshot
+from helper.translators import translate_project
+from resources import resource
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class RenderContext:
+    """Immutable context of an export, from which all export files are rendered."""
+
+    snapshot: PropertySnapshot
+    project: str
+    condition: str
+    quantity: int | str
+    # The translated creator, None if the property doesn't exist
+    creator: Optional[str]
+    # The translated modifier, None if the property doesn't exist
+    modifier: Optional[str]
+    publisher: str
+    overwrites: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def arguments(self) -> Dict[str, Any]:
+        """The arguments for the docket, including the condition overwrites."""
+        return {
+            "project": self.project,
+            "quantity": self.quantity,
+            "creator": "Unknown" if self.creator is None else self.creator,
+            "modifier": "Unknown" if self.modifier is None else self.modifier,
+            "publisher": self.publisher,
+            **self.overwrites,
+        }
+
+    def get_property(self, name: str) -> str:
+        """
+        Returns the value of the user property as it's exported: With the condition overwrites,
+        the selected project and the translated usernames applied.
+
+        Args:
+            name (str): The name of the user property.
+
+        Returns:
+            str: The value, an empty string if the property doesn't exist.
+        """
+        if not self.snapshot.exists(name):
+            return ""
+        if name in self.overwrites:
+            return self.overwrites[name]
+        if name == resource.props.project:
+            return self.project
+        if name == resource.props.creator:
+            return self.creator  # type: ignore
+        if name == resource.props.modifier:
+            return self.modifier  # type: ignore
+        return self.snapshot.get(name)  # type: ignore
+
+
+def _translate_username(logon: str) -> str:
+    """Returns the name of the user, if the logon exists and usernames are applied."""
+    if resource.settings.export.apply_username and resource.logon_exists(logon):
+        return resource.get_user_by_logon(logon).name
+    return logon
+
+
+def create_render_context(
+    snapshot: PropertySnapshot,
+    project: str,
+    condition: str,
+    quantity: int | str,
+) -> RenderContext:
+    """
+    Creates the render context of an export.
+
+    Args:
+        snapshot (PropertySnapshot): The property snapshot of the document.
+        project (str): The project from the UI, or KEEP to use the project of the document.
+        condition (str): The condition from the UI.
+        quantity (int | str): The quantity from the UI.
+
+    Returns:
+        RenderContext: The context.
+    """
+    creator = snapshot.get(resource.props.creator)
+    modifier = snapshot.get(resource.props.modifier)
+
+    return RenderContext(
+        snapshot=snapshot,
+        project=translate_project(project=project, snapshot=snapshot),
+        condition=condition,
+        quantity=quantity,
+        creator=None if creator is None else _translate_username(creator),
+        modifier=None if modifier is None else _translate_username(modifier),
+        publisher=_translate_username(LOGON),
+        overwrites=MappingProxyType(
+            dict(resource.settings.condition.mod.overwrite)
+            if condition == resource.settings.condition.mod.name
+            else {}
+        ),
+    )
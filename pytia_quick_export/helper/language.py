@@ -3,6 +3,7 @@
 """
 
 from typing import Literal
+from typing import Optional
 
 from pycatia.knowledge_interfaces.parameters import Parameters
 from pytia.exceptions import PytiaLanguageError
@@ -35,3 +36,30 @@ def get_ui_language(parameters: Parameters) -> Literal["en", "de"]:
         f"The selected language is not supported. "
         "Please select either 'English' or 'German'."
     )
+
+
+class LanguageCache:
+    """
+    Memoizes the language of the CATIA UI. Detecting the language probes the parameters of the
+    document, which is slow. The language is cached for the lifetime of the cache, use one cache
+    per document (or per batch, the UI language doesn't change while CATIA runs).
+    """
+
+    def __init__(self) -> None:
+        self._language: Optional[Literal["en", "de"]] = None
+        self.probes = 0
+
+    def get(self, parameters: Parameters) -> Literal["en", "de"]:
+        """
+        Returns the language of the CATIA UI. Probes the parameters only on the first call.
+
+        Args:
+            parameters (Parameters): The parameters of the document.
+
+        Returns:
+            Literal["en", "de"]: The language of the CATIA UI.
+        """
+        if self._language is None:
+            self.probes += 1
+            self._language = get_ui_language(parameters=parameters)
+        return self._language
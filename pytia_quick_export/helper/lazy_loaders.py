@@ -3,14 +3,18 @@
 """
 
 import os
-import time
 from pathlib import Path
+from typing import Literal
 
+from helper.language import LanguageCache
+from helper.snapshot import PropertySnapshot
+from helper.snapshot import take_snapshot
 from pytia.exceptions import PytiaDocumentNotSavedError
 from pytia.exceptions import PytiaValueError
 from pytia.exceptions import PytiaWrongDocumentTypeError
 from pytia.log import log
 from resources import resource
+from timing import timer
 
 
 class LazyDocumentHelper:
@@ -28,60 +32,59 @@ class LazyDocumentHelper:
         # Otherwise the CATIA-not-running-exception will not be caught.
         # Also: The UI will load a little bit faster.
 
-        start_time = time.perf_counter()
-        # pylint: disable=C0415
-        from pytia.framework import framework
+        with timer.span("Document wrapper") as span:
+            # pylint: disable=C0415
+            from pytia.framework import framework
 
-        # pylint: enable=C0415
+            # pylint: enable=C0415
 
-        self.framework = framework
-        self.lazy_document = framework.catia.active_document
-        self.is_part = self.lazy_document.is_part
-        self.is_document = self.lazy_document.is_product
+            self.framework = framework
+            self.lazy_document = framework.catia.active_document
+            self.is_part = self.lazy_document.is_part
+            self.is_document = self.lazy_document.is_product
 
-        # FIXME: Disabled lock: Can't release the lock when changing the editor.
-        # self._lock_catia(True)
-        # atexit.register(lambda: self._lock_catia(False))
+            # FIXME: Disabled lock: Can't release the lock when changing the editor.
+            # self._lock_catia(True)
+            # atexit.register(lambda: self._lock_catia(False))
 
-        if not resource.settings.restrictions.allow_unsaved and not os.path.isabs(
-            self.lazy_document.full_name
-        ):
-            raise PytiaDocumentNotSavedError(
-                "It is not allowed to edit the parameters of an unsaved document. "
-                "Please save the document first."
-            )
+            if not resource.settings.restrictions.allow_unsaved and not os.path.isabs(
+                self.lazy_document.full_name
+            ):
+                raise PytiaDocumentNotSavedError(
+                    "It is not allowed to edit the parameters of an unsaved document. "
+                    "Please save the document first."
+                )
 
-        if self.lazy_document.is_part:
-            # pylint: disable=C0415
-            from pytia.wrapper.documents.part_documents import PyPartDocument
+            if self.lazy_document.is_part:
+                # pylint: disable=C0415
+                from pytia.wrapper.documents.part_documents import PyPartDocument
 
-            # pylint: enable=C0415
+                # pylint: enable=C0415
 
-            self.document = PyPartDocument(strict_naming=False)
-            log.debug("Current document is a CATPart.")
+                self.document = PyPartDocument(strict_naming=False)
+                log.debug("Current document is a CATPart.")
 
-        elif self.lazy_document.is_product:
-            # pylint: disable=C0415
-            from pytia.wrapper.documents.product_documents import PyProductDocument
+            elif self.lazy_document.is_product:
+                # pylint: disable=C0415
+                from pytia.wrapper.documents.product_documents import PyProductDocument
 
-            # pylint: enable=C0415
-
-            self.document = PyProductDocument(strict_naming=False)
-            log.debug("Current document is a CATProduct.")
+                # pylint: enable=C0415
 
-        else:
-            raise PytiaWrongDocumentTypeError(
-                "The current document is neither a part nor a product."
-            )
+                self.document = PyProductDocument(strict_naming=False)
+                log.debug("Current document is a CATProduct.")
 
-        end_time = time.perf_counter()
-        log.debug(f"Loaded PyPartDocument in {(end_time-start_time):.4f}s")
+            else:
+                raise PytiaWrongDocumentTypeError(
+                    "The current document is neither a part nor a product."
+                )
+        log.debug(f"Loaded PyPartDocument in {span.duration:.4f}s")
 
         self.document.current()
         self.document.product.part_number = self.document.document.name.split(".CATP")[
             0
         ]
         self.name = self.document.document.name
+        self._language_cache = LanguageCache()
 
         if self.document.product.source not in [1, 2]:
             raise PytiaValueError("The source of the current document is not set.")
@@ -106,6 +109,29 @@ class LazyDocumentHelper:
         """Returns the source of the document."""
         return self.document.product.source
 
+    @property
+    def language(self) -> Literal["en", "de"]:
+        """
+        Returns the language of the CATIA UI. The language is detected once and cached for the
+        lifetime of the helper, same as the document (see the class docstring).
+        """
+        return self._language_cache.get(parameters=self.document.product.parameters)
+
+    @property
+    def language_probes(self) -> int:
+        """Returns how often the language has been detected from the document."""
+        return self._language_cache.probes
+
+    def snapshot(self) -> PropertySnapshot:
+        """
+        Reads all properties of the document that are required for an export. Take a new
+        snapshot for every export, the snapshot doesn't reflect later changes to the document.
+        """
+        return take_snapshot(
+            document=self.document,  # type: ignore
+            language=self.language,
+        )
+
     def _lock_catia(self, value: bool) -> None:
         """
         Sets the lock-state of catia.
@@ -3,19 +3,17 @@
 """
 
 from const import KEEP
-from helper.lazy_loaders import LazyDocumentHelper
+from helper.snapshot import PropertySnapshot
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from resources import resource
 
 
-def get_data_export_name(
-    doc_helper: LazyDocumentHelper, project: str | None = None
-) -> str:
+def get_data_export_name(snapshot: PropertySnapshot, project: str | None = None) -> str:
     """
     Returns the filename for the data export.
 
     Args:
-        doc_helper (LazyDocumentHelper): The lazy document helper instance.
+        snapshot (PropertySnapshot): The property snapshot of the document.
         project (str | None, optional): The project number, that will be used. Defaults to None. \
             If None, the project number from the documents properties will be used.
 
@@ -25,9 +23,9 @@ def get_data_export_name(
     # TODO: Make the export filename configurable in the settings.json
 
     value = (
-        f"{doc_helper.document.properties.get_by_name(resource.props.product).value} "
-        f"{doc_helper.document.product.part_number} "
-        f"Rev{doc_helper.document.product.revision}"
+        f"{snapshot.get(resource.props.product)} "
+        f"{snapshot.partnumber} "
+        f"Rev{snapshot.revision}"
     )
     if project:
         value = f"{project} {value}"
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from pytia.log import log
+from timing import timer
 from win32com.client import CDispatch
 from win32com.client import Dispatch
 from win32com.server.exception import COMException
@@ -15,7 +16,8 @@ def get_outlook() -> Optional[CDispatch]:
         Optional[CDispatch]: The dispatch from MS Outlook.
     """
     try:
-        app = Dispatch("outlook.application")
+        with timer.span("Outlook"):
+            app = Dispatch("outlook.application")
         return app  # type: ignore
     except COMException as e:
         log.warning(f"Outlook is not installed on this system: {e}")
@@ -3,11 +3,10 @@ from tkinter import Tk
 from tkinter import messagebox as tkmsg
 from tkinter import simpledialog
 
-import requests
 from app.state_setter import UISetter
 from app.vars import Variables
+from helper.context import create_render_context
 from helper.lazy_loaders import LazyDocumentHelper
-from helper.translators import translate_project
 from helper.translators import translate_property_value
 from pytia.log import log
 from resources import resource
@@ -59,6 +58,8 @@ class Rps:
     @classmethod
     def test_login(cls) -> None:
         """Tests the access token for the RPS system. Shows respective information."""
+        import requests  # pylint: disable=C0415
+
         pat = resource.appdata.personal_access_token
 
         try:
@@ -122,26 +123,26 @@ class Rps:
         """
         data = {}
         schema = resource.rps.api.bought.create.schema
+        context = create_render_context(
+            snapshot=self.doc_helper.snapshot(),
+            project=self.variables.project.get(),
+            condition=self.variables.condition.get(),
+            quantity=self.variables.quantity.get(),
+        )
 
         for key, value in schema.items():
             value = str(value)
             if value.startswith("%"):
                 value = value[1:]
             else:
-                value = translate_property_value(
-                    value=value,
-                    selected_quantity=self.variables.quantity.get(),
-                    selected_condition=self.variables.condition.get(),
-                    selected_project=translate_project(
-                        project=self.variables.project, doc_helper=self.doc_helper
-                    ),
-                    doc_helper=self.doc_helper,
-                )
+                value = translate_property_value(value=value, context=context)
             data[key] = value
         return json.dumps(data)
 
     def upload_bought_item(self) -> None:
         """Uploads the data to the rps system."""
+        import requests  # pylint: disable=C0415
+
         data = self._process_schema()
 
         try:
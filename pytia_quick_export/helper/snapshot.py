@@ -0,0 +1,122 @@
+"""
+    Snapshot of the document's properties.
+
+    Reading a property from the document is a cross-process COM call. The snapshot reads all
+    properties that are required for an export once and serves them from memory afterwards.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from types import MappingProxyType
+from typing import Iterable
+from typing import List
+from typing import Literal
+from typing import Mapping
+from typing import Optional
+from typing import Protocol
+
+from const import PROP_DRAWING_PATH
+from resources import resource
+
+
+class SnapshotProduct(Protocol):
+    """The product attributes that are read by the snapshot."""
+
+    part_number: str
+    revision: str
+    definition: str
+    source: int
+    description_reference: str
+
+    def is_catpart(self) -> bool:
+        ...
+
+
+class SnapshotDocument(Protocol):
+    """
+    The document interface required by the snapshot. Implemented by the pytia part and product
+    documents (and by any in-memory fake document).
+    """
+
+    product: SnapshotProduct
+    properties: object
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class PropertySnapshot:
+    """Immutable snapshot of the product attributes and user properties of a document."""
+
+    partnumber: str
+    revision: str
+    definition: str
+    source: int
+    description: str
+    is_part: bool
+    language: Literal["en", "de"]
+    properties: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def exists(self, name: str) -> bool:
+        """Returns whether the user property existed when the snapshot was taken."""
+        return name in self.properties
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns the value of the user property, or the default if it doesn't exist."""
+        return self.properties.get(name, default)
+
+
+def get_required_property_names() -> List[str]:
+    """
+    Returns the names of all user properties that are referenced in the config files.
+
+    Returns:
+        List[str]: The property names, without duplicates.
+    """
+    names: List[str] = [*resource.props.values, PROP_DRAWING_PATH]
+    names += list(resource.settings.condition.mod.overwrite)
+
+    for item in resource.excel.plan_made + resource.excel.plan_bought:
+        if item.kind == "property":
+            names.append(item.value)
+
+    if resource.settings.export.enable_rps:
+        for value in resource.rps.api.bought.create.schema.values():
+            value = str(value)
+            if not value.startswith("%") and not value.startswith("$"):
+                names.append(value)
+
+    return list(dict.fromkeys(names))
+
+
+def take_snapshot(
+    document: SnapshotDocument,
+    language: Literal["en", "de"],
+    names: Optional[Iterable[str]] = None,
+) -> PropertySnapshot:
+    """
+    Reads the product attributes and the user properties of the document.
+
+    Args:
+        document (SnapshotDocument): The document from which to read the data.
+        language (Literal["en", "de"]): The language of the CATIA UI.
+        names (Optional[Iterable[str]], optional): The names of the user properties to read. \
+            Defaults to all properties referenced in the config files.
+
+    Returns:
+        PropertySnapshot: The snapshot.
+    """
+    properties = {}
+    for name in get_required_property_names() if names is None else names:
+        if document.properties.exists(name):  # type: ignore
+            properties[name] = document.properties.get_by_name(name).value  # type: ignore
+
+    product = document.product
+    return PropertySnapshot(
+        partnumber=product.part_number,
+        revision=product.revision,
+        definition=product.definition,
+        source=product.source,
+        description=product.description_reference,
+        is_part=product.is_catpart(),
+        language=language,
+        properties=MappingProxyType(properties),
+    )
@@ -1,12 +1,14 @@
-from tkinter import StringVar
+from typing import TYPE_CHECKING
 from typing import Literal
 
 from const import KEEP
-from helper.language import get_ui_language
-from helper.lazy_loaders import LazyDocumentHelper
+from helper.snapshot import PropertySnapshot
 from pytia.exceptions import PytiaValueError
 from resources import resource
 
+if TYPE_CHECKING:
+    from helper.context import RenderContext
+
 
 def translate_source(value: int, language: Literal["en", "de"]) -> str:
     """
@@ -73,79 +75,50 @@ def translate_type(is_part: bool, language: Literal["en", "de"]) -> str:
     )
 
 
-def translate_project(project: StringVar, doc_helper: LazyDocumentHelper) -> str:
+def translate_project(project: str, snapshot: PropertySnapshot) -> str:
     return (
-        doc_helper.document.properties.get_by_name(resource.props.project).value
-        if project.get() == KEEP
-        else project.get()
+        snapshot.get(resource.props.project, "")  # type: ignore
+        if project == KEEP
+        else project
     )
 
 
-def translate_property_value(
-    value: str,
-    selected_quantity: int | str,
-    selected_condition: str,
-    selected_project: str,
-    doc_helper: LazyDocumentHelper,
-) -> str:
-    lang = get_ui_language(parameters=doc_helper.document.product.parameters)
+def translate_property_value(value: str, context: "RenderContext") -> str:
+    """
+    Returns the value of a config item (excel.json, rps.json) for the export.
+
+    Args:
+        value (str): The config value: A keyword prefixed with `$`, or the name of a user \
+            property.
+        context (RenderContext): The render context of the export.
+
+    Returns:
+        str: The value.
+    """
+    snapshot = context.snapshot
+    lang = snapshot.language
 
     if value.startswith("$"):
         keyword_item = value.split("$")[-1]
 
         # Look for CATIA standard properties and handle them
         if keyword_item == "partnumber":
-            value = doc_helper.document.product.part_number
+            value = snapshot.partnumber
         elif keyword_item == "revision":
-            value = doc_helper.document.product.revision
+            value = snapshot.revision
         elif keyword_item == "definition":
-            value = doc_helper.document.product.definition
+            value = snapshot.definition
         elif keyword_item == "source":
-            value = translate_source(doc_helper.document.product.source, lang)
+            value = translate_source(snapshot.source, lang)
         elif keyword_item == "description":
-            value = doc_helper.document.product.description_reference
+            value = snapshot.description
         elif keyword_item == "type":
-            value = translate_type(doc_helper.document.product.is_catpart(), lang)
+            value = translate_type(snapshot.is_part, lang)
         elif keyword_item == "quantity":
-            value = str(selected_quantity)
-
-    # Look for user properties and handle them.
-    elif doc_helper.document.properties.exists(value):
-        # Apply rule for overwriting data depending on the selected condition
-        if (
-            selected_condition == resource.settings.condition.mod.name
-            and value in resource.settings.condition.mod.overwrite
-        ):
-            value = resource.settings.condition.mod.overwrite[value]
-
-        # Apply the project number
-        elif value == resource.props.project:
-            value = selected_project
-
-        # Apply (translate) the username
-        elif (
-            value == resource.props.creator
-            and resource.settings.export.apply_username
-            and resource.logon_exists(
-                creator_logon := doc_helper.document.properties.get_by_name(value).value
-            )
-        ):
-            value = resource.get_user_by_logon(creator_logon).name
-        elif (
-            value == resource.props.modifier
-            and resource.settings.export.apply_username
-            and resource.logon_exists(
-                modifier_logon := doc_helper.document.properties.get_by_name(
-                    value
-                ).value
-            )
-        ):
-            value = resource.get_user_by_logon(modifier_logon).name
-
-        # Get the properties' value by the name
-        else:
-            value = doc_helper.document.properties.get_by_name(value).value
+            value = str(context.quantity)
+
+    # Look for user properties, the context applies the condition, the project and the usernames.
     else:
-        value = ""
+        value = context.get_property(value)
 
     return value
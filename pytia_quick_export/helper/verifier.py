@@ -3,7 +3,6 @@ from tkinter import DISABLED
 from tkinter import NORMAL
 from tkinter import messagebox as tkmsg
 
-import validators
 from app.layout import Layout
 from app.vars import Variables
 from resources import resource
@@ -17,6 +16,8 @@ def verify_user_input_for_export(variables: Variables, layout: Layout) -> None:
         variables (Variables): The main UIs variables.
         layout (Layout): The layout of the main UI.
     """
+    import validators  # pylint: disable=C0415
+
     if all(
         [
             len(variables.project.get()) > 0,
@@ -5,8 +5,10 @@
     Main module for the app.
 """
 
+import argparse
 import atexit
 import os
+from pathlib import Path
 
 from const import APP_NAME
 from const import APP_VERSION
@@ -16,19 +18,49 @@ from const import PID
 from const import PID_FILE
 from dependencies import deps
 from resources import resource
+from timing import timer
 
 
 def main() -> None:
     """Application entry point."""
+    parser = argparse.ArgumentParser(prog=APP_NAME)
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="MANIFEST",
+        help="Exports all documents of the manifest without the UI.",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="REPORT",
+        help="The path to which the result of the batch export is written.",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        metavar="SUMMARY",
+        help="The path of the combined EXCEL file of the batch export, one row per document.",
+    )
+    parser.add_argument(
+        "--timing",
+        type=Path,
+        metavar="REPORT",
+        help="The path to which the startup timing report is written as json.",
+    )
+    args = parser.parse_args()
+    timer.json_path = args.timing
 
     # For the apps auto-install-feature, all required dependencies must be
     # imported after they have been checked.
     # So: First check if all required dependencies are installed.
     # Afterwards import those modules which depend on third party modules.
-    deps.install_dependencies()
+    with timer.span("Dependencies"):
+        deps.install_dependencies()
 
-    from gui import GUI  # pylint: disable=C0415
-    from pytia.log import log  # pylint: disable=C0415
+    with timer.span("Imports"):
+        from gui import GUI  # pylint: disable=C0415
+        from pytia.log import log  # pylint: disable=C0415
 
     with open(PID_FILE, "w") as f:
         f.write(str(PID))
@@ -41,9 +73,48 @@ def main() -> None:
     log.add_file_handler(folder=LOGS, filename=LOG)
     log.info(f"Running {APP_NAME} {APP_VERSION}, PID={PID}")
 
-    gui = GUI()
+    if args.batch:
+        run_batch(manifest=args.batch, report=args.report, summary=args.summary)
+        return
+
+    with timer.span("GUI construction"):
+        gui = GUI()
     gui.run()
 
 
+def run_batch(
+    manifest: Path, report: Path | None = None, summary: Path | None = None
+) -> None:
+    """
+    Exports all documents of the batch manifest without the UI.
+
+    Args:
+        manifest (Path): The path to the batch manifest.
+        report (Path | None, optional): The path of the batch report. Defaults to the manifest \
+            path with the suffix '.report.json'.
+        summary (Path | None, optional): The path of the combined EXCEL file of all exported \
+            documents. No summary is written if omitted. Defaults to None.
+    """
+    # pylint: disable=C0415
+    from pytia.log import log
+    from worker.batch import BatchExporter
+    from worker.batch import PytiaDocumentBackend
+    from worker.batch import read_manifest
+
+    # pylint: enable=C0415
+
+    items = read_manifest(manifest)
+    with timer.span("Batch export"):
+        results = BatchExporter(backend=PytiaDocumentBackend()).run(
+            items=items,
+            report_path=report or manifest.with_suffix(".report.json"),
+            summary_path=summary,
+        )
+    failed = [r for r in results if r.status != "ok"]
+    log.info(f"Batch export done: {len(results) - len(failed)}/{len(results)} ok.")
+    log.info(timer.format_report())
+    timer.dump()
+
+
 if __name__ == "__main__":
     main()
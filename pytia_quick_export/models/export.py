@@ -0,0 +1,43 @@
+"""
+    Export data models.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import List
+from typing import Literal
+from typing import Optional
+
+
+@dataclass(slots=True, kw_only=True)
+class ExportOptions:
+    """Dataclass for the user input of an export (from the UI or a batch manifest)."""
+
+    project: str  # The project number, or KEEP to use the project of the document
+    condition: str
+    quantity: int | str
+    note: str = ""
+    mail: str = ""
+    folder: str = ""
+
+
+@dataclass(slots=True, kw_only=True)
+class BatchItem(ExportOptions):
+    """Dataclass for a document of a batch manifest."""
+
+    path: Path
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+
+
+@dataclass(slots=True, kw_only=True)
+class BatchResult:
+    """Dataclass for the result of a batch item."""
+
+    path: str
+    status: Literal["ok", "failed", "skipped"]
+    duration: float = 0
+    error: Optional[str] = None
+    files: List[str] = field(default_factory=lambda: [])
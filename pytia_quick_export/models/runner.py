@@ -2,8 +2,17 @@
     RUNNER data models.
 """
 
+from concurrent.futures import Future
+from dataclasses import asdict
 from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Literal
+from typing import Optional
 
 
 @dataclass
@@ -11,3 +20,100 @@ class RunnerModel:
     func: Callable
     kwargs: dict
     name: str
+    requires: List[str] = field(default_factory=lambda: [])
+    com: bool = True
+    outputs: List[Path] = field(default_factory=lambda: [])
+
+
+@dataclass(slots=True, kw_only=True)
+class TaskMetrics:
+    """
+    Metrics of a single task execution. The timestamps are unix timestamps, the duration is
+    measured with the performance counter.
+
+    Status:
+        - running: The task has been started, but hasn't finished yet.
+        - ok, failed: The task has finished (`error` for failed).
+        - cancelled: The task has been started, but was discarded before it ran.
+    """
+
+    name: str
+    com: bool
+    started: float
+    finished: Optional[float] = None
+    duration: float = 0.0
+    status: Literal["running", "ok", "failed", "cancelled"] = "running"
+    error: Optional[str] = None
+    artifacts: Dict[str, int] = field(default_factory=dict)  # File name: Size in bytes
+    counters: Dict[str, int] = field(default_factory=dict)  # Counted by the task itself
+
+
+@dataclass(slots=True, kw_only=True)
+class RunMetrics:
+    """Aggregated metrics of all tasks of a run."""
+
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    duration: float = 0.0
+    status: Literal["pending", "running", "done", "failed", "cancelled"] = "pending"
+    tasks: List[TaskMetrics] = field(default_factory=list)
+
+    @property
+    def artifacts_size(self) -> int:
+        """The size of all output artifacts of the run in bytes."""
+        return sum(sum(t.artifacts.values()) for t in self.tasks)
+
+    @property
+    def throughput(self) -> float:
+        """The size of all output artifacts per second of the run in bytes."""
+        return self.artifacts_size / self.duration if self.duration else 0.0
+
+    @property
+    def slowest(self) -> Optional[TaskMetrics]:
+        """The task with the longest duration."""
+        return max(self.tasks, key=lambda t: t.duration, default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the metrics as dict, including the aggregated values."""
+        return {
+            **asdict(self),
+            "artifacts_size": self.artifacts_size,
+            "throughput": round(self.throughput, 3),
+            "slowest": self.slowest.name if self.slowest else None,
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class RunnerEvent:
+    """
+    Event posted by the runner when it runs in the background.
+
+    Kinds:
+        - started, finished: A task has been started or finished (`name`).
+        - progress: The overall progress has changed (`value` from 0 to 100).
+        - log: An info message for the user (`message`).
+        - call: A COM-bound task that must be executed on the consuming thread (`task`, `future`).
+        - done, failed, cancelled: The runner has stopped (`exception` for failed).
+    """
+
+    kind: Literal[
+        "started",
+        "finished",
+        "progress",
+        "log",
+        "call",
+        "done",
+        "failed",
+        "cancelled",
+    ]
+    name: Optional[str] = None
+    message: Optional[str] = None
+    value: Optional[float] = None
+    task: Optional[RunnerModel] = None
+    future: Optional[Future] = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def is_final(self) -> bool:
+        """Returns whether this is the last event of a run."""
+        return self.kind in ("done", "failed", "cancelled")
@@ -15,25 +15,25 @@ from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
 from pathlib import Path
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Tuple
 
+from bundle import CONFIG_RESOURCES
+from bundle import load_bundle
 from const import APP_VERSION
 from const import APPDATA
 from const import CONFIG_APPDATA
+from const import CONFIG_BUNDLE
 from const import CONFIG_DOCKET
-from const import CONFIG_EXCEL
-from const import CONFIG_EXCEL_DEFAULT
-from const import CONFIG_KEYWORDS
-from const import CONFIG_PROPS
-from const import CONFIG_PROPS_DEFAULT
-from const import CONFIG_RPS
-from const import CONFIG_SETTINGS
 from const import CONFIG_USERS
 from const import LOGON
 from const import STYLES
 from resources.utils import expand_env_vars
+from timing import timer
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -55,6 +55,17 @@ class SettingsExport:
     lock_drawing_views: bool
     enable_rps: bool
     close_app_after: bool
+    show_metrics: bool = False
+    drawing_formats: List[Literal["pdf", "dxf", "dwg", "svg"]] = field(
+        default_factory=lambda: ["pdf", "dxf"]
+    )
+
+    def __post_init__(self) -> None:
+        for export_format in self.drawing_formats:
+            if export_format not in ("pdf", "dxf", "dwg", "svg"):
+                raise ValueError(
+                    f"The drawing export format {export_format!r} is not supported."
+                )
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -234,6 +245,68 @@ class Keywords:
         self.de = KeywordElements(**dict(self.de))  # type: ignore
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class HeaderItem:
+    """
+    Dataclass for a compiled header item of the excel.json (see DEFAULT_FILES.md).
+
+    Kinds:
+        - text: Fixed text (`NAME=TEXT`), the value is the text.
+        - keyword: CATIA or app property (`NAME:$KEYWORD`), the value is the keyword with `$`.
+        - property: User property (`NAME:PROPERTY`), the value is the property name.
+        - placeholder: Empty column (`NAME`), the value is an empty string.
+    """
+
+    index: int
+    kind: Literal["text", "keyword", "property", "placeholder"]
+    value: str
+    names: Dict[str, str]
+
+    def column_name(self, language: Literal["en", "de"]) -> str:
+        """Returns the column name for the given CATIA UI language."""
+        return self.names[language]
+
+
+def compile_header_items(
+    header_items: List[str], keywords: Keywords
+) -> Tuple[HeaderItem, ...]:
+    """
+    Compiles the header items from the excel.json into header item dataclasses. Column names of
+    keyword items are translated for every language.
+
+    Args:
+        header_items (List[str]): The header items as stated in the excel.json.
+        keywords (Keywords): The keywords dataclass.
+
+    Returns:
+        Tuple[HeaderItem, ...]: The compiled header items in the order of the config.
+    """
+    languages = {"en": asdict(keywords.en), "de": asdict(keywords.de)}
+    plan: List[HeaderItem] = []
+
+    for index, header_item in enumerate(header_items):
+        if "=" in header_item:
+            name, value = header_item.split("=", 1)
+            kind = "text"
+        elif ":" in header_item:
+            name, value = header_item.split(":", 1)
+            kind = "keyword" if value.startswith("$") else "property"
+        else:
+            name, value = header_item, ""
+            kind = "placeholder"
+
+        names = {lang: name for lang in languages}
+        if kind == "keyword":
+            kw_key = value.split("$")[1]
+            for lang, elements in languages.items():
+                if kw_key in elements:
+                    names[lang] = elements[kw_key]
+
+        plan.append(HeaderItem(index=index, kind=kind, value=value, names=names))  # type: ignore
+
+    return tuple(plan)
+
+
 @dataclass(slots=True, kw_only=True)
 class EXCEL:
     """Excel dataclass."""
@@ -250,6 +323,28 @@ class EXCEL:
     data_bg_color_1: str
     data_color_2: str
     data_bg_color_2: str
+    formats: List[Literal["xlsx", "csv", "tsv"]] = field(
+        default_factory=lambda: ["xlsx"]
+    )
+    encoding: str = "utf-8"
+    plan_made: Tuple[HeaderItem, ...] = field(init=False, default=())
+    plan_bought: Tuple[HeaderItem, ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        for export_format in self.formats:
+            if export_format not in ("xlsx", "csv", "tsv"):
+                raise ValueError(
+                    f"The export format {export_format!r} is not supported."
+                )
+
+    def compile(self, keywords: Keywords) -> None:
+        """Compiles the header items of made and bought items into header item plans."""
+        self.plan_made = compile_header_items(self.header_items_made, keywords)
+        self.plan_bought = compile_header_items(self.header_items_bought, keywords)
+
+    def get_plan(self, source: int) -> Tuple[HeaderItem, ...]:
+        """Returns the compiled header items for the source (1=Made, 2=Bought)."""
+        return self.plan_made if source == 1 else self.plan_bought
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -317,110 +412,255 @@ class AppData:
 
 
 class Resources:  # pylint: disable=R0902
-    """Class for handling resource files."""
-
-    def __init__(self) -> None:
-        self._read_settings()
-        self._read_rps()
-        self._read_users()
-        self._read_keywords()
-        self._read_excel()
-        self._read_docket()
-        self._read_props()
-        self._read_appdata()
+    """
+    Class for handling resource files. Each config file is read on the first access of its
+    property and memoized afterwards.
+    """
+
+    def __init__(
+        self, use_bundle: bool = True, configs: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Inits the class.
 
-        atexit.register(self.write_appdata)
+        Args:
+            use_bundle (bool, optional): Whether to read the configs from the pre-parsed config \
+                bundle, if there is one. Defaults to True.
+            configs (Optional[Dict[str, Any]], optional): The parsed config files by their name \
+                (see `bundle.read_configs`). Used instead of the config bundle, configs that \
+                aren't given are read from their json files. Defaults to None.
+        """
+        self._settings: Optional[Settings] = None
+        self._rps: Optional[Rps] = None
+        self._users: Optional[List[User]] = None
+        self._users_by_logon: Dict[str, User] = {}
+        self._users_by_name: Dict[str, User] = {}
+        self._users_hash: Optional[int] = None
+        self._use_bundle = use_bundle
+        self._bundle: Optional[Dict[str, Any]] = configs
+        self._keywords: Optional[Keywords] = None
+        self._excel: Optional[EXCEL] = None
+        self._docket: Optional[dict] = None
+        self._props: Optional[Props] = None
+        self._appdata: Optional[AppData] = None
 
     @property
     def settings(self) -> Settings:
         """settings.json"""
-        return self._settings
+        if self._settings is None:
+            with timer.span("Resource settings"):
+                self._read_settings()
+        return self._settings  # type: ignore
 
     @property
     def rps(self) -> Rps:
         """rps.json"""
-        return self._rps
+        if self._rps is None:
+            with timer.span("Resource rps"):
+                self._read_rps()
+        return self._rps  # type: ignore
 
     @property
     def keywords(self) -> Keywords:
         """keywords.json"""
-        return self._keywords
+        if self._keywords is None:
+            with timer.span("Resource keywords"):
+                self._read_keywords()
+        return self._keywords  # type: ignore
 
     @property
     def props(self) -> Props:
         """properties.json"""
-        return self._props
+        if self._props is None:
+            with timer.span("Resource props"):
+                self._read_props()
+        return self._props  # type: ignore
 
     @property
     def excel(self) -> EXCEL:
         """excel.json"""
-        return self._excel
+        if self._excel is None:
+            with timer.span("Resource excel"):
+                self._read_excel()
+        return self._excel  # type: ignore
 
     @property
     def users(self) -> List[User]:
         """users.json"""
-        return self._users
+        if self._users is None:
+            with timer.span("Resource users"):
+                self._read_users()
+        return self._users  # type: ignore
 
     @property
     def docket(self) -> dict:
         """docket.json"""
-        return self._docket
+        if self._docket is None:
+            with timer.span("Resource docket"):
+                self._read_docket()
+        return self._docket  # type: ignore
 
     @property
     def appdata(self) -> AppData:
         """Property for the appdata config file."""
-        return self._appdata
+        if self._appdata is None:
+            with timer.span("Resource appdata"):
+                self._read_appdata()
+        return self._appdata  # type: ignore
 
     def get_png(self, name: str) -> bytes:
         """Returns a png resource by its name."""
         with importlib.resources.open_binary("resources", name) as f:
             return f.read()
 
+    def _read_bundle(self) -> Dict[str, Any]:
+        """
+        Reads the pre-parsed config bundle, which is created when the app is built. Returns an
+        empty dict if the bundle doesn't exist or is stale, in that case all configs are read
+        from their json files.
+        """
+        if self._bundle is None:
+            self._bundle = {}
+            if self._use_bundle and importlib.resources.is_resource(
+                "resources", CONFIG_BUNDLE
+            ):
+                with timer.span("Resource bundle"):
+                    with importlib.resources.open_binary(
+                        "resources", CONFIG_BUNDLE
+                    ) as f:
+                        try:
+                            self._bundle = load_bundle(f.read())
+                        except ValueError:
+                            self._bundle = {}
+        return self._bundle
+
+    def _read_config(self, name: str) -> Any:
+        """
+        Returns the parsed content of a config file. Uses the config bundle if available, reads
+        the first existing json file of the config otherwise.
+
+        Args:
+            name (str): The name of the config (key of CONFIG_RESOURCES).
+
+        Returns:
+            Any: The parsed content of the config file.
+        """
+        if name in (bundle := self._read_bundle()):
+            return bundle[name]
+
+        *preferred, fallback = CONFIG_RESOURCES[name]
+        config_resource = next(
+            (r for r in preferred if importlib.resources.is_resource("resources", r)),
+            fallback,
+        )
+        with importlib.resources.open_binary("resources", config_resource) as f:
+            content = f.read()
+        if name == "users":
+            self._users_hash = hash(content)
+        return json.loads(content)
+
+    def validate(self) -> None:
+        """
+        Reads all configs into their dataclasses, the docket config into the `DocketConfig` of
+        pytia. Used by the build script, so a config that doesn't match its dataclass fails the
+        build instead of the app.
+
+        Raises:
+            Exception: Raised if a config doesn't match its dataclass, e.g. a TypeError for an \
+                unknown or missing key.
+        """
+        for name in ("settings", "rps", "keywords", "users", "props", "excel"):
+            getattr(self, name)
+
+        if self.docket_exists():
+            # pylint: disable=C0415
+            from pytia.utilities.docket import DocketConfig
+
+            # pylint: enable=C0415
+
+            DocketConfig.from_dict(self.docket)
+
     def _read_settings(self) -> None:
         """Reads the settings json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_SETTINGS) as f:
-            self._settings = Settings(**json.load(f))
+        self._settings = Settings(**self._read_config("settings"))
 
     def _read_rps(self) -> None:
         """Reads the rps json from the resources folder."""
-        if self._settings.export.enable_rps:
-            with importlib.resources.open_binary("resources", CONFIG_RPS) as f:
-                self._rps = Rps(**json.load(f))
+        if self.settings.export.enable_rps:
+            self._rps = Rps(**self._read_config("rps"))
 
     def _read_keywords(self) -> None:
         """Reads the keywords json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_KEYWORDS) as f:
-            self._keywords = Keywords(**json.load(f))
+        self._keywords = Keywords(**self._read_config("keywords"))
 
     def _read_users(self) -> None:
         """Reads the users json from the resources folder."""
+        self._index_users([User(**i) for i in self._read_config("users")])
+
+    def _index_users(self, users: List[User]) -> None:
+        """
+        Sets the users and builds the logon and name indexes. If a logon or name exists more
+        than once, the first user wins (same as a search through the list).
+
+        The indexes are built first and the users are set last: The users are the marker of the
+        lazy properties, other threads must not see them before the indexes are complete.
+        """
+        users_by_logon: Dict[str, User] = {}
+        users_by_name: Dict[str, User] = {}
+        for user in users:
+            users_by_logon.setdefault(user.logon, user)
+            users_by_name.setdefault(user.name, user)
+        self._users_by_logon = users_by_logon
+        self._users_by_name = users_by_name
+        self._users = users
+
+    @property
+    def _logon_index(self) -> Dict[str, User]:
+        """The users indexed by their logon name."""
+        if self._users is None:
+            with timer.span("Resource users"):
+                self._read_users()
+        return self._users_by_logon
+
+    @property
+    def _name_index(self) -> Dict[str, User]:
+        """The users indexed by their name."""
+        if self._users is None:
+            with timer.span("Resource users"):
+                self._read_users()
+        return self._users_by_name
+
+    def refresh_users(self) -> bool:
+        """
+        Reads the users json again and rebuilds the user indexes, if the file has changed since
+        it was last read. Always reloads the users if they have been read from the config bundle.
+
+        Returns:
+            bool: True if the users have been reloaded.
+        """
         with importlib.resources.open_binary("resources", CONFIG_USERS) as f:
-            self._users = [User(**i) for i in json.load(f)]
+            content = f.read()
+        if hash(content) == self._users_hash:
+            return False
+
+        self._users_hash = hash(content)
+        self._index_users([User(**i) for i in json.loads(content)])
+        return True
 
     def _read_docket(self) -> None:
         """Reads the docket json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_DOCKET) as f:
-            self._docket = json.load(f)
+        self._docket = self._read_config("docket")
 
     def _read_props(self) -> None:
         """Reads the props json from the resources folder."""
-        props_resource = (
-            CONFIG_PROPS
-            if importlib.resources.is_resource("resources", CONFIG_PROPS)
-            else CONFIG_PROPS_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", props_resource) as f:
-            self._props = Props(**json.load(f))
+        self._props = Props(**self._read_config("props"))
 
     def _read_excel(self) -> None:
         """Reads the excel json from the resources folder."""
-        excel_resource = (
-            CONFIG_EXCEL
-            if importlib.resources.is_resource("resources", CONFIG_EXCEL)
-            else CONFIG_EXCEL_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", excel_resource) as f:
-            self._excel = EXCEL(**json.load(f))
+        excel = EXCEL(**self._read_config("excel"))
+        excel.compile(self.keywords)
+        # Set after compiling, other threads must not see a half initialized excel config.
+        self._excel = excel
 
     def _read_appdata(self) -> None:
         """Reads the json config file from the appdata folder."""
@@ -439,11 +679,15 @@ class Resources:  # pylint: disable=R0902
         else:
             self._appdata = AppData()
 
+        # The appdata is only written if it has been used, e.g. not by the build script.
+        atexit.register(self.write_appdata)
+
     def write_appdata(self) -> None:
         """Saves appdata config to file."""
+        appdata = asdict(self.appdata)
         os.makedirs(APPDATA, exist_ok=True)
         with open(f"{APPDATA}\\{CONFIG_APPDATA}", "w", encoding="utf8") as f:
-            json.dump(asdict(self._appdata), f)
+            json.dump(appdata, f)
 
     def get_user_by_logon(self, logon: Optional[str] = None) -> User:
         """
@@ -462,9 +706,8 @@ class Resources:  # pylint: disable=R0902
         if logon is None:
             logon = LOGON
 
-        for index, value in enumerate(self._users):
-            if value.logon == logon:
-                return self._users[index]
+        if (user := self._logon_index.get(logon)) is not None:
+            return user
         raise ValueError(f"The user {logon} does not exist.")
 
     def get_user_by_name(self, name: str) -> Optional[User]:
@@ -477,10 +720,7 @@ class Resources:  # pylint: disable=R0902
         Returns:
             User: The user from the dataclass list that matches the provided name.
         """
-        for index, value in enumerate(self._users):
-            if value.name == name:
-                return self._users[index]
-        return None
+        return self._name_index.get(name)
 
     def logon_exists(self, logon: Optional[str] = None) -> bool:
         """
@@ -496,10 +736,19 @@ class Resources:  # pylint: disable=R0902
         if logon is None:
             logon = LOGON
 
-        for user in self._users:
-            if user.logon == logon:
-                return True
-        return False
+        return logon in self._logon_index
+
+    def docket_exists(self) -> bool:
+        """
+        Returns whether the docket config exists, either in the config bundle or as json file.
+
+        Returns:
+            bool: True if the docket config exists.
+        """
+        return self._docket is not None or bool(
+            "docket" in self._read_bundle()
+            or importlib.resources.is_resource("resources", CONFIG_DOCKET)
+        )
 
 
 resource = Resources()
@@ -3,19 +3,28 @@
     Provides template files from the templates-folder.
 """
 
+import hashlib
 import importlib.resources
+import json
 import os
+import shutil
+import time
 import zipfile
 from pathlib import Path
 from typing import Optional
 
+from const import PID
 from const import PYTIA_QUICK_EXPORT
 from const import TEMP
 from const import TEMP_TEMPLATES
 from const import TEMPLATE_DOCKET
 from const import TEMPLATE_MAIL
-from pytia_ui_tools.utils.files import file_utility
+from pytia.log import log
 from resources import resource
+from timing import timer
+
+CACHE_MANIFEST = "manifest.json"
+CACHE_MAX_AGE = 24 * 60 * 60  # Unused cache folders are removed after one day
 
 
 class Templates:
@@ -25,50 +34,133 @@ class Templates:
 
     def __init__(self) -> None:
         """
-        Inits the class. Extracts the templates files from the zipped app and copies them into
-        the temp-folder (TEMP\\pytia_bill_of_material\\templates\\). Deletes templates from the
-        temp-folder at application exit.
+        Inits the class. Extracts the templates files from the zipped app into a cache folder
+        in the temp-folder (TEMP\\pytia_quick_export\\templates\\KEY\\). The key is derived from the
+        size and modification time of the zipped app, so the templates are only extracted again
+        when a new version of the app is released. The cache folder is kept at application exit.
 
         Warning: If the app mode is set to DEBUG, all templates will be used from the apps
         templates folder, not from the zipped app.
         """
         self.tempfolder = Path(TEMP, PYTIA_QUICK_EXPORT)
-        self.temp_docket_path = Path(TEMP_TEMPLATES, TEMPLATE_DOCKET)
-        self.temp_mail_path = Path(TEMP_TEMPLATES, TEMPLATE_MAIL)
+        self.cache_folder: Optional[Path] = None
 
         self._docket_path = None
+        self._mail_path = None
 
         if not resource.settings.debug:
-            self._make_tempfolder()
-            self._extract()
+            with timer.span("Templates"):
+                self.cache_folder = self._get_cache_folder()
 
         self._get_docket_path()
         self._get_mail_path()
 
-    def _make_tempfolder(self) -> None:
-        """Creates the temp-folder for the templates. Deletes existing templates."""
-        if os.path.exists(self.temp_docket_path):
-            os.remove(self.temp_docket_path)
-        os.makedirs(self.tempfolder, exist_ok=True)
+    @property
+    def app_path(self) -> Path:
+        """The path to the zipped app in the release folder."""
+        return Path(resource.settings.paths.release, resource.settings.files.app)
+
+    @property
+    def temp_docket_path(self) -> Optional[Path]:
+        """The path to the cached docket template."""
+        return Path(self.cache_folder, TEMPLATE_DOCKET) if self.cache_folder else None
+
+    @property
+    def temp_mail_path(self) -> Optional[Path]:
+        """The path to the cached mail template."""
+        return Path(self.cache_folder, TEMPLATE_MAIL) if self.cache_folder else None
+
+    @staticmethod
+    def get_cache_key(app_path: Path) -> str:
+        """
+        Returns the cache key of the zipped app. Only the file stats are used, which avoids
+        reading the app from the release folder (network share) on every start.
+
+        Args:
+            app_path (Path): The path to the zipped app.
+
+        Returns:
+            str: The cache key.
+        """
+        stat = os.stat(app_path)
+        value = f"{app_path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha256(value.encode("utf8")).hexdigest()[:16]
+
+    def _get_cache_folder(self) -> Optional[Path]:
+        """
+        Returns the cache folder of the current app release. Extracts the templates if they
+        aren't cached yet. Returns None if the templates cannot be provided.
+        """
+        try:
+            key = self.get_cache_key(self.app_path)
+        except OSError as e:
+            log.warning(f"Cannot access the app for extracting the templates: {e}")
+            return None
+
+        cache_folder = Path(TEMP_TEMPLATES, key)
+        if os.path.exists(Path(cache_folder, CACHE_MANIFEST)):
+            log.debug(f"Using cached templates from {str(cache_folder)!r}.")
+            os.utime(cache_folder)
+        else:
+            try:
+                self._extract(key=key, cache_folder=cache_folder)
+            except Exception as e:  # pylint: disable=W0718
+                log.warning(f"Failed extracting templates: {e}")
+                return None
+
+        self._remove_unused_caches(key=key)
+        return cache_folder
+
+    def _extract(self, key: str, cache_folder: Path) -> None:
+        """
+        Extracts the templates from the zipped app into the cache folder. The templates are
+        extracted into a folder unique to this process first, which is then renamed to the cache
+        folder. This way other instances of the app never see a partially extracted cache, if
+        several instances are launched at the same time.
+        """
+        staging_folder = Path(TEMP_TEMPLATES, f"{key}.{PID}.tmp")
+        shutil.rmtree(staging_folder, ignore_errors=True)
+        os.makedirs(staging_folder)
 
-    def _extract(self) -> None:
-        """Extracts the templates from the zipped app."""
         try:
-            with zipfile.ZipFile(
-                Path(resource.settings.paths.release, resource.settings.files.app), "r"
-            ) as zfile:
-                zfile.extract(
-                    member=f"templates/{TEMPLATE_DOCKET}", path=self.tempfolder
-                )
-                zfile.extract(member=f"templates/{TEMPLATE_MAIL}", path=self.tempfolder)
-            file_utility.add_delete(
-                path=self.temp_docket_path, skip_silent=True, at_exit=True
-            )
-            file_utility.add_delete(
-                path=self.temp_mail_path, skip_silent=True, at_exit=True
-            )
-        except:
-            pass
+            manifest = {"key": key, "app": str(self.app_path), "crc": {}}
+            with zipfile.ZipFile(self.app_path, "r") as zfile:
+                for template in (TEMPLATE_DOCKET, TEMPLATE_MAIL):
+                    member = zfile.getinfo(f"templates/{template}")
+                    with zfile.open(member) as src, open(
+                        Path(staging_folder, template), "wb"
+                    ) as dst:
+                        shutil.copyfileobj(src, dst)
+                    manifest["crc"][template] = member.CRC
+
+            with open(Path(staging_folder, CACHE_MANIFEST), "w", encoding="utf8") as f:
+                json.dump(manifest, f)
+
+            os.rename(staging_folder, cache_folder)
+            log.info(f"Extracted templates into {str(cache_folder)!r}.")
+        except OSError:
+            # Another instance may have created the cache folder in the meantime.
+            if not os.path.exists(Path(cache_folder, CACHE_MANIFEST)):
+                raise
+            log.debug("Templates have been extracted by another instance.")
+        finally:
+            shutil.rmtree(staging_folder, ignore_errors=True)
+
+    @staticmethod
+    def _remove_unused_caches(key: str) -> None:
+        """
+        Removes cache folders of other releases, which haven't been used for a day. Folders that
+        are still in use by another instance (locked files) are skipped.
+        """
+        now = time.time()
+        for item in os.listdir(TEMP_TEMPLATES):
+            path = Path(TEMP_TEMPLATES, item)
+            if (
+                item != key
+                and path.is_dir()
+                and now - os.path.getmtime(path) > CACHE_MAX_AGE
+            ):
+                shutil.rmtree(path, ignore_errors=True)
 
     @property
     def docket_path(self) -> Optional[Path]:
@@ -90,7 +182,9 @@ class Templates:
 
         else:
             self._docket_path = (
-                self.temp_docket_path if os.path.exists(self.temp_docket_path) else None
+                self.temp_docket_path
+                if self.temp_docket_path and os.path.exists(self.temp_docket_path)
+                else None
             )
 
     def _get_mail_path(self) -> None:
@@ -103,7 +197,9 @@ class Templates:
 
         else:
             self._mail_path = (
-                self.temp_mail_path if os.path.exists(self.temp_mail_path) else None
+                self.temp_mail_path
+                if self.temp_mail_path and os.path.exists(self.temp_mail_path)
+                else None
             )
 
 
@@ -0,0 +1,144 @@
+"""
+    Timing of the startup phases of the app.
+
+    Important: Do not import third party modules here. This module is used before the
+    dependencies are checked, and by the resources module.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from const import APP_VERSION
+from const import LOG_TIMING
+from const import LOGS
+from const import PID
+
+
+@dataclass(slots=True, kw_only=True)
+class Span:
+    """Dataclass for a named and timed phase."""
+
+    name: str
+    start: float  # Seconds since the timer has been started
+    duration: float = 0.0
+    depth: int = 0
+    error: Optional[str] = None
+
+
+class Timer:
+    """
+    Records named phases (spans) of the app. Spans can be nested, a nested span is reported
+    with the depth of its parent plus one. Spans can be recorded from any thread.
+    """
+
+    def __init__(self) -> None:
+        """Inits the timer. The time of all spans is relative to the instantiation."""
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self.json_path: Optional[Path] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """The time in seconds since the timer has been started."""
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """
+        Records the duration of the context as span. The span is recorded even if the context
+        raises an exception, the exception is stored in the span and re-raised.
+
+        Args:
+            name (str): The name of the phase.
+
+        Yields:
+            Span: The span, its duration is set when the context is left.
+        """
+        depth = getattr(self._local, "depth", 0)
+        span = Span(name=name, start=self.elapsed, depth=depth)
+        with self._lock:
+            self.spans.append(span)
+
+        self._local.depth = depth + 1
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = self.elapsed - span.start
+            self._local.depth = depth
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns the timing report.
+
+        Returns:
+            Dict[str, Any]: The report with all spans recorded so far.
+        """
+        with self._lock:
+            spans = [asdict(s) for s in self.spans]
+        return {
+            "version": APP_VERSION,
+            "pid": PID,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed": round(self.elapsed, 6),
+            "spans": [
+                {
+                    **s,
+                    "start": round(s["start"], 6),
+                    "duration": round(s["duration"], 6),
+                }
+                for s in spans
+            ],
+        }
+
+    def format_report(self) -> str:
+        """
+        Returns the timing report as human readable text, one line per span.
+
+        Returns:
+            str: The formatted report.
+        """
+        report = self.report()
+        lines = [f"Timing report ({report['elapsed']:.4f}s elapsed):"]
+        for span in report["spans"]:
+            name = "  " * span["depth"] + span["name"]
+            error = f" ({span['error']})" if span["error"] else ""
+            lines.append(f"  {name:<40} {span['duration']:.4f}s{error}")
+        return "\n".join(lines)
+
+    def dump(self) -> List[Path]:
+        """
+        Writes the timing report as json into the log folder, and into the json path of the
+        timer (if set).
+
+        Returns:
+            List[Path]: The paths of the written reports.
+        """
+        report = self.report()
+        paths = [Path(LOGS, LOG_TIMING)]
+        if self.json_path is not None:
+            paths.append(self.json_path)
+
+        for path in paths:
+            os.makedirs(path.parent, exist_ok=True)
+            with open(path, "w", encoding="utf8") as f:
+                json.dump(report, f, indent=4)
+        return paths
+
+
+timer = Timer()
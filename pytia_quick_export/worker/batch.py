@@ -0,0 +1,330 @@
+"""
+    Headless batch export of several documents, driven by a manifest.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Literal
+from typing import Optional
+from typing import Protocol
+
+from helper.language import LanguageCache
+from helper.snapshot import SnapshotDocument
+from helper.snapshot import take_snapshot
+from models.data import DataModel
+from models.export import BatchItem
+from models.export import BatchResult
+from pytia.exceptions import PytiaValueError
+from pytia.log import log
+from resources import resource
+
+from .docket import DocketRenderer
+from .docket import DocketSession
+from .docket import PytiaDocketRenderer
+from .metrics import write_metrics
+from .pipeline import ExportPipeline
+from .runner import Runner
+
+
+class DocumentBackend(Protocol):
+    """
+    The interface that provides the documents of a batch. Implemented by the pytia backend for
+    CATIA documents, and by any in-memory fake backend.
+    """
+
+    def open(self, path: Path) -> ContextManager[SnapshotDocument]:
+        """Opens the document and closes it when the context is left."""
+        ...
+
+
+class PytiaDocumentBackend:
+    """Opens the documents of a batch in the running CATIA instance."""
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[SnapshotDocument]:
+        """
+        Opens the part or product in CATIA and closes it when the context is left.
+
+        Args:
+            path (Path): The path to the CATPart or CATProduct.
+
+        Raises:
+            PytiaValueError: Raised if the file is neither a part nor a product.
+
+        Yields:
+            SnapshotDocument: The opened document.
+        """
+        # pylint: disable=C0415
+        if path.suffix.lower() == ".catpart":
+            from pytia.wrapper.documents.part_documents import PyPartDocument
+
+            document_class = PyPartDocument
+        elif path.suffix.lower() == ".catproduct":
+            from pytia.wrapper.documents.product_documents import PyProductDocument
+
+            document_class = PyProductDocument
+        else:
+            raise PytiaValueError(
+                f"The file {path.name!r} is neither a part nor a product."
+            )
+        # pylint: enable=C0415
+
+        with document_class(strict_naming=False) as document:
+            document.open(path)
+            yield document  # type: ignore
+
+
+def read_manifest(path: Path) -> List[BatchItem]:
+    """
+    Reads the batch manifest. The manifest is a json file with a list of documents. Values set
+    on the top level are used as defaults for all items:
+
+        {
+            "folder": "C:\\\\export",
+            "items": [
+                {"path": "C:\\\\parts\\\\A.CATPart", "project": "P1", "condition": "New", \
+"quantity": 1}
+            ]
+        }
+
+    Args:
+        path (Path): The path to the manifest file.
+
+    Raises:
+        PytiaValueError: Raised if the manifest is not valid.
+
+    Returns:
+        List[BatchItem]: The items of the batch.
+    """
+    with open(path, "r", encoding="utf8") as f:
+        manifest = json.load(f)
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("items"), list):
+        raise PytiaValueError(f"The batch manifest {str(path)!r} has no list of items.")
+
+    defaults = {k: v for k, v in manifest.items() if k != "items"}
+    items = []
+    for index, item in enumerate(manifest["items"]):
+        try:
+            items.append(BatchItem(**{**defaults, **item}))
+        except TypeError as e:
+            raise PytiaValueError(
+                f"Item {index} of the batch manifest is not valid: {e}"
+            ) from e
+    return items
+
+
+class BatchSummary:
+    """
+    Collects the data of the exported items of a batch into combined EXCEL files, one row per
+    item. Made and bought items have different columns, hence each source is written into its
+    own file, e.g. `summary_made.xlsx` and `summary_bought.xlsx`. The rows are streamed, the
+    memory usage doesn't depend on the number of items.
+    """
+
+    def __init__(self, path: Path, title: str = "Batch") -> None:
+        """
+        Inits the summary.
+
+        Args:
+            path (Path): The path of the summary, the source is appended to the file name.
+            title (str, optional): The title of the worksheets. Defaults to "Batch".
+        """
+        self.path = path
+        self.title = title
+        self._writers: Dict[str, Any] = {}
+
+    def add(self, source: Literal["made", "bought"], data: DataModel) -> None:
+        """
+        Adds the data of an item as row to the summary of its source.
+
+        Args:
+            source (Literal["made", "bought"]): The source of the item.
+            data (DataModel): The data of the item.
+        """
+        if source not in self._writers:
+            # pylint: disable=C0415
+            from .excel import ExcelStreamWriter
+
+            # pylint: enable=C0415
+
+            self._writers[source] = ExcelStreamWriter(
+                path=self.path.with_stem(f"{self.path.stem}_{source}"),
+                title=self.title,
+            )
+        self._writers[source].add(data)
+
+    def save(self) -> List[Path]:
+        """
+        Saves the summary of each source that has at least one row.
+
+        Returns:
+            List[Path]: The paths of the saved summaries.
+        """
+        for writer in self._writers.values():
+            writer.save()
+            log.info(
+                f"Wrote batch summary with {writer.rows} rows to {str(writer.path)!r}."
+            )
+        return [writer.path for writer in self._writers.values()]
+
+
+class BatchExporter:
+    """
+    Exports the documents of a batch one after another, without any UI. The resources, the
+    templates, the detected UI language, the Outlook connection and the docket session are shared
+    by all items.
+    """
+
+    def __init__(
+        self,
+        backend: DocumentBackend,
+        outlook: Optional[Any] = None,
+        docket_renderer: Optional[DocketRenderer] = None,
+    ) -> None:
+        """
+        Inits the batch exporter.
+
+        Args:
+            backend (DocumentBackend): The backend that opens the documents.
+            outlook (Optional[Any], optional): An existing connection to Outlook. Connects to \
+                Outlook once for all items that send a mail if omitted. Defaults to None.
+            docket_renderer (Optional[DocketRenderer], optional): The renderer of the dockets. \
+                Defaults to the pytia renderer.
+        """
+        self.backend = backend
+        self.outlook = outlook
+        self.docket_session = DocketSession(
+            renderer=docket_renderer or PytiaDocketRenderer()
+        )
+        self._language_cache = LanguageCache()
+
+    def run(
+        self,
+        items: List[BatchItem],
+        report_path: Optional[Path] = None,
+        summary_path: Optional[Path] = None,
+    ) -> List[BatchResult]:
+        """
+        Exports all items. A failing item doesn't stop the batch, its error is written to the
+        result of the item.
+
+        Args:
+            items (List[BatchItem]): The items to export.
+            report_path (Optional[Path], optional): The path to which the results are written \
+                as json. Defaults to None.
+            summary_path (Optional[Path], optional): The path of the combined EXCEL file, one \
+                row per exported item (see `BatchSummary`). Defaults to None.
+
+        Returns:
+            List[BatchResult]: The result of each item, in the order of the items.
+        """
+        results: List[BatchResult] = []
+        summary = BatchSummary(path=summary_path) if summary_path else None
+        with self.docket_session:
+            for index, item in enumerate(items):
+                log.info(f"Batch export {index + 1}/{len(items)}: {str(item.path)!r}.")
+                start_time = time.perf_counter()
+                try:
+                    result = self._export(index=index, item=item, summary=summary)
+                except Exception as e:  # pylint: disable=W0718
+                    log.error(f"Batch export of {str(item.path)!r} failed: {e}")
+                    result = BatchResult(
+                        path=str(item.path), status="failed", error=str(e)
+                    )
+                result.duration = round(time.perf_counter() - start_time, 3)
+                results.append(result)
+
+        if summary is not None:
+            summary.save()
+
+        if report_path is not None:
+            with open(report_path, "w", encoding="utf8") as f:
+                json.dump([asdict(r) for r in results], f, indent=4)
+            log.info(f"Wrote batch report to {str(report_path)!r}.")
+
+        return results
+
+    def _export(
+        self, index: int, item: BatchItem, summary: Optional[BatchSummary] = None
+    ) -> BatchResult:
+        """Exports a single item of the batch, adds its data to the summary."""
+        if not os.path.exists(item.path):
+            return BatchResult(
+                path=str(item.path), status="skipped", error="File not found."
+            )
+
+        with self.backend.open(item.path) as document:
+            snapshot = take_snapshot(
+                document=document,
+                language=self._language_cache.get(
+                    parameters=document.product.parameters  # type: ignore
+                ),
+            )
+
+            if snapshot.source not in [1, 2]:
+                return BatchResult(
+                    path=str(item.path),
+                    status="skipped",
+                    error="The source of the document is not set.",
+                )
+            allowed_conditions = [resource.settings.condition.new.name]
+            if snapshot.source == 1:
+                allowed_conditions.append(resource.settings.condition.mod.name)
+            if item.condition not in allowed_conditions:
+                raise PytiaValueError(
+                    f"The condition {item.condition!r} is not valid for this document."
+                )
+
+            if item.mail and self.outlook is None:
+                # pylint: disable=C0415
+                from helper.outlook import get_outlook
+
+                # pylint: enable=C0415
+
+                self.outlook = get_outlook()
+
+            pipeline = ExportPipeline(
+                document=document,  # type: ignore
+                snapshot=snapshot,
+                options=item,
+                runner=Runner(),
+                folder_name=f"{time.strftime('%Y_%m_%d_%H_%M_%S')}_{index}",
+                outlook=self.outlook,
+                docket_session=self.docket_session,
+                interactive=False,
+            )
+            pipeline.prepare()
+            try:
+                pipeline.runner.run_tasks()
+            finally:
+                write_metrics(
+                    metrics=pipeline.runner.metrics,
+                    context={
+                        "document": pipeline.export_name,
+                        "project": pipeline.project,
+                        "source": pipeline.source,
+                        "batch": True,
+                    },
+                )
+
+            if summary is not None:
+                summary.add(
+                    source="made" if snapshot.source == 1 else "bought",
+                    data=pipeline.data,
+                )
+
+        return BatchResult(
+            path=str(item.path),
+            status="ok",
+            files=[str(f) for f in pipeline.files],
+        )
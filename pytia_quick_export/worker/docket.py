@@ -1,24 +1,233 @@
 """
     Export submodule. Holds utility functions for handling data exports.
+
+    The docket is created from the docket template (a CATDrawing) with the docket utilities of
+    pytia. A docket session validates the docket config and resolves the template once, and keeps
+    the images of the dockets until it's closed, so this isn't repeated for every document of a
+    batch.
 """
+
+import hashlib
+import os
 from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Protocol
 
-from const import LOGON
+from const import TEMP_EXPORT
+from helper.context import RenderContext
 from pytia.exceptions import PytiaFileOperationError
+from pytia.exceptions import PytiaValueError
+from pytia.log import log
 from pytia.utilities.docket import DocketConfig
 from pytia.utilities.docket import create_docket_from_template
 from pytia.utilities.docket import export_docket_as_pdf
+from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
 from pytia.wrapper.documents.part_documents import PyPartDocument
 from pytia.wrapper.documents.product_documents import PyProductDocument
 from resources import resource
 from templates import templates
 
+# The arguments that hold the PNG data of an image, and the argument that holds the path to the
+# image file. The docket places images only from files, by their `path_argument`.
+IMAGE_ARGUMENTS = {"qr_image": "qr_path"}
+
+
+class DocketRenderer(Protocol):
+    """
+    The interface that creates the docket from the template. Implemented by the pytia renderer,
+    and by any local fake renderer.
+    """
+
+    def fill(
+        self,
+        template: Path,
+        document: PyProductDocument | PyPartDocument,
+        config: DocketConfig,
+        values: Dict[str, Any],
+    ) -> None:
+        """Creates the docket of the document from the template."""
+        ...
+
+    def export_pdf(self, path: Path) -> None:
+        """Exports the created docket as pdf and closes it."""
+        ...
+
+    def discard(self) -> None:
+        """Closes the created docket without exporting it."""
+        ...
+
+
+class PytiaDocketRenderer:
+    """Creates the docket with the docket utilities of pytia."""
+
+    def __init__(self) -> None:
+        self._docket: Optional[PyDrawingDocument] = None
+
+    def fill(
+        self,
+        template: Path,
+        document: PyProductDocument | PyPartDocument,
+        config: DocketConfig,
+        values: Dict[str, Any],
+    ) -> None:
+        """
+        Creates the docket of the document from the template. Properties that don't exist in the
+        document are left empty.
+
+        Args:
+            template (Path): The path to the docket template.
+            document (PyProductDocument | PyPartDocument): The document of the docket.
+            config (DocketConfig): The docket configuration object.
+            values (Dict[str, Any]): The values of the arguments and the overwritten properties.
+        """
+        self._docket = create_docket_from_template(
+            template=template,
+            document=document,
+            config=config,
+            hide_unknown_properties=True,
+            **values,
+        )
+
+    def export_pdf(self, path: Path) -> None:
+        """
+        Exports the created docket as pdf and closes it.
+
+        Args:
+            path (Path): The full export path (folder, filename and extension).
+        """
+        export_docket_as_pdf(
+            docket=self._docket,
+            name=path.name,
+            folder=path.resolve().parent,
+        )
+        self._docket = None
+
+    def discard(self) -> None:
+        """Closes the created docket without exporting it, if there is one."""
+        if self._docket is not None:
+            self._docket.close()
+            self._docket = None
+
+
+class DocketSession:
+    """
+    Exports several dockets with the same docket config and template. The config is validated
+    with the first docket. Images in memory are written into the temp folder once and deleted
+    when the session is closed. Use the session as context manager, or close it when it's not
+    needed anymore.
+    """
+
+    def __init__(
+        self, renderer: DocketRenderer, template: Optional[Path] = None
+    ) -> None:
+        """
+        Inits the session.
+
+        Args:
+            renderer (DocketRenderer): The renderer of the dockets.
+            template (Optional[Path], optional): The path to the docket template. Defaults to \
+                the docket template of the app.
+        """
+        self.renderer = renderer
+        self.template = template
+        self.exports = 0
+        self._config: Optional[DocketConfig] = None
+        self._images: Dict[str, Path] = {}
+
+    def __enter__(self) -> "DocketSession":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        """
+        Resolves the template and validates the docket config.
+
+        Raises:
+            PytiaFileOperationError: Raised if the template file doesn't exist.
+            PytiaValueError: Raised if the docket config is invalid.
+        """
+        template = self.template or templates.docket_path
+        if template is None:
+            raise PytiaFileOperationError(
+                "Cannot export docket, template file doesn't exist."
+            )
+
+        try:
+            config = DocketConfig.from_dict(resource.docket)
+        except (KeyError, TypeError, ValueError) as e:
+            raise PytiaValueError(f"Cannot export docket, invalid config: {e}") from e
+
+        self.template = template
+        self._config = config
+
+    def _write_image(self, data: bytes) -> Path:
+        """Returns the path of the image file, writes the file if it doesn't exist yet."""
+        digest = hashlib.sha1(data).hexdigest()
+        path = self._images.get(digest)
+        if path is None or not path.exists():
+            path = Path(TEMP_EXPORT, f"docket_image_{digest}.png")
+            with open(path, "wb") as f:
+                f.write(data)
+            self._images[digest] = path
+        return path
+
+    def export(
+        self,
+        path: Path,
+        document: PyProductDocument | PyPartDocument,
+        values: Dict[str, Any],
+    ) -> None:
+        """
+        Creates the docket of the document and exports it as pdf. The docket is closed without
+        export if this fails.
+
+        Args:
+            path (Path): The full export path (folder, filename and extension).
+            document (PyProductDocument | PyPartDocument): The document of the docket.
+            values (Dict[str, Any]): The values of the arguments and the overwritten properties.
+
+        Raises:
+            PytiaFileOperationError: Raised if the template file doesn't exist.
+            PytiaValueError: Raised if the docket config is invalid.
+        """
+        if self._config is None:
+            self._open()
+
+        values = dict(values)
+        for image_argument, path_argument in IMAGE_ARGUMENTS.items():
+            if (data := values.pop(image_argument, None)) is not None:
+                values[path_argument] = self._write_image(data)
+
+        try:
+            self.renderer.fill(
+                template=self.template,  # type: ignore
+                document=document,
+                config=self._config,  # type: ignore
+                values=values,
+            )
+            self.renderer.export_pdf(path)
+        except Exception:
+            self.renderer.discard()
+            raise
+        self.exports += 1
+
+    def close(self) -> None:
+        """Deletes the images of the session."""
+        for path in self._images.values():
+            if path.exists():
+                os.remove(path)
+        self._images.clear()
+
 
 def export_docket(
     path: Path,
     document: PyProductDocument | PyPartDocument,
-    config: DocketConfig,
-    selected_condition: str,
+    context: RenderContext,
+    session: Optional[DocketSession] = None,
     **kwargs,
 ) -> None:
     """
@@ -29,83 +238,25 @@ def export_docket(
         path (Path): The full export path (folder, filename and extension).
         document (PyPartDocument | PyProductDocument): The part or product document from which \
             to create the docket
-        config (DocketConfig): The docket configuration object.
-        selected_condition (str): The condition selected by the user in the UI.
+        context (RenderContext): The render context of the export. Its arguments (project, \
+            quantity, creator, modifier, publisher and the condition overwrites) are added to \
+            the docket.
+        session (Optional[DocketSession], optional): The session in which to export the docket. \
+            Validates the docket config only for this docket if omitted. Defaults to None.
 
         kwargs: Keyword arguments will be added to the docket for text elements which names are \
-            prefixed with `arg.`. Example: To add the quantity to the docket text \
-            element with the name 'arg.quantity' you have to supply the argument `quantity=1`.
+            prefixed with `arg.`, and for images by their `path_argument`. Example: To add the \
+            QR code to the docket you have to supply the PNG data as argument `qr_image=...`, \
+            it's placed by the `path_argument` `qr_path`.
 
     Raises:
-        PytiaFileOperationError: Raised if the given folder isn't valid.
+        PytiaFileOperationError: Raised if the template file doesn't exist.
+        PytiaValueError: Raised if the docket config is invalid.
     """
-    if templates.docket_path is None:
-        raise PytiaFileOperationError(
-            "Cannot export docket, template file doesn't exist."
-        )
-
-    # Translate creator username
-    if document.properties.exists(resource.props.creator):
-        if (
-            resource.logon_exists(
-                creator_logon := document.properties.get_by_name(
-                    resource.props.creator
-                ).value
-            )
-            and resource.settings.export.apply_username
-        ):
-            creator = resource.get_user_by_logon(creator_logon).name
-        else:
-            creator = creator_logon
-    else:
-        creator = "Unknown"
-
-    # Translate modifier username
-    if document.properties.exists(resource.props.modifier):
-        if (
-            resource.logon_exists(
-                modifier_logon := document.properties.get_by_name(
-                    resource.props.modifier
-                ).value
-            )
-            and resource.settings.export.apply_username
-        ):
-            modifier = resource.get_user_by_logon(modifier_logon).name
-        else:
-            modifier = modifier_logon
-    else:
-        modifier = "Unknown"
-
-    # Translate publisher username
-    if resource.logon_exists(LOGON) and resource.settings.export.apply_username:
-        publisher = resource.get_user_by_logon(LOGON).name
-    else:
-        publisher = LOGON
+    values = {**context.arguments, **kwargs}
 
-    # Apply properties, where their values are dependent on the condition.
-    condition_props = {}
-    if selected_condition == resource.settings.condition.mod.name:
-        condition_props = resource.settings.condition.mod.overwrite
+    if session is not None:
+        session.export(path=path, document=document, values=values)
     else:
-        for prop in resource.settings.condition.mod.overwrite:
-            if document.properties.exists(prop):
-                condition_props[prop] = document.properties.get_by_name(prop).value
-            else:
-                condition_props[prop] = ""
-
-    docket = create_docket_from_template(
-        template=templates.docket_path,
-        document=document,
-        config=config,
-        hide_unknown_properties=True,
-        creator=creator,
-        modifier=modifier,
-        publisher=publisher,
-        **condition_props,
-        **kwargs,
-    )
-    export_docket_as_pdf(
-        docket=docket,
-        name=path.name,
-        folder=path.resolve().parent,
-    )
+        with DocketSession(renderer=PytiaDocketRenderer()) as single_session:
+            single_session.export(path=path, document=document, values=values)
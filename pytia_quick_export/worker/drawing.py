@@ -2,10 +2,17 @@
     Export submodule. Holds utility functions for handling data exports.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
 from tkinter import messagebox as tkmsg
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
 
 from const import PROP_DRAWING_PATH
+from helper.snapshot import PropertySnapshot
 from pytia.log import log
 from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
 from pytia.wrapper.documents.part_documents import PyPartDocument
@@ -15,63 +22,170 @@ from resources import resource
 from resources.utils import expand_env_vars
 
 
+def get_drawing_path(
+    snapshot: PropertySnapshot, workspace: Optional[Workspace] = None
+) -> Optional[Path]:
+    """
+    Returns the path of the linked drawing, as given by the 'pytia.drawing_path' property.
+
+    Args:
+        snapshot (PropertySnapshot): The property snapshot of the document.
+        workspace (Optional[Workspace], optional): The workspace of the document. Defaults to None.
+
+    Returns:
+        Optional[Path]: The path to the drawing, None if the property isn't set.
+    """
+    if (drawing_file_value := snapshot.get(PROP_DRAWING_PATH)) is None:
+        return None
+
+    # When the linked drawing path starts with a dot, the path is assumed to be
+    # relative to the workspace file.
+    # This makes it possible to move a whole project without breaking the paths.
+    if (
+        drawing_file_value.startswith(".\\")
+        and workspace
+        and workspace.workspace_folder
+    ):
+        return Path(workspace.workspace_folder, Path(drawing_file_value[2:]))
+
+    # If the linked drawing path isn't saved relative to a workspace file, it's
+    # assumed to be either a full absolute path, or a symlinked path (e.g. onedrive)
+    return Path(expand_env_vars(drawing_file_value))
+
+
+@contextmanager
+def open_drawing(path: Path) -> Iterator[Tuple[Any, bool]]:
+    """
+    Yields the drawing document of the given path. A drawing that is already loaded in CATIA is
+    reused and stays open, otherwise the drawing is opened and closed after the context.
+
+    Args:
+        path (Path): The path to the drawing.
+
+    Yields:
+        Tuple[DrawingDocument, bool]: The drawing document and whether the drawing has been \
+            loaded in CATIA before the export (the drawing belongs to the user).
+    """
+    # pylint: disable=C0415
+    from pytia.framework import framework
+
+    # pylint: enable=C0415
+
+    documents = framework.catia.documents
+    for index in range(1, documents.count + 1):
+        document = documents.item(index)
+        if Path(document.full_name).resolve() == path.resolve():
+            # pylint: disable=C0415
+            from pycatia.drafting_interfaces.drawing_document import DrawingDocument
+
+            # pylint: enable=C0415
+
+            log.info(f"Reusing the open drawing {path.name!r}.")
+            yield DrawingDocument(document.com_object), True
+            return
+
+    with PyDrawingDocument() as drawing_document:
+        drawing_document.open(path)
+        yield drawing_document.drawing_document, False
+
+
+def lock_drawing_views(drawing_document: Any) -> int:
+    """
+    Locks all views of all sheets, except the main and the background view. The lock states are
+    read first, only unlocked views are written. The display isn't refreshed while the views are
+    locked.
+
+    Args:
+        drawing_document (DrawingDocument): The drawing document.
+
+    Returns:
+        int: The number of views that have been locked.
+    """
+    # pylint: disable=C0415
+    from pytia.framework import framework
+
+    # pylint: enable=C0415
+
+    unlocked = []
+    sheets = drawing_document.sheets
+    for i_sheet in range(1, sheets.count + 1):
+        sheet = sheets.item(i_sheet)
+        for i_view in range(3, sheet.views.count + 1):
+            view = sheet.views.item(i_view)
+            if not view.lock_status:
+                unlocked.append((sheet, view))
+
+    if not unlocked:
+        return 0
+
+    refresh_display = framework.catia.refresh_display
+    framework.catia.refresh_display = False
+    try:
+        for sheet, view in unlocked:
+            view.lock_status = True
+            log.info(f"Locked view {view.name!r} of sheet {sheet.name!r}.")
+    finally:
+        framework.catia.refresh_display = refresh_display
+    return len(unlocked)
+
+
 def export_drawing(
-    pdf_path: Path,
-    dxf_path: Path,
+    paths: Dict[str, Path],
     document: PyProductDocument | PyPartDocument,
-    workspace: Workspace,
-) -> None:
+    snapshot: PropertySnapshot,
+    workspace: Optional[Workspace] = None,
+    interactive: bool = True,
+) -> int:
     """
-    Exports the drawing into a pdf and dxf file. The files will be exported into the temp folder
-    and moved after the main task has finished.
+    Exports the drawing into the given formats (see the `drawing_formats` setting). The files
+    will be exported into the temp folder and moved after the main task has finished.
 
     This export only works if the 'pytia.drawing_path' property is set and valid. This property
     is created when using the https://github.com/deloarts/pytia-title-block app.
 
     Args:
-        path (Path): The full export path (folder, filename and extension).
+        paths (Dict[str, Path]): The full export path (folder, filename and extension) of each \
+            format, e.g. {"pdf": Path(...), "dxf": Path(...)}.
         document (PyProductDocument | PyPartDocument): The document from which to export the data.
+        snapshot (PropertySnapshot): The property snapshot of the document.
+        workspace (Optional[Workspace], optional): The workspace of the document. Defaults to None.
+        interactive (bool, optional): Whether to show an error message box if the drawing path \
+            isn't valid. Defaults to True.
+
+    Returns:
+        int: The number of drawing views that have been locked.
     """
-    if document.properties.exists(PROP_DRAWING_PATH):
-        drawing_file_value = document.properties.get_by_name(PROP_DRAWING_PATH).value
-
-        # When the linked drawing path starts with a dot, the path is assumed to be
-        # relative to the workspace file.
-        # This makes it possible to move a whole project without breaking the paths.
-        if drawing_file_value.startswith(".\\") and workspace.workspace_folder:
-            relative_path = Path(drawing_file_value[2:])
-            drawing_path = Path(workspace.workspace_folder, relative_path)
-
-        # If the linked drawing path isn't saved relative to a workspace file, it's
-        # assumed to be either a full absolute path, or a symlinked path (e.g. onedrive)
-        else:
-            drawing_path = Path(expand_env_vars(drawing_file_value))
-
-        if drawing_path.exists():
-            with PyDrawingDocument() as drawing_document:
-                drawing_document.open(drawing_path)
-                drawing_document.drawing_document.export_data(
-                    pdf_path, "pdf", overwrite=True
-                )
-                drawing_document.drawing_document.export_data(
-                    dxf_path, "dxf", overwrite=True
-                )
-                if resource.settings.export.lock_drawing_views:
-                    sheets = drawing_document.drawing_document.sheets
-                    for i_sheet in range(1, sheets.count + 1):
-                        sheet = sheets.item(i_sheet)
-                        for i_view in range(3, sheet.views.count + 1):
-                            view = sheet.views.item(i_view)
-                            view.lock_status = True
-                            log.info(
-                                f"Locked view {view.name!r} or sheet {sheet.name!r}."
-                            )
-                    drawing_document.save()
-        else:
-            msg = (
-                f"Skipped drawing export of {document.document.name!r}: Path not valid."
-            )
-            log.error(msg)
-            tkmsg.showerror(title=resource.settings.title, message=msg)
-    else:
+    drawing_path = get_drawing_path(snapshot=snapshot, workspace=workspace)
+    if drawing_path is None:
         log.info(f"Skipped drawing export of {document.document.name!r}: Path not set.")
+        return 0
+
+    if not drawing_path.exists():
+        msg = f"Skipped drawing export of {document.document.name!r}: Path not valid."
+        log.error(msg)
+        if interactive:
+            tkmsg.showerror(title=resource.settings.title, message=msg)
+        return 0
+
+    locked = 0
+    with open_drawing(drawing_path) as (drawing_document, reused):
+        for export_format, path in paths.items():
+            drawing_document.export_data(path, export_format, overwrite=True)
+            log.info(f"Exported drawing as {export_format!r} to {str(path)!r}.")
+
+        # A drawing that is already open in CATIA may hold unsaved changes of the user, saving
+        # it would persist them. Hence only drawings opened by the export are locked and saved.
+        if resource.settings.export.lock_drawing_views and reused:
+            log.warning(
+                f"Drawing {drawing_path.name!r} is open in CATIA, views not locked and "
+                "drawing not saved."
+            )
+        # Saving bumps the timestamp of the drawing file, hence it's only saved if a lock
+        # state has actually changed.
+        elif resource.settings.export.lock_drawing_views:
+            if locked := lock_drawing_views(drawing_document):
+                drawing_document.save()
+                log.info(f"Saved drawing {drawing_path.name!r}.")
+            else:
+                log.info("All drawing views were already locked, drawing not saved.")
+    return locked
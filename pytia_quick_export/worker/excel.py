@@ -1,20 +1,38 @@
 """
     Export submodule. Holds utility functions for handling data exports.
+
+    openpyxl is only imported when it's used: The export of a single document is written by the
+    native XLSX writer, which doesn't need openpyxl.
 """
+import pickle
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Literal
+from typing import Optional
 
 from models.data import DataModel
 from models.data import DatumModel
-from openpyxl.cell import Cell
-from openpyxl.styles import Alignment
-from openpyxl.styles import Font
-from openpyxl.styles import PatternFill
-from openpyxl.workbook import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
 from pytia.log import log
 from resources import resource
 
+from .xlsx import STYLE_DATA_1
+from .xlsx import STYLE_DATA_2
+from .xlsx import STYLE_DEFAULT
+from .xlsx import STYLE_HEADER
+from .xlsx import can_write_xlsx
+from .xlsx import get_row_style_name
+from .xlsx import write_xlsx
+
+if TYPE_CHECKING:
+    from openpyxl.cell import Cell
+    from openpyxl.styles import NamedStyle
+    from openpyxl.workbook import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+
 
 def export_excel(
     path: Path,
@@ -23,9 +41,10 @@ def export_excel(
     source: Literal["made", "bought"],
 ) -> None:
     """
-    Exports the EXCEL file containing all the information of the document.
-    The EXCEL file will have two rows, the header and the data row.
-    For configuration see the 'excel.json' resource file.
+    Exports the EXCEL file containing all the information of the document: The header row (if
+    enabled) and the data row, at the positions and with the styles of the 'excel.json' resource
+    file. The file is written by the native XLSX writer, openpyxl is only imported for titles
+    and values that the native writer can't write.
 
     Args:
         path (Path): The path into which to save the EXCEL (xlsx) file.
@@ -33,115 +52,432 @@ def export_excel(
         data (DataModel): The documents data to write.
         source (str): The source of the document (`made` or `bought`).
     """
+    # The native writer covers the fixed layout of the export, openpyxl is the fallback for
+    # everything it can't write.
+    if can_write_xlsx(title=selected_project, data=data):
+        write_xlsx(path=path, title=selected_project, data=data)
+    else:
+        _export_excel_openpyxl(path=path, selected_project=selected_project, data=data)
+    log.info(f"Saved excel document to {str(path)!r}.")
+
+
+def _export_excel_openpyxl(path: Path, selected_project: str, data: DataModel) -> None:
+    """
+    Exports the EXCEL file with openpyxl.
+
+    Args:
+        path (Path): The path into which to save the EXCEL (xlsx) file.
+        selected_project (str): The project number, used as worksheet title.
+        data (DataModel): The documents data to write.
+    """
+    # pylint: disable=C0415
+    from openpyxl.workbook import Workbook
+
+    # pylint: enable=C0415
+
     wb = Workbook()
     ws = wb.active
     assert ws
     ws.title = selected_project
 
-    _write_data(worksheet=ws, data=data)  # type:ignore
-    _style_worksheet(worksheet=ws)  # type:ignore
+    widths = ColumnWidths()
+    styles = ExcelStyles(workbook=wb)
+    _write_data(worksheet=ws, data=data, widths=widths, styles=styles)  # type:ignore
+    _style_worksheet(worksheet=ws, widths=widths, styles=styles)  # type:ignore
 
     wb.save(str(path))
-    log.info(f"Saved excel document to {str(path)!r}.")
+
+
+def export_excel_rows(
+    path: Path,
+    selected_project: str,
+    data: Iterable[DataModel],
+) -> int:
+    """
+    Exports the EXCEL file containing the information of many documents, one row per document.
+    The data is streamed into the file, the memory usage doesn't depend on the number of rows.
+    For configuration see the 'excel.json' resource file.
+
+    Args:
+        path (Path): The path into which to save the EXCEL (xlsx) file.
+        selected_project (str): The project number, used as worksheet title.
+        data (Iterable[DataModel]): The data of the documents to write.
+
+    Returns:
+        int: The number of written data rows.
+    """
+    writer = ExcelStreamWriter(path=path, title=selected_project)
+    for item in data:
+        writer.add(item)
+    writer.save()
+    return writer.rows
+
+
+class ColumnWidths:
+    """
+    Running maximum of the content length of each column. The widths are tracked while the values
+    are written, so the worksheet doesn't have to be scanned again to size the columns.
+    """
+
+    def __init__(self) -> None:
+        self._lengths: Dict[int, int] = {}
+
+    def update(self, index: int, value: Optional[str]) -> None:
+        """
+        Updates the width of the column with the value that is written to it.
+
+        Args:
+            index (int): The zero-based index of the column.
+            value (Optional[str]): The value that is written.
+        """
+        if value is not None:
+            length = len(str(value))
+            if length > self._lengths.get(index, 0):
+                self._lengths[index] = length
+
+    def apply(self, worksheet: "Worksheet") -> None:
+        """Sets the width of all tracked columns on the worksheet."""
+        # pylint: disable=C0415
+        from openpyxl.utils import get_column_letter
+
+        # pylint: enable=C0415
+
+        for index, length in self._lengths.items():
+            worksheet.column_dimensions[get_column_letter(index + 1)].width = max(
+                length * 1.1, 2
+            )
+
+
+class ExcelStyles:
+    """
+    Registry of the cell styles stated in the excel.json config file. Each distinct style is
+    created once per workbook as named style, cells only reference the named style by its name.
+    This way openpyxl doesn't have to create and deduplicate a font, fill and alignment for every
+    single cell.
+
+    The definitions of the styles are created once and shared by all workbooks, until the style
+    settings of the excel.json change.
+    """
+
+    HEADER = STYLE_HEADER
+    DATA_1 = STYLE_DATA_1
+    DATA_2 = STYLE_DATA_2
+    DEFAULT = STYLE_DEFAULT
+
+    _definitions: Dict[str, dict] = {}
+    _definitions_key: Optional[tuple] = None
+
+    def __init__(self, workbook: "Workbook") -> None:
+        self.workbook = workbook
+        self._styles: Dict[str, "NamedStyle"] = {}
+
+        key = ExcelStyles.get_settings_key()
+        if key != ExcelStyles._definitions_key:
+            ExcelStyles._definitions = {}
+            ExcelStyles._definitions_key = key
+        self._definitions = ExcelStyles._definitions
+
+    @staticmethod
+    def get_settings_key() -> tuple:
+        """Returns the style settings of the excel.json, used to invalidate the definitions."""
+        return (
+            resource.excel.font,
+            resource.excel.size,
+            resource.excel.header_color,
+            resource.excel.header_bg_color,
+            resource.excel.data_color_1,
+            resource.excel.data_bg_color_1,
+            resource.excel.data_color_2,
+            resource.excel.data_bg_color_2,
+        )
+
+    def get(self, name: str) -> str:
+        """
+        Returns the name of the style, adds the style to the workbook on first use.
+
+        Args:
+            name (str): The name of the style, one of the class constants.
+
+        Returns:
+            str: The name of the named style, to be assigned to `cell.style`.
+        """
+        if name not in self._styles:
+            # pylint: disable=C0415
+            from openpyxl.styles import NamedStyle
+
+            # pylint: enable=C0415
+
+            if name not in self._definitions:
+                self._definitions[name] = self._create(name)
+            style = NamedStyle(name=name, **self._definitions[name])
+            self.workbook.add_named_style(style)
+            self._styles[name] = style
+        return name
+
+    def get_row_style(self, row: int) -> str:
+        """
+        Returns the name of the style for all cells of a row.
+
+        Args:
+            row (int): The zero-based index of the row.
+
+        Returns:
+            str: The name of the named style.
+        """
+        return self.get(get_row_style_name(row))
+
+    @staticmethod
+    def _create(name: str) -> dict:
+        """Creates the definition of the named style from the excel.json config."""
+        # pylint: disable=C0415
+        from openpyxl.styles import Alignment
+        from openpyxl.styles import Font
+        from openpyxl.styles import PatternFill
+
+        # pylint: enable=C0415
+
+        style: dict = {
+            "number_format": "@",
+            "alignment": Alignment(horizontal="left", vertical="center"),
+        }
+
+        match name:
+            case ExcelStyles.HEADER:
+                style["font"] = Font(
+                    name=resource.excel.font,
+                    size=resource.excel.size,
+                    bold=True,
+                    color=resource.excel.header_color,
+                )
+                style["fill"] = PatternFill(
+                    start_color=resource.excel.header_bg_color,
+                    end_color=resource.excel.header_bg_color,
+                    fill_type="solid",
+                )
+                style["alignment"] = Alignment(horizontal="center", vertical="center")
+            case ExcelStyles.DATA_1 | ExcelStyles.DATA_2:
+                first = name == ExcelStyles.DATA_1
+                color = (
+                    resource.excel.data_color_1
+                    if first
+                    else resource.excel.data_color_2
+                )
+                bg_color = (
+                    resource.excel.data_bg_color_1
+                    if first
+                    else resource.excel.data_bg_color_2
+                )
+                style["font"] = Font(
+                    name=resource.excel.font, size=resource.excel.size, color=color
+                )
+                style["fill"] = PatternFill(
+                    start_color=bg_color, end_color=bg_color, fill_type="solid"
+                )
+            case _:
+                style["font"] = Font(name=resource.excel.font, size=resource.excel.size)
+        return style
 
 
 def _write_data(
-    worksheet: Worksheet,
+    worksheet: "Worksheet",
     data: DataModel,
+    widths: ColumnWidths,
+    styles: ExcelStyles,
 ) -> None:
     """
-    Saves the documents data to the EXCEL worksheet.
+    Saves the documents data to the EXCEL worksheet. The cells are styled as they are written.
 
     Args:
         worksheet (Worksheet): The EXCEL worksheet.
         data (DataModel): The documents data to write.
+        widths (ColumnWidths): The column widths, updated with every written value.
+        styles (ExcelStyles): The styles of the workbook.
     """
     for datum in data.data:
-        _write_header(worksheet=worksheet, datum=datum)
-        _write_datum(worksheet=worksheet, datum=datum)
+        _write_header(worksheet=worksheet, datum=datum, widths=widths, styles=styles)
+        _write_datum(worksheet=worksheet, datum=datum, widths=widths, styles=styles)
 
 
-def _write_header(worksheet: Worksheet, datum: DatumModel) -> None:
+def _write_header(
+    worksheet: "Worksheet", datum: DatumModel, widths: ColumnWidths, styles: ExcelStyles
+) -> None:
     """
     Writes a single header item to the EXCEL worksheet.
 
     Args:
         worksheet (Worksheet): The EXCEL worksheet.
         datum (DatumModel): The datum model from which to create the header.
+        widths (ColumnWidths): The column widths, updated with the header.
+        styles (ExcelStyles): The styles of the workbook.
     """
+    # pylint: disable=C0415
+    from openpyxl.cell import Cell
+
+    # pylint: enable=C0415
+
     if resource.excel.header_row is not None:
         header_cell = worksheet.cell(resource.excel.header_row + 1, datum.index + 1)
         cell_value = datum.name
         if isinstance(header_cell, Cell):
             header_cell.value = cell_value
+            header_cell.style = styles.get_row_style(resource.excel.header_row)
+            widths.update(datum.index, cell_value)
             log.info(f"Wrote header {cell_value!r} to worksheet.")
 
 
-def _write_datum(worksheet: Worksheet, datum: DatumModel) -> None:
+def _write_datum(
+    worksheet: "Worksheet", datum: DatumModel, widths: ColumnWidths, styles: ExcelStyles
+) -> None:
     """
-    Writes a single datum to the EXCEL worksheet.
+    Writes a single datum to the EXCEL worksheet. Empty cells are styled too.
 
     Args:
         worksheet (Worksheet): The EXCEL worksheet.
         datum (DatumModel): The datum model from which to write the data.
+        widths (ColumnWidths): The column widths, updated with the datum.
+        styles (ExcelStyles): The styles of the workbook.
     """
-    if datum.value is not None:
-        datum_cell = worksheet.cell(resource.excel.data_row + 1, datum.index + 1)
-        cell_value = datum.value
-        if isinstance(datum_cell, Cell):
+    # pylint: disable=C0415
+    from openpyxl.cell import Cell
+
+    # pylint: enable=C0415
+
+    datum_cell = worksheet.cell(resource.excel.data_row + 1, datum.index + 1)
+    if isinstance(datum_cell, Cell):
+        datum_cell.style = styles.get_row_style(resource.excel.data_row)
+        if datum.value is not None:
+            cell_value = datum.value
             datum_cell.value = cell_value
+            widths.update(datum.index, cell_value)
             log.info(f"Wrote value {cell_value!r} to worksheet.")
 
 
-def _style_worksheet(worksheet: Worksheet) -> None:
-    """Styles the worksheet as stated in the excel.json config file."""
-    for column_cells in worksheet.columns:
-        # Set format, font and size
-        for index, cell in enumerate(column_cells):  # type:ignore
-            if index > resource.excel.data_row - 1:
-                color = (
-                    resource.excel.data_color_1
-                    if index % 2 == 0
-                    else resource.excel.data_color_2
-                )
-                bg_color = (
-                    resource.excel.data_bg_color_1
-                    if index % 2 == 0
-                    else resource.excel.data_bg_color_2
-                )
-                cell.fill = PatternFill(
-                    start_color=bg_color, end_color=bg_color, fill_type="solid"
-                )
-            else:
-                color = None
-            cell.number_format = "@"
-            cell.font = Font(
-                name=resource.excel.font, size=resource.excel.size, color=color
-            )
-            cell.alignment = Alignment(horizontal="left", vertical="center")
-
-        # Set font and height for the header row
-        if isinstance(resource.excel.header_row, int):
-            worksheet.row_dimensions[resource.excel.header_row + 1].height = 20  # type: ignore
-            column_cells[resource.excel.header_row].font = Font(  # type:ignore
-                name=resource.excel.font,
-                size=resource.excel.size,
-                bold=True,
-                color=resource.excel.header_color,
-            )
-            column_cells[resource.excel.header_row].fill = PatternFill(  # type:ignore
-                start_color=resource.excel.header_bg_color,
-                end_color=resource.excel.header_bg_color,
-                fill_type="solid",
-            )
-            column_cells[  # type:ignore
-                resource.excel.header_row
-            ].alignment = Alignment(horizontal="center", vertical="center")
-
-        # Set cell width
-        length = max(len(str(cell.value)) * 1.1 for cell in column_cells)  # type:ignore
-        worksheet.column_dimensions[column_cells[0].column_letter].width = (  # type: ignore
-            length if length > 2 else 2
-        )
+def _style_worksheet(
+    worksheet: "Worksheet", widths: ColumnWidths, styles: ExcelStyles
+) -> None:
+    """
+    Styles the worksheet as stated in the excel.json config file. The header and data cells have
+    already been styled when they were written, only empty rows in between are styled here.
+
+    Args:
+        worksheet (Worksheet): The EXCEL worksheet.
+        widths (ColumnWidths): The column widths, tracked while the data has been written.
+        styles (ExcelStyles): The styles of the workbook.
+    """
+    # Set format, font and size of the rows that haven't been written
+    written_rows = (resource.excel.header_row, resource.excel.data_row)
+    for row in range(worksheet.max_row):
+        if row not in written_rows:
+            style = styles.get_row_style(row)
+            for cell in worksheet[row + 1]:
+                cell.style = style
+
+    # Set height for the header row
+    if isinstance(resource.excel.header_row, int):
+        worksheet.row_dimensions[resource.excel.header_row + 1].height = 20  # type: ignore
+
+    # Set cell width
+    widths.apply(worksheet=worksheet)
 
     log.info(f"Styled worksheet {worksheet.title!r}.")
+
+
+class ExcelStreamWriter:
+    """
+    Writes the data of many documents into a single worksheet, using the write-only mode of
+    openpyxl. The column header is taken from the column names of the added data.
+
+    In write-only mode the column widths must be known before the first row is written. Therefore
+    added rows are spooled into a temporary file first, while the column widths are tracked. The
+    rows are streamed from this file into the workbook when it's saved.
+    """
+
+    def __init__(self, path: Path, title: str) -> None:
+        """
+        Inits the writer.
+
+        Args:
+            path (Path): The path into which to save the EXCEL (xlsx) file.
+            title (str): The title of the worksheet.
+        """
+        self.path = path
+        self.title = title
+        self.rows = 0
+
+        self._columns = 0
+        self._header: Dict[int, str] = {}
+        self._widths = ColumnWidths()
+        self._spool = tempfile.TemporaryFile()
+
+    def add(self, data: DataModel) -> None:
+        """
+        Adds the data of a document as row.
+
+        Args:
+            data (DataModel): The documents data to write.
+        """
+        values: Dict[int, str] = {}
+        for datum in data.data:
+            if datum.index not in self._header:
+                self._header[datum.index] = datum.name
+                self._widths.update(datum.index, datum.name)
+            if datum.value is not None:
+                values[datum.index] = datum.value
+                self._widths.update(datum.index, datum.value)
+            self._columns = max(self._columns, datum.index + 1)
+
+        pickle.dump(values, self._spool, protocol=pickle.HIGHEST_PROTOCOL)
+        self.rows += 1
+
+    def save(self) -> None:
+        """Writes all added rows into the workbook and saves it."""
+        # pylint: disable=C0415
+        from openpyxl.workbook import Workbook
+
+        # pylint: enable=C0415
+
+        try:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(title=self.title)
+            styles = ExcelStyles(workbook=wb)
+            self._widths.apply(worksheet=ws)  # type: ignore
+
+            header_row = resource.excel.header_row
+            if header_row is not None and header_row >= resource.excel.data_row:
+                log.warning(
+                    "The header row must be above the data row, skipped writing the header."
+                )
+                header_row = None
+            if header_row is not None:
+                ws.row_dimensions[header_row + 1].height = 20
+
+            for row in range(resource.excel.data_row):
+                values = self._header if row == header_row else {}
+                ws.append(self._make_row(ws, values, styles.get_row_style(row)))  # type: ignore
+
+            self._spool.seek(0)
+            for offset in range(self.rows):
+                values = pickle.load(self._spool)
+                row = resource.excel.data_row + offset
+                ws.append(self._make_row(ws, values, styles.get_row_style(row)))  # type: ignore
+
+            wb.save(str(self.path))
+        finally:
+            self._spool.close()
+        log.info(f"Saved {self.rows} rows to excel document {str(self.path)!r}.")
+
+    def _make_row(
+        self, worksheet: "Worksheet", values: Dict[int, str], style: str
+    ) -> List["Cell"]:
+        """Creates the styled cells of a row."""
+        # pylint: disable=C0415
+        from openpyxl.cell import WriteOnlyCell
+
+        # pylint: enable=C0415
+
+        cells = []
+        for index in range(self._columns):
+            cell = WriteOnlyCell(worksheet, values.get(index))  # type: ignore
+            cell.style = style
+            cells.append(cell)
+        return cells
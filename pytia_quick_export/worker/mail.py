@@ -5,41 +5,46 @@ from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from shutil import make_archive
+from typing import Optional
 
 import jinja2
+from helper.context import RenderContext
 from helper.outlook import get_outlook
 from models.data import DataModel
 from models.data import DatumModel
 from pytia.exceptions import PytiaApplicationError
 from resources import resource
 from templates import templates
+from win32com.client import CDispatch
 
 
 def export_mail(
     data: DataModel,
-    selected_project: str,
-    selected_condition: str,
+    context: RenderContext,
     selected_receiver: str,
     note: str,
     attachments_folder: Path,
     data_folder: Path,
+    outlook: Optional[CDispatch] = None,
 ) -> None:
-    """Composes an email.
+    """Composes an email. Uses the given outlook connection, connects to outlook if omitted.
+    The project and the condition are taken from the render context of the export.
 
     Raises:
         PytiaApplicationError: Raised when no connection to the local outlook app can be established
     """
-    outlook = get_outlook()
+    outlook = outlook or get_outlook()
     if outlook is None:
         raise PytiaApplicationError("Outlook is not available on this machine.")
 
     mail = outlook.CreateItem(0)  # FIXME: This fails if Outlook isn't running
     mail.To = selected_receiver
-    mail.Subject = f"{selected_project} | {resource.settings.mails.subject}"
+    mail.Subject = f"{context.project} | {resource.settings.mails.subject}"
     mail.HTMLBody = _render_template(
         data=data.data,
         settings=resource.settings,
-        condition=selected_condition,
+        condition=context.condition,
+        context=context,
         note=note,
     )
 
@@ -47,7 +52,7 @@ def export_mail(
         base_name=str(
             Path(
                 attachments_folder,
-                f"{selected_project}_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}",
+                f"{context.project}_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}",
             )
         ),
         format="zip",
@@ -0,0 +1,66 @@
+"""
+    Metrics of the exports, written to a local json lines file.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from const import APP_VERSION
+from const import LOG_METRICS
+from const import LOGS
+from models.runner import RunMetrics
+from pytia.log import log
+
+
+def write_metrics(
+    metrics: RunMetrics,
+    context: Optional[Dict[str, Any]] = None,
+    path: Optional[Path] = None,
+) -> None:
+    """
+    Appends the metrics of a run as a single json line to the metrics file. Failing to write
+    the metrics never fails the export, a warning is logged instead.
+
+    Args:
+        metrics (RunMetrics): The metrics of the run.
+        context (Optional[Dict[str, Any]], optional): Additional values of the line, e.g. the \
+            exported document. Defaults to None.
+        path (Optional[Path], optional): The metrics file. Defaults to the metrics file in the \
+            log folder.
+    """
+    path = path or Path(LOGS, LOG_METRICS)
+    line = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "version": APP_VERSION,
+        **(context or {}),
+        **metrics.to_dict(),
+    }
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        with open(path, "a", encoding="utf8") as f:
+            f.write(json.dumps(line) + "\n")
+    except OSError as e:
+        log.warning(f"Failed writing the export metrics to {str(path)!r}: {e}")
+
+
+def format_metrics(metrics: RunMetrics) -> str:
+    """
+    Returns the metrics of a run as human readable text, one line per task.
+
+    Args:
+        metrics (RunMetrics): The metrics of the run.
+
+    Returns:
+        str: The formatted metrics.
+    """
+    lines = [f"Total: {metrics.duration:.2f}s, {metrics.artifacts_size / 1024:.0f} KB"]
+    for task in metrics.tasks:
+        status = "" if task.status == "ok" else f" ({task.status})"
+        counters = "".join(f", {k}: {v}" for k, v in task.counters.items())
+        lines.append(f"{task.name}: {task.duration:.2f}s{counters}{status}")
+    return "\n".join(lines)
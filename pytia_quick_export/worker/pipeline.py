@@ -0,0 +1,313 @@
+"""
+    The export pipeline of a single document.
+
+    The exporters and their third-party dependencies (openpyxl, jinja2, validators, the QR and
+    docket tooling and the pytia document wrappers) are imported when their task runs, not
+    when the pipeline is imported. This keeps them out of the startup of the app.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+from typing import Literal
+from typing import Optional
+
+from const import TEMP_ATTACHMENTS
+from const import TEMP_EXPORT
+from helper.context import create_render_context
+from helper.names import get_data_export_name
+from helper.snapshot import PropertySnapshot
+from models.data import DataModel
+from models.export import ExportOptions
+from pytia_ui_tools.handlers.workspace_handler import Workspace
+from pytia_ui_tools.utils.files import file_utility
+from resources import resource
+
+from .data import collect_data
+from .runner import Runner
+
+if TYPE_CHECKING:
+    from pytia.wrapper.documents.part_documents import PyPartDocument
+    from pytia.wrapper.documents.product_documents import PyProductDocument
+
+    from .docket import DocketSession
+
+
+class ExportPipeline:  # pylint: disable=R0902
+    """
+    Adds all sub-tasks to export the data of a document to a runner. The pipeline doesn't depend
+    on the UI, all user input is given by the export options.
+    """
+
+    def __init__(
+        self,
+        document: "PyProductDocument | PyPartDocument",
+        snapshot: PropertySnapshot,
+        options: ExportOptions,
+        runner: Runner,
+        workspace: Optional[Workspace] = None,
+        folder_name: Optional[str] = None,
+        outlook: Optional[Any] = None,
+        docket_session: Optional["DocketSession"] = None,
+        interactive: bool = True,
+    ) -> None:
+        """
+        Inits the pipeline and adds all tasks to the runner.
+
+        Args:
+            document (PyProductDocument | PyPartDocument): The document to export.
+            snapshot (PropertySnapshot): The property snapshot of the document.
+            options (ExportOptions): The user input for the export.
+            runner (Runner): The runner to which the tasks are added.
+            workspace (Optional[Workspace], optional): The workspace of the document, used to \
+                resolve relative drawing paths. Defaults to None.
+            folder_name (Optional[str], optional): The name of the temporary export folder. \
+                Defaults to the current timestamp.
+            outlook (Optional[Any], optional): An existing connection to Outlook. Connects to \
+                Outlook when the mail is composed if omitted. Defaults to None.
+            docket_session (Optional[DocketSession], optional): The session in which the docket \
+                is exported. Validates the docket config only for this export if omitted. \
+                Defaults to None.
+            interactive (bool, optional): Whether errors may be shown in message boxes. \
+                Defaults to True.
+        """
+        self.document = document
+        self.snapshot = snapshot
+        self.options = options
+        self.runner = runner
+        self.workspace = workspace
+        self.outlook = outlook
+        self.docket_session = docket_session
+        self.interactive = interactive
+
+        self.data: DataModel
+        self.qr_image: bytes
+        self.files: List[Path] = []
+
+        # The usernames, the condition overwrites and the project are resolved once, all
+        # exports are rendered from this context.
+        self.context = create_render_context(
+            snapshot=snapshot,
+            project=options.project,
+            condition=options.condition,
+            quantity=options.quantity,
+        )
+        self.project = self.context.project
+        self.product = snapshot.get(resource.props.product)
+        self.partnumber = snapshot.partnumber
+        self.revision = snapshot.revision
+        # Source: 0=Unknown, 1=Made, 2=Bought
+        self.source = snapshot.source
+
+        folder_name = folder_name or datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+        self.export_folder = Path(TEMP_EXPORT, folder_name)
+        self.attachments_folder = Path(TEMP_ATTACHMENTS, folder_name)
+
+        self.export_name = get_data_export_name(snapshot)
+        self.export_name_with_project = get_data_export_name(
+            snapshot, project=self.project
+        )
+
+        self.docket_path = Path(
+            self.export_folder, self.export_name_with_project + ".pdf"
+        )
+        self.xlsx_path = Path(
+            self.export_folder, self.export_name_with_project + ".xlsx"
+        )
+        self.stp_path = Path(self.export_folder, self.export_name + ".stp")
+        self.stl_path = Path(self.export_folder, self.export_name + ".stl")
+        self.drawing_paths = {
+            export_format: Path(
+                self.export_folder, f"{self.export_name}.{export_format}"
+            )
+            for export_format in dict.fromkeys(resource.settings.export.drawing_formats)
+        }
+
+        # Tasks that don't access any COM object run concurrently to the COM-bound tasks.
+        # Data collection only reads from the property snapshot.
+        # The mail task zips the export folder, hence it requires all exports to be done.
+        # The size of the outputs of each export is recorded in the metrics of the runner.
+        self.runner.add(self._collect_data, name="Collect data", com=False)
+        exports: List[str] = []
+        for export_format in dict.fromkeys(resource.excel.formats):
+            if export_format == "xlsx":
+                self.runner.add(
+                    self._export_excel,
+                    name="EXCEL export",
+                    requires=["Collect data"],
+                    com=False,
+                    outputs=[self.xlsx_path],
+                )
+                exports.append("EXCEL export")
+            else:
+                tabular_path = Path(
+                    self.export_folder,
+                    f"{self.export_name_with_project}.{export_format}",
+                )
+                self.runner.add(
+                    self._export_tabular,
+                    name=f"{export_format.upper()} export",
+                    requires=["Collect data"],
+                    com=False,
+                    outputs=[tabular_path],
+                    path=tabular_path,
+                    export_format=export_format,
+                )
+                exports.append(f"{export_format.upper()} export")
+        if self.source == 1:  # Source: Made
+            self.runner.add(self._generate_qr, name="QR generation", com=False)
+            self.runner.add(
+                self._export_stp_stl,
+                name="STEP/STL export",
+                outputs=[self.stp_path, self.stl_path],
+            )
+            self.runner.add(
+                self._export_docket,
+                name="Docket export",
+                requires=["QR generation"],
+                outputs=[self.docket_path],
+            )
+            self.runner.add(
+                self._export_drawing,
+                name="Drawing export",
+                outputs=list(self.drawing_paths.values()),
+            )
+            exports += ["STEP/STL export", "Docket export", "Drawing export"]
+
+        self.runner.add(self._send_mail, name="Sending mail", requires=exports)
+        self.runner.add(self._clean, name="Cleaning up", requires=["Sending mail"])
+
+    def prepare(self) -> None:
+        """Creates the temporary export folder. Call this before running the tasks."""
+        os.makedirs(self.export_folder)
+
+    def _collect_data(self) -> None:
+        """Retrieves the data from the document."""
+        self.data = collect_data(context=self.context)
+
+    def _export_excel(self) -> None:
+        """Exports the EXCEL file, containing all information about the document."""
+        # pylint: disable=C0415
+        from .excel import export_excel
+
+        # pylint: enable=C0415
+
+        export_excel(
+            path=self.xlsx_path,
+            selected_project=self.project,
+            data=self.data,
+            source="made" if self.source == 1 else "bought",
+        )
+
+    def _export_tabular(self, path: Path, export_format: Literal["csv", "tsv"]) -> None:
+        """Exports the data as plain CSV or TSV file, containing the same data as the EXCEL file."""
+        # pylint: disable=C0415
+        from .tabular import export_tabular
+
+        # pylint: enable=C0415
+
+        export_tabular(path=path, data=self.data, export_format=export_format)
+
+    def _export_stp_stl(self) -> None:
+        """Exports the 3D data as STL and STEP (STL only for parts)."""
+        # pylint: disable=C0415
+        from .stp_stl import export_stl
+        from .stp_stl import export_stp
+
+        # pylint: enable=C0415
+
+        if self.snapshot.is_part:
+            export_stl(path=self.stl_path, document=self.document)  # type: ignore
+        export_stp(path=self.stp_path, document=self.document)
+
+    def _generate_qr(self) -> None:
+        """Generates the QR code for the docket in memory."""
+        # pylint: disable=C0415
+        from .qr import render_qr
+
+        # pylint: enable=C0415
+
+        self.qr_image = render_qr(
+            project=self.project,
+            product=self.product,
+            partnumber=self.partnumber,
+            revision=self.revision,
+        )
+
+    def _export_docket(self) -> None:
+        """Generates a docket file as pdf."""
+        # pylint: disable=C0415
+        from .docket import export_docket
+
+        # pylint: enable=C0415
+
+        export_docket(
+            path=self.docket_path,
+            document=self.document,
+            context=self.context,
+            session=self.docket_session,
+            qr_image=self.qr_image,
+        )
+
+    def _export_drawing(self) -> None:
+        """Exports the 2D data of the linked drawing (if there is one)."""
+        # pylint: disable=C0415
+        from .drawing import export_drawing
+
+        # pylint: enable=C0415
+
+        views_locked = export_drawing(
+            paths=self.drawing_paths,
+            document=self.document,
+            snapshot=self.snapshot,
+            workspace=self.workspace,
+            interactive=self.interactive,
+        )
+        self.runner.count(
+            task="Drawing export", name="views_locked", value=views_locked
+        )
+
+    def _send_mail(self) -> None:
+        """Sends the mail."""
+        # pylint: disable=C0415
+        import validators
+
+        from .mail import export_mail
+
+        # pylint: enable=C0415
+
+        if validators.email(self.options.mail):  # type: ignore
+            export_mail(
+                data=self.data,
+                context=self.context,
+                selected_receiver=self.options.mail,
+                note=self.options.note,
+                attachments_folder=self.attachments_folder,
+                data_folder=self.export_folder,
+                outlook=self.outlook,
+            )
+
+    def _clean(self) -> None:
+        """Deletes and moves files."""
+        if os.path.exists(self.attachments_folder):
+            for file in os.listdir(self.attachments_folder):
+                file_utility.add_delete(path=Path(self.attachments_folder, file))
+
+        export_files = os.listdir(self.export_folder)
+        target_folder = Path(self.options.folder)
+
+        if target_folder.is_absolute() and target_folder.is_dir():
+            for file in export_files:
+                file_utility.add_move(
+                    source=Path(self.export_folder, file),
+                    target=Path(target_folder, file),
+                )
+                self.files.append(Path(target_folder, file))
+        else:
+            for file in export_files:
+                file_utility.add_delete(path=Path(self.export_folder, file))
+
+        file_utility.move_all()
@@ -0,0 +1,45 @@
+"""
+    QR code generation for the docket.
+
+    The QR code is rendered into memory as PNG and cached by its payload, repeated exports of
+    the same document reuse the image. A file is only written if the docket renderer requires
+    a path.
+"""
+
+import json
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
+
+import qrcode
+
+
+@lru_cache(maxsize=128)
+def render_qr(
+    project: str, product: Optional[str], partnumber: str, revision: str
+) -> bytes:
+    """
+    Renders the QR code of a document as PNG. The result is cached by the payload.
+
+    Args:
+        project (str): The project of the export.
+        product (Optional[str]): The product property of the document.
+        partnumber (str): The partnumber of the document.
+        revision (str): The revision of the document.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    image = qrcode.make(
+        json.dumps(
+            {
+                "project": project,
+                "product": product,
+                "partnumber": partnumber,
+                "revision": revision,
+            }
+        )
+    )
+    buffer = BytesIO()
+    image.save(buffer)
+    return buffer.getvalue()
@@ -2,56 +2,379 @@
     Runner for the main task.
 """
 
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
+from queue import Empty
+from queue import Queue
 from tkinter import DoubleVar
 from tkinter import Tk
 from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Set
 
+from models.runner import RunMetrics
+from models.runner import RunnerEvent
 from models.runner import RunnerModel
+from models.runner import TaskMetrics
 from pytia.log import log
 
 
 class Runner:
     """
     This class is responsible for running tasks and updating the UI.
+
+    Tasks can declare dependencies on previously added tasks. Tasks that are flagged as not
+    COM-bound run concurrently on a thread pool as soon as their dependencies are done. COM-bound
+    tasks (the default) are always executed on the thread that owns the runner, because the
+    CATIA and Outlook COM objects are bound to the apartment in which they were created.
+
+    The runner can either run blocking (`run_tasks`) or in the background (`start`). In the latter
+    case all progress is posted as `RunnerEvent` to the `events` queue, which must be consumed by
+    the owning thread with `iter_events`. COM-bound tasks are executed by the consumer.
+
+    The duration, the outcome and the size of the output files of each task are recorded, see
+    `metrics`.
     """
 
     def __init__(
         self,
-        root: Tk,
-        callback_variable: DoubleVar,
+        root: Optional[Tk] = None,
+        callback_variable: Optional[DoubleVar] = None,
+        max_workers: int = 4,
     ) -> None:
         self.root = root
         self.progress_callback = callback_variable
+        self.max_workers = max_workers
 
         self.runners: List[RunnerModel] = []
+        self.events: Queue[RunnerEvent] = Queue()
+        self.progress: float = 0
+
+        self._background = False
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._metrics = RunMetrics()
+        self._task_metrics: Dict[str, TaskMetrics] = {}
+        self._perf_starts: Dict[str, float] = {}
+
+    @property
+    def running(self) -> bool:
+        """Returns whether the runner is currently running in the background."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns whether the runner has been cancelled."""
+        return self._cancel.is_set()
+
+    @property
+    def metrics(self) -> RunMetrics:
+        """
+        Returns the metrics of the run: The metrics of all tasks that have been started so far,
+        in the order they were started.
+        """
+        self._metrics.tasks = list(self._task_metrics.values())
+        return self._metrics
 
-    def add(self, func: Callable, name: str, **kwargs) -> None:
+    def add(
+        self,
+        func: Callable,
+        name: str,
+        requires: Optional[List[str]] = None,
+        com: bool = True,
+        outputs: Optional[List[Path]] = None,
+        **kwargs,
+    ) -> None:
         """
         Add a task function. Functions must be task-protocol-functions.
 
         Args:
             func (Callable): The task to be queued.
             name (str): The name of the task.
+            requires (Optional[List[str]], optional): The names of the tasks that must be \
+                finished before this task starts. Only tasks that have already been added can be \
+                required. Defaults to None.
+            com (bool, optional): Whether the task accesses COM objects. COM-bound tasks run on the \
+                owning thread in the order they were added, all others run on the thread pool. \
+                Defaults to True.
+            outputs (Optional[List[Path]], optional): The files written by the task. Their size \
+                is recorded in the metrics of the task. Defaults to None.
 
         Kwargs:
             Will be passed to the task function.
+
+        Raises:
+            ValueError: Raised if the name is already taken or a required task doesn't exist.
+        """
+        names = [r.name for r in self.runners]
+        if name in names:
+            raise ValueError(f"A task with the name {name!r} has already been added.")
+        for required in requires or []:
+            if required not in names:
+                raise ValueError(
+                    f"Task {name!r} requires {required!r}, which has not been added."
+                )
+
+        self.runners.append(
+            RunnerModel(
+                func=func,
+                name=name,
+                kwargs=kwargs,
+                requires=list(requires or []),
+                com=com,
+                outputs=list(outputs or []),
+            )
+        )
+
+    def count(self, task: str, name: str, value: int) -> None:
+        """
+        Records a counter in the metrics of a running task, e.g. the number of changed items.
+
+        Args:
+            task (str): The name of the task.
+            name (str): The name of the counter.
+            value (int): The value of the counter.
+
+        Raises:
+            ValueError: Raised if the task hasn't been started.
+        """
+        if task not in self._task_metrics:
+            raise ValueError(
+                f"Cannot count {name!r}, task {task!r} hasn't been started."
+            )
+        self._task_metrics[task].counters[name] = value
+
+    def start(self) -> None:
+        """
+        Runs all queued tasks in a background thread. The events of the run must be consumed
+        with `iter_events` by the thread that called this method.
+        """
+        self._background = True
+        self._thread = threading.Thread(
+            target=self._run_in_background, name="runner-main", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """
+        Cancels the run. Tasks that are already running will be finished, all remaining tasks are
+        discarded.
+        """
+        log.info("Cancelling all remaining tasks.")
+        self._cancel.set()
+
+    def iter_events(self, block: bool = True) -> Iterator[RunnerEvent]:
+        """
+        Yields the events of a background run. COM-bound tasks are executed on the calling thread
+        before their event is yielded, progress events update the progress variable.
+
+        Args:
+            block (bool, optional): Whether to wait for new events until the run is finished. Use \
+                False to only drain the events that are currently queued (e.g. from a Tk `after` \
+                callback). Defaults to True.
+
+        Yields:
+            RunnerEvent: The next event. The last event of a run is final (`is_final`).
         """
-        self.runners.append(RunnerModel(func=func, name=name, kwargs=kwargs))
+        while True:
+            try:
+                event = self.events.get(block=block)
+            except Empty:
+                return
+
+            self._handle(event)
+            yield event
+            if event.is_final:
+                return
 
     def run_tasks(self) -> None:
-        """Runs all queued tasks."""
+        """
+        Runs all queued tasks. Exceptions raised by a task are re-raised on the calling thread,
+        tasks that haven't been started yet are discarded.
+        """
+        self._metrics.started = time.time()
+        self._metrics.status = "running"
+        start_time = time.perf_counter()
+        try:
+            self._run_tasks()
+        except BaseException:
+            self._metrics.status = "failed"
+            raise
+        else:
+            self._metrics.status = "cancelled" if self.cancelled else "done"
+        finally:
+            self._metrics.finished = time.time()
+            self._metrics.duration = round(time.perf_counter() - start_time, 6)
+
+    def _run_tasks(self) -> None:
+        """Runs all queued tasks, see `run_tasks`."""
         self._update_progress(1)
-        for fn in self.runners:
-            log.info(f"Running task {fn.name!r}.")
-            fn.func(**fn.kwargs)
-            self._update_progress(
-                self.progress_callback.get() + int(100 / len(self.runners))
-            )
-            self.root.update_idletasks()
-        self._update_progress(100)
+
+        pending: List[RunnerModel] = list(self.runners)
+        running: Dict[Future, RunnerModel] = {}
+        done: Set[str] = set()
+
+        def is_ready(task: RunnerModel) -> bool:
+            return all(r in done for r in task.requires)
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="runner"
+        )
+        try:
+            while pending or running:
+                if self.cancelled:
+                    pending.clear()
+
+                for task in [t for t in pending if not t.com and is_ready(t)]:
+                    self._task_started(task)
+                    pending.remove(task)
+                    running[pool.submit(task.func, **task.kwargs)] = task
+
+                if com_task := next(
+                    (t for t in pending if t.com and is_ready(t)), None
+                ):
+                    self._task_started(com_task)
+                    pending.remove(com_task)
+                    try:
+                        self._run_com_task(com_task)
+                    except BaseException as e:
+                        self._record(com_task, error=e)
+                        raise
+                    self._task_done(com_task, done)
+                    continue
+
+                if not running:
+                    if pending:
+                        raise ValueError(
+                            "Cannot resolve the task dependencies of "
+                            f"{[t.name for t in pending]!r}."
+                        )
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task = running.pop(future)
+                    try:
+                        future.result()
+                    except BaseException as e:
+                        self._record(task, error=e)
+                        raise
+                    self._task_done(task, done)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            # Concurrent tasks that were still running when another task failed.
+            for future, task in running.items():
+                if future.cancelled():
+                    self._record(task, cancelled=True)
+                else:
+                    self._record(task, error=future.exception())
+
+        if not self.cancelled:
+            self._update_progress(100)
+
+    def _run_in_background(self) -> None:
+        """Target of the background thread. Posts the final event of the run."""
+        try:
+            self.run_tasks()
+        except BaseException as e:  # pylint: disable=W0718
+            log.error(f"Runner failed: {e}")
+            self._post(RunnerEvent(kind="failed", exception=e))
+        else:
+            self._post(RunnerEvent(kind="cancelled" if self.cancelled else "done"))
+
+    def _run_com_task(self, task: RunnerModel) -> None:
+        """
+        Runs a COM-bound task. In background mode the task is handed over to the consuming
+        thread and this method waits for its result.
+        """
+        if not self._background:
+            task.func(**task.kwargs)
+            return
+
+        future: Future = Future()
+        self._post(RunnerEvent(kind="call", name=task.name, task=task, future=future))
+        future.result()
+
+    def _handle(self, event: RunnerEvent) -> None:
+        """Handles an event on the owning thread."""
+        if event.kind == "call" and event.task and event.future:
+            try:
+                event.future.set_result(event.task.func(**event.task.kwargs))
+            except BaseException as e:  # pylint: disable=W0718
+                event.future.set_exception(e)
+        elif event.kind == "progress" and event.value is not None:
+            self._set_progress_variable(event.value)
+
+    def _post(self, event: RunnerEvent) -> None:
+        """Posts an event to the queue (background mode) or handles it directly."""
+        if self._background:
+            self.events.put(event)
+        else:
+            self._handle(event)
+
+    def _task_started(self, task: RunnerModel) -> None:
+        """Logs the start of a task."""
+        self._perf_starts[task.name] = time.perf_counter()
+        self._task_metrics[task.name] = TaskMetrics(
+            name=task.name, com=task.com, started=time.time()
+        )
+        message = f"Running task {task.name!r}{'' if task.com else ' (concurrent)'}."
+        log.info(message)
+        self._post(RunnerEvent(kind="started", name=task.name))
+        self._post(RunnerEvent(kind="log", name=task.name, message=message))
+
+    def _task_done(self, task: RunnerModel, done: Set[str]) -> None:
+        """Marks the task as done and updates the progress."""
+        done.add(task.name)
+        metrics = self._record(task)
+        log.info(f"Finished task {task.name!r} in {metrics.duration:.3f}s.")
+        self._post(RunnerEvent(kind="finished", name=task.name))
+        self._update_progress(self.progress + int(100 / len(self.runners)))
+
+    def _record(
+        self,
+        task: RunnerModel,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False,
+    ) -> TaskMetrics:
+        """
+        Records the end of a task in its metrics. The size of the output files is only recorded
+        for successful tasks.
+        """
+        metrics = self._task_metrics[task.name]
+        metrics.finished = time.time()
+        metrics.duration = round(time.perf_counter() - self._perf_starts[task.name], 6)
+        if cancelled:
+            metrics.status = "cancelled"
+        elif error is not None:
+            metrics.status = "failed"
+            metrics.error = f"{type(error).__name__}: {error}"
+        else:
+            metrics.status = "ok"
+            metrics.artifacts = {
+                path.name: os.path.getsize(path)
+                for path in task.outputs
+                if os.path.isfile(path)
+            }
+        return metrics
 
     def _update_progress(self, value: int | float) -> None:
+        """Update the progress."""
+        self.progress = value
+        self._post(RunnerEvent(kind="progress", value=value))
+
+    def _set_progress_variable(self, value: int | float) -> None:
         """Update the progress bar."""
-        self.progress_callback.set(value)
-        self.root.update_idletasks()
+        if self.progress_callback is not None:
+            self.progress_callback.set(value)
+        if self.root is not None:
+            self.root.update_idletasks()
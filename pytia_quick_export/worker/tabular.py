@@ -0,0 +1,47 @@
+"""
+    Tabular export task. Writes the data as plain CSV or TSV file.
+"""
+
+import csv
+from pathlib import Path
+from typing import List
+from typing import Literal
+
+from models.data import DataModel
+from pytia.log import log
+from resources import resource
+
+
+def export_tabular(
+    path: Path,
+    data: DataModel,
+    export_format: Literal["csv", "tsv"],
+) -> None:
+    """
+    Exports the data of the document as CSV or TSV file. The file has the same layout as the
+    EXCEL file: The header is written to the header row, the data to the data row.
+    For configuration see the 'excel.json' resource file.
+
+    Args:
+        path (Path): The path into which to save the file.
+        data (DataModel): The documents data to write.
+        export_format (Literal["csv", "tsv"]): The format of the file.
+    """
+    columns = max((datum.index for datum in data.data), default=-1) + 1
+    header: List[str] = [""] * columns
+    values: List[str] = [""] * columns
+    for datum in data.data:
+        header[datum.index] = datum.name
+        if datum.value is not None:
+            values[datum.index] = datum.value
+
+    header_row = resource.excel.header_row
+    rows: List[List[str]] = [[]] * (max(resource.excel.data_row, header_row or 0) + 1)
+    if header_row is not None:
+        rows[header_row] = header
+    rows[resource.excel.data_row] = values
+
+    with open(path, "w", encoding=resource.excel.encoding, newline="") as f:
+        writer = csv.writer(f, delimiter="\t" if export_format == "tsv" else ",")
+        writer.writerows(rows)
+    log.info(f"Saved {export_format} document to {str(path)!r}.")
@@ -0,0 +1,263 @@
+"""
+    Native XLSX writer for the EXCEL export.
+
+    The EXCEL file of a document always has the same shape: One worksheet with the header row and
+    the data row from the excel.json. This writer emits the SpreadsheetML parts for this layout
+    directly into the zip file, without building the object model of openpyxl. The styles are
+    the same as the named styles of the openpyxl export (see excel.py).
+"""
+
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+
+from models.data import DataModel
+from resources import resource
+
+STYLE_HEADER = "pytia header"
+STYLE_DATA_1 = "pytia data 1"
+STYLE_DATA_2 = "pytia data 2"
+STYLE_DEFAULT = "pytia default"
+
+# Characters that are not allowed in xml (the same as in openpyxl.cell.cell).
+ILLEGAL_CHARACTERS = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+INVALID_TITLE_CHARACTERS = re.compile(r"[\\*?:/\[\]]")
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_CONTENT_TYPES = "http://schemas.openxmlformats.org/package/2006/content-types"
+CT_OFFICE = "application/vnd.openxmlformats-officedocument"
+
+CONTENT_TYPES = (
+    f'<Types xmlns="{NS_CONTENT_TYPES}">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    f'ContentType="{CT_OFFICE}.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    f'ContentType="{CT_OFFICE}.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    f'ContentType="{CT_OFFICE}.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+ROOT_RELS = (
+    f'<Relationships xmlns="{NS_PKG_REL}">'
+    f'<Relationship Id="rId1" Type="{NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+WORKBOOK_RELS = (
+    f'<Relationships xmlns="{NS_PKG_REL}">'
+    f'<Relationship Id="rId1" Type="{NS_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{NS_REL}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+DEFAULT_FONT = '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+TEXT_FORMAT_ID = 49  # The builtin number format '@'
+
+
+def get_row_style_name(row: int) -> str:
+    """
+    Returns the name of the style for all cells of a row, as stated in the excel.json.
+
+    Args:
+        row (int): The zero-based index of the row.
+
+    Returns:
+        str: The name of the style.
+    """
+    if row == resource.excel.header_row:
+        return STYLE_HEADER
+    if row > resource.excel.data_row - 1:
+        return STYLE_DATA_1 if row % 2 == 0 else STYLE_DATA_2
+    return STYLE_DEFAULT
+
+
+def can_write_xlsx(title: str, data: DataModel) -> bool:
+    """
+    Returns whether the native writer can write the data. Titles that aren't valid worksheet
+    titles and values with characters that aren't allowed in xml are left to openpyxl.
+
+    Args:
+        title (str): The title of the worksheet.
+        data (DataModel): The documents data to write.
+
+    Returns:
+        bool: True if the native writer can be used.
+    """
+    if not title or len(title) > 31 or INVALID_TITLE_CHARACTERS.search(title):
+        return False
+    for datum in data.data:
+        for value in (datum.name, datum.value):
+            if isinstance(value, str) and ILLEGAL_CHARACTERS.search(value):
+                return False
+    return True
+
+
+def write_xlsx(path: Path, title: str, data: DataModel) -> None:
+    """
+    Writes the data of the document into a XLSX file, with the header row and the data row as
+    stated in the excel.json.
+
+    Args:
+        path (Path): The path into which to save the XLSX file.
+        title (str): The title of the worksheet.
+        data (DataModel): The documents data to write.
+    """
+    header_row = resource.excel.header_row
+    data_row = resource.excel.data_row
+    header: Dict[int, str] = {d.index: d.name for d in data.data}
+    values: Dict[int, str] = {
+        d.index: d.value for d in data.data if d.value is not None
+    }
+    columns = max(header, default=-1) + 1
+    rows = max(data_row, -1 if header_row is None else header_row) + 1
+
+    lengths: Dict[int, int] = {}
+    styles: List[str] = []
+    xml_rows: List[str] = []
+    for row in range(rows):
+        style = get_row_style_name(row)
+        if style not in styles:
+            styles.append(style)
+        style_id = styles.index(style) + 1
+
+        cells = []
+        for column in range(columns):
+            value = None
+            if row == data_row:
+                value = values.get(column)
+            if value is None and row == header_row:
+                value = header.get(column)
+            if value is not None:
+                length = len(str(value))
+                if length > lengths.get(column, 0):
+                    lengths[column] = length
+            cells.append(_cell(f"{_column_letter(column)}{row + 1}", value, style_id))
+
+        height = ' ht="20" customHeight="1"' if row == header_row else ""
+        xml_rows.append(f'<row r="{row + 1}"{height}>{"".join(cells)}</row>')
+
+    cols = "".join(
+        f'<col min="{i + 1}" max="{i + 1}" width="{max(length * 1.1, 2):.16g}" customWidth="1"/>'
+        for i, length in sorted(lengths.items())
+    )
+    dimension = f"A1:{_column_letter(max(columns, 1) - 1)}{max(rows, 1)}"
+    sheet = (
+        f'<worksheet xmlns="{NS_MAIN}">'
+        f'<dimension ref="{dimension}"/>'
+        '<sheetViews><sheetView workbookViewId="0"/></sheetViews>'
+        '<sheetFormatPr defaultRowHeight="15"/>'
+        f'{f"<cols>{cols}</cols>" if cols else ""}'
+        f'<sheetData>{"".join(xml_rows)}</sheetData>'
+        '<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+        "</worksheet>"
+    )
+    workbook = (
+        f'<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}">'
+        f'<sheets><sheet name={quoteattr(title)} sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    )
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zfile:
+        zfile.writestr("[Content_Types].xml", CONTENT_TYPES)
+        zfile.writestr("_rels/.rels", ROOT_RELS)
+        zfile.writestr("xl/workbook.xml", workbook)
+        zfile.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+        zfile.writestr("xl/styles.xml", _styles(styles))
+        zfile.writestr("xl/worksheets/sheet1.xml", sheet)
+
+
+def _column_letter(index: int) -> str:
+    """Returns the letter of the column by its zero-based index."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell(reference: str, value: Optional[str | int | float], style_id: int) -> str:
+    """Returns the xml of a cell. Text is written as inline string."""
+    if value is None:
+        return f'<c r="{reference}" s="{style_id}"/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{reference}" s="{style_id}"><v>{value}</v></c>'
+
+    text = str(value)
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return (
+        f'<c r="{reference}" s="{style_id}" t="inlineStr">'
+        f"<is><t{space}>{escape(text)}</t></is></c>"
+    )
+
+
+def _argb(color: str) -> str:
+    """Returns the color as ARGB value, as openpyxl does for RGB values."""
+    return color if len(color) == 8 else f"00{color}"
+
+
+def _styles(names: List[str]) -> str:
+    """Returns the xml of the stylesheet, with a named style for each of the given styles."""
+    fonts = [DEFAULT_FONT]
+    fills = [
+        "<fill><patternFill/></fill>",
+        '<fill><patternFill patternType="gray125"/></fill>',
+    ]
+    xfs = ['<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>']
+    cell_styles = ['<cellStyle name="Normal" xfId="0" builtinId="0"/>']
+
+    for name in names:
+        bold = '<b val="1"/>' if name == STYLE_HEADER else ""
+        horizontal = "center" if name == STYLE_HEADER else "left"
+        color, bg_color = {
+            STYLE_HEADER: (resource.excel.header_color, resource.excel.header_bg_color),
+            STYLE_DATA_1: (resource.excel.data_color_1, resource.excel.data_bg_color_1),
+            STYLE_DATA_2: (resource.excel.data_color_2, resource.excel.data_bg_color_2),
+        }.get(name, (None, None))
+
+        font_color = f'<color rgb="{_argb(color)}"/>' if color else ""
+        fonts.append(
+            f'<font>{bold}<sz val="{resource.excel.size}"/>{font_color}'
+            f"<name val={quoteattr(resource.excel.font)}/></font>"
+        )
+        fill_id = 0
+        if bg_color:
+            fill_id = len(fills)
+            fills.append(
+                '<fill><patternFill patternType="solid">'
+                f'<fgColor rgb="{_argb(bg_color)}"/><bgColor rgb="{_argb(bg_color)}"/>'
+                "</patternFill></fill>"
+            )
+
+        xfs.append(
+            f'<xf numFmtId="{TEXT_FORMAT_ID}" fontId="{len(fonts) - 1}" fillId="{fill_id}" '
+            'borderId="0" applyNumberFormat="1" applyFont="1" applyFill="1" '
+            f'applyAlignment="1"><alignment horizontal="{horizontal}" vertical="center"/></xf>'
+        )
+        cell_styles.append(
+            f'<cellStyle name={quoteattr(name)} xfId="{len(cell_styles)}"/>'
+        )
+
+    cell_xfs = [xfs[0].replace("/>", ' xfId="0"/>')]
+    for index, xf in enumerate(xfs[1:], start=1):
+        cell_xfs.append(xf.replace("<xf ", f'<xf xfId="{index}" ', 1))
+
+    return (
+        f'<styleSheet xmlns="{NS_MAIN}">'
+        f'<fonts count="{len(fonts)}">{"".join(fonts)}</fonts>'
+        f'<fills count="{len(fills)}">{"".join(fills)}</fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+        "</borders>"
+        f'<cellStyleXfs count="{len(xfs)}">{"".join(xfs)}</cellStyleXfs>'
+        f'<cellXfs count="{len(cell_xfs)}">{"".join(cell_xfs)}</cellXfs>'
+        f'<cellStyles count="{len(cell_styles)}">{"".join(cell_styles)}</cellStyles>'
+        "</styleSheet>"
+    )
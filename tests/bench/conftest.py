@@ -0,0 +1,110 @@
+"""
+    Configuration of the benchmark suite.
+
+    The size of the synthetic data and the output file are set with environment variables:
+
+    - BENCH_COLUMNS: The number of columns of each DataModel (default 60).
+    - BENCH_ROWS: The number of DataModels for multi row exports (default 200).
+    - BENCH_REPEAT: How often each benchmark is repeated (default 5).
+    - BENCH_OUTPUT: The json file into which the results are written \
+        (default tests/bench/results/bench_VERSION.json).
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import pytest
+
+BENCH_COLUMNS = int(os.environ.get("BENCH_COLUMNS", 60))
+BENCH_ROWS = int(os.environ.get("BENCH_ROWS", 200))
+BENCH_REPEAT = int(os.environ.get("BENCH_REPEAT", 5))
+
+
+class Bench:
+    """Times functions and records their peak memory usage."""
+
+    def __init__(self, repeat: int) -> None:
+        self.repeat = repeat
+        self.results: Dict[str, Dict[str, float]] = {}
+
+    def run(
+        self,
+        name: str,
+        func: Callable,
+        setup: Optional[Callable[[], Tuple[Any, ...]]] = None,
+    ) -> Dict[str, float]:
+        """
+        Runs the function `repeat` times and once more with tracemalloc enabled, so the memory
+        tracing doesn't distort the timing.
+
+        Args:
+            name (str): The name of the benchmark in the results.
+            func (Callable): The function to benchmark.
+            setup (Optional[Callable[[], Tuple[Any, ...]]], optional): Creates the arguments \
+                of the function before each run, not included in the timing. Defaults to None.
+
+        Returns:
+            Dict[str, float]: The min and mean duration in seconds and the peak memory in bytes.
+        """
+        times = []
+        for _ in range(self.repeat):
+            args = setup() if setup else ()
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+
+        args = setup() if setup else ()
+        tracemalloc.start()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.results[name] = {
+            "min": min(times),
+            "mean": statistics.mean(times),
+            "peak_memory": peak,
+        }
+        return self.results[name]
+
+
+@pytest.fixture(scope="session")
+def bench():
+    from pytia_quick_export.const import APP_VERSION
+
+    bench = Bench(repeat=BENCH_REPEAT)
+    yield bench
+
+    output = Path(
+        os.environ.get(
+            "BENCH_OUTPUT",
+            Path(os.path.dirname(__file__), "results", f"bench_{APP_VERSION}.json"),
+        )
+    )
+    os.makedirs(output.parent, exist_ok=True)
+    with open(output, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "app_version": APP_VERSION,
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "columns": BENCH_COLUMNS,
+                "rows": BENCH_ROWS,
+                "repeat": BENCH_REPEAT,
+                "results": bench.results,
+            },
+            f,
+            indent=4,
+        )
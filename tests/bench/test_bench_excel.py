@@ -0,0 +1,149 @@
+"""
+    Benchmarks of the excel export.
+"""
+
+import tempfile
+from pathlib import Path
+
+from openpyxl.workbook import Workbook
+
+from .conftest import BENCH_COLUMNS
+from .conftest import BENCH_ROWS
+
+
+def make_data(columns: int = BENCH_COLUMNS, row: int = 0):
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+
+    return DataModel(
+        data=[
+            DatumModel(index=i, name=f"Column {i}", value=f"Value {row}-{i}")
+            for i in range(columns)
+        ]
+    )
+
+
+def make_rows(rows: int = BENCH_ROWS, columns: int = BENCH_COLUMNS):
+    for row in range(rows):
+        yield make_data(columns=columns, row=row)
+
+
+def make_worksheet():
+    from pytia_quick_export.worker.excel import ColumnWidths
+    from pytia_quick_export.worker.excel import ExcelStyles
+
+    workbook = Workbook()
+    return workbook.active, ColumnWidths(), ExcelStyles(workbook=workbook)
+
+
+def test_bench_export_excel(bench):
+    from pytia_quick_export.worker.excel import export_excel
+
+    data = make_data()
+    with tempfile.TemporaryDirectory() as folder:
+        result = bench.run(
+            "export_excel",
+            lambda: export_excel(
+                path=Path(folder, "bench.xlsx"),
+                selected_project="BENCH",
+                data=data,
+                source="made",
+            ),
+        )
+    assert result["min"] > 0
+
+
+def test_bench_export_excel_openpyxl(bench):
+    from pytia_quick_export.worker.excel import _export_excel_openpyxl
+
+    data = make_data()
+    with tempfile.TemporaryDirectory() as folder:
+        result = bench.run(
+            "_export_excel_openpyxl",
+            lambda: _export_excel_openpyxl(
+                path=Path(folder, "bench.xlsx"), selected_project="BENCH", data=data
+            ),
+        )
+    assert result["min"] > 0
+
+
+def test_bench_write_data(bench):
+    from pytia_quick_export.worker.excel import _write_data
+
+    data = make_data()
+    result = bench.run(
+        "_write_data",
+        lambda ws, widths, styles: _write_data(
+            worksheet=ws, data=data, widths=widths, styles=styles
+        ),
+        setup=make_worksheet,
+    )
+    assert result["min"] > 0
+
+
+def test_bench_style_worksheet(bench):
+    from pytia_quick_export.worker.excel import _style_worksheet
+    from pytia_quick_export.worker.excel import _write_data
+
+    data = make_data()
+
+    def setup():
+        worksheet, widths, styles = make_worksheet()
+        _write_data(worksheet=worksheet, data=data, widths=widths, styles=styles)
+        return worksheet, widths, styles
+
+    result = bench.run(
+        "_style_worksheet",
+        lambda ws, widths, styles: _style_worksheet(
+            worksheet=ws, widths=widths, styles=styles
+        ),
+        setup=setup,
+    )
+    assert result["min"] > 0
+
+
+def test_bench_style_worksheet_per_cell(bench):
+    # The previous implementation, which creates the styles for every single cell.
+    from pytia_quick_export.worker.excel import _write_data
+    from tests.test_excel import style_worksheet_per_cell
+
+    data = make_data()
+
+    def setup():
+        worksheet, widths, styles = make_worksheet()
+        _write_data(worksheet=worksheet, data=data, widths=widths, styles=styles)
+        return (worksheet,)
+
+    result = bench.run(
+        "style_worksheet_per_cell", style_worksheet_per_cell, setup=setup
+    )
+    assert result["min"] > 0
+
+
+def test_bench_export_excel_rows(bench):
+    from pytia_quick_export.worker.excel import export_excel_rows
+
+    with tempfile.TemporaryDirectory() as folder:
+        result = bench.run(
+            "export_excel_rows",
+            lambda: export_excel_rows(
+                path=Path(folder, "bench.xlsx"),
+                selected_project="BENCH",
+                data=make_rows(),
+            ),
+        )
+    assert result["min"] > 0
+
+
+def test_bench_export_tabular(bench):
+    from pytia_quick_export.worker.tabular import export_tabular
+
+    data = make_data()
+    with tempfile.TemporaryDirectory() as folder:
+        result = bench.run(
+            "export_tabular",
+            lambda: export_tabular(
+                path=Path(folder, "bench.csv"), data=data, export_format="csv"
+            ),
+        )
+    assert result["min"] > 0
@@ -0,0 +1,18 @@
+"""
+    Benchmarks of the startup of the gui.
+"""
+
+import os
+import subprocess
+import sys
+
+
+def test_bench_import(bench):
+    code = "import gui"
+    cwd = os.path.join(os.path.dirname(__file__), "..", "..", "pytia_quick_export")
+
+    # The import is timed in a new interpreter, including the interpreter startup.
+    bench.run(
+        "import_gui",
+        lambda: subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True),
+    )
@@ -0,0 +1,39 @@
+"""
+    Benchmarks of the resources.
+"""
+
+import os
+import subprocess
+import sys
+
+from tests.conftest import make_users
+
+
+def test_bench_user_lookups(bench):
+    from pytia_quick_export.resources import Resources
+
+    # The lookup cost doesn't depend on the number of users, compare both results.
+    for count in (10, 20000):
+        resources = Resources()
+        resources._index_users(make_users(count))
+        logon = f"user{count - 1}"
+        name = f"User {count - 1}"
+
+        def lookups() -> None:
+            for _ in range(2000):
+                resources.logon_exists(logon)
+                resources.get_user_by_logon(logon)
+                resources.get_user_by_name(name)
+
+        bench.run(f"user_lookups_{count}", lookups)
+
+
+def test_bench_import(bench):
+    code = "import resources"
+    cwd = os.path.join(os.path.dirname(__file__), "..", "..", "pytia_quick_export")
+
+    # The import is timed in a new interpreter, including the interpreter startup.
+    bench.run(
+        "import_resources",
+        lambda: subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True),
+    )
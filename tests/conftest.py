@@ -0,0 +1,90 @@
+"""
+    Shared fixtures and fakes of the test suite.
+
+    The app modules import each other as top level modules (e.g. `from resources import
+    resource`), the tests import them from the `pytia_quick_export` package. Those are two
+    different module objects: Always patch the object through the module under test, e.g.
+    `monkeypatch.setattr(tabular.resource.excel, ...)`.
+"""
+
+from types import MappingProxyType
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+import pytest
+
+
+class FakeProperty:
+    """A user property of a document."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+class FakeProperties:
+    """The user properties of a document, counts the calls as COM calls."""
+
+    def __init__(self, values: dict) -> None:
+        self.values = values
+        self.calls = 0
+
+    def exists(self, name: str) -> bool:
+        self.calls += 1
+        return name in self.values
+
+    def get_by_name(self, name: str) -> FakeProperty:
+        self.calls += 1
+        return FakeProperty(self.values[name])
+
+
+class FakeCollection:
+    """A CATIA collection, the items are one based."""
+
+    def __init__(self, items: list) -> None:
+        self.items = items
+
+    @property
+    def count(self) -> int:
+        return len(self.items)
+
+    def item(self, index: int):
+        return self.items[index - 1]
+
+
+def make_users(count: int) -> list:
+    """Returns the given number of users, the logon and the name are numbered."""
+    from pytia_quick_export.resources import User
+
+    return [
+        User(logon=f"user{i}", id=str(i), name=f"User {i}", mail=f"user{i}@foo.bar")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def make_snapshot() -> Callable:
+    """
+    Returns a factory for property snapshots of a made part. The user properties are given as
+    dict, the product attributes can be overwritten as keyword arguments.
+    """
+    from pytia_quick_export.helper.snapshot import PropertySnapshot
+
+    def factory(
+        properties: Optional[Dict[str, str]] = None, **attributes
+    ) -> PropertySnapshot:
+        return PropertySnapshot(
+            **{
+                "partnumber": "PN-001",
+                "revision": "2",
+                "definition": "Bracket",
+                "source": 1,
+                "description": "Sheet metal bracket",
+                "is_part": True,
+                "language": "en",
+                **attributes,
+                "properties": MappingProxyType(dict(properties or {})),
+            }
+        )
+
+    return factory
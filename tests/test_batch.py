@@ -0,0 +1,158 @@
+"""
+    Test the worker/batch.py file.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from openpyxl import load_workbook
+
+from tests.conftest import FakeProperties
+
+
+class FakeParameters:
+    def __init__(self) -> None:
+        self.probes = 0
+
+    def get_item(self, name: str) -> str:
+        from pytia_quick_export.resources import resource
+
+        self.probes += 1
+        if name != resource.keywords.en.partnumber:
+            raise Exception("Parameter not found.")
+        return name
+
+
+class FakeProduct:
+    def __init__(self, part_number: str, source: int, parameters: FakeParameters):
+        self.part_number = part_number
+        self.revision = "1"
+        self.definition = "Definition"
+        self.source = source
+        self.description_reference = "Description"
+        self.parameters = parameters
+
+    def is_catpart(self) -> bool:
+        return True
+
+
+class FakeDocument:
+    def __init__(self, part_number: str, source: int, parameters: FakeParameters):
+        self.product = FakeProduct(part_number, source, parameters)
+        self.properties = FakeProperties({})
+
+
+class FakeBackend:
+    """Serves in-memory documents, the source is encoded in the file name."""
+
+    def __init__(self) -> None:
+        self.parameters = FakeParameters()
+        self.opened = []
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[FakeDocument]:
+        self.opened.append(path)
+        source = 2 if "bought" in path.stem else 0
+        yield FakeDocument(path.stem, source, self.parameters)
+
+
+def make_items(tmp_path: Path, names: list, condition: str) -> list:
+    from pytia_quick_export.models.export import BatchItem
+
+    items = []
+    for name in names:
+        path = Path(tmp_path, f"{name}.CATPart")
+        path.touch()
+        items.append(
+            BatchItem(
+                path=path,
+                project="P1",
+                condition=condition,
+                quantity=1,
+                folder=str(tmp_path),
+            )
+        )
+    return items
+
+
+def test_read_manifest(tmp_path: Path):
+    from pytia_quick_export.worker.batch import read_manifest
+
+    manifest = Path(tmp_path, "manifest.json")
+    with open(manifest, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "folder": str(tmp_path),
+                "condition": "New",
+                "items": [
+                    {"path": "A.CATPart", "project": "P1", "quantity": 2},
+                    {"path": "B.CATPart", "project": "P2", "quantity": 1, "folder": ""},
+                ],
+            },
+            f,
+        )
+
+    items = read_manifest(manifest)
+    assert [i.path for i in items] == [Path("A.CATPart"), Path("B.CATPart")]
+    assert [i.folder for i in items] == [str(tmp_path), ""]
+    assert all(i.condition == "New" for i in items)
+
+
+def test_batch_export(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export.resources import resource
+    from pytia_quick_export.worker import excel
+    from pytia_quick_export.worker import metrics
+    from pytia_quick_export.worker.batch import BatchExporter
+
+    monkeypatch.setattr(metrics, "LOGS", str(tmp_path))
+
+    backend = FakeBackend()
+    condition = resource.settings.condition.new.name
+    items = make_items(tmp_path, ["bought_a", "bought_b", "unset"], condition)
+    items += make_items(tmp_path, ["bought_c"], "Invalid condition")
+    items += make_items(tmp_path, ["missing"], condition)
+    os.remove(items[-1].path)
+    report_path = Path(tmp_path, "report.json")
+    summary_path = Path(tmp_path, "summary.xlsx")
+
+    results = BatchExporter(backend=backend).run(
+        items=items, report_path=report_path, summary_path=summary_path
+    )
+
+    assert [r.status for r in results] == ["ok", "ok", "skipped", "failed", "skipped"]
+    assert "Invalid condition" in str(results[3].error)
+    for result in results[:2]:
+        assert len(result.files) == 1
+        assert result.files[0].endswith(".xlsx")
+        assert os.path.exists(result.files[0])
+
+    # The language is detected once for the whole batch, missing files are never opened.
+    assert backend.parameters.probes == 1
+    assert len(backend.opened) == 4
+
+    with open(report_path, "r", encoding="utf8") as f:
+        report = json.load(f)
+    assert [r["status"] for r in report] == [r.status for r in results]
+
+    # Each exported item appends its task metrics to the metrics file.
+    with open(Path(tmp_path, metrics.LOG_METRICS), "r", encoding="utf8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 2
+    assert "bought_a" in lines[0]["document"] and "bought_b" in lines[1]["document"]
+    assert all(line["status"] == "done" and line["batch"] for line in lines)
+
+    # The exported items are written into one summary sheet per source, one row per item.
+    assert not os.path.exists(Path(tmp_path, "summary_made.xlsx"))
+    worksheet = load_workbook(Path(tmp_path, "summary_bought.xlsx")).active
+    data_row = excel.resource.excel.data_row
+    assert worksheet.max_row == data_row + 2
+    rows = [
+        [str(cell.value) for cell in row]
+        for row in worksheet.iter_rows(min_row=data_row + 1)
+    ]
+    assert any("bought_a" in value for value in rows[0])
+    assert any("bought_b" in value for value in rows[1])
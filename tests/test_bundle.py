@@ -0,0 +1,87 @@
+"""
+    Test the bundle.py file.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def test_roundtrip():
+    from pytia_quick_export.bundle import dump_bundle
+    from pytia_quick_export.bundle import load_bundle
+
+    configs = {"settings": {"title": "Foo", "debug": False}, "users": [{"logon": "a"}]}
+
+    assert load_bundle(dump_bundle(configs)) == configs
+
+
+def test_corrupted_bundle():
+    from pytia_quick_export.bundle import dump_bundle
+    from pytia_quick_export.bundle import load_bundle
+
+    raw = bytearray(dump_bundle({"settings": {"title": "Foo"}}))
+    raw[-1] ^= 0xFF
+
+    with pytest.raises(ValueError):
+        load_bundle(bytes(raw))
+    with pytest.raises(ValueError):
+        load_bundle(b"not a bundle")
+
+
+def test_stale_bundle(monkeypatch):
+    from pytia_quick_export import bundle
+
+    raw = bundle.dump_bundle({"settings": {"title": "Foo"}})
+    monkeypatch.setattr(bundle, "APP_VERSION", "0.0.0")
+
+    with pytest.raises(ValueError):
+        bundle.load_bundle(raw)
+
+
+def test_resources_bundle_matches_json():
+    from pytia_quick_export.bundle import dump_bundle
+    from pytia_quick_export.bundle import load_bundle
+    from pytia_quick_export.bundle import read_configs
+    from pytia_quick_export.resources import Resources
+
+    configs = load_bundle(
+        dump_bundle(read_configs(Path("./pytia_quick_export/resources")))
+    )
+    resource = Resources(use_bundle=False)
+
+    assert configs["settings"]["title"] == resource.settings.title
+    assert len(configs["users"]) == len(resource.users)
+    assert configs["excel"]["header_items_made"] == resource.excel.header_items_made
+
+
+def test_bundle_does_not_import_resources():
+    # The build script creates the bundle, the runtime resources must not be initialized.
+    code = (
+        "import sys; from pathlib import Path; import bundle; "
+        "bundle.read_configs(Path('resources')); print('resources' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.join(os.path.dirname(__file__), "..", "pytia_quick_export"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_validate_configs():
+    from pytia_quick_export.bundle import read_configs
+    from pytia_quick_export.resources import Resources
+
+    configs = read_configs(Path("./pytia_quick_export/resources"))
+    Resources(configs=configs).validate()
+
+    # A config that doesn't match its dataclass fails the validation (and thus the build).
+    configs["settings"] = {**configs["settings"], "unknown_key": True}
+    with pytest.raises(TypeError):
+        Resources(configs=configs).validate()
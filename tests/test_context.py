@@ -0,0 +1,100 @@
+"""
+    Test the helper/context.py file.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+
+@pytest.fixture
+def users(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Serves the users from a dict, returns the logons that have been looked up."""
+    from pytia_quick_export.helper import context
+
+    names = {"jdoe": "Jane Doe"}
+    calls = []
+
+    class FakeUser:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    def logon_exists(logon=None):
+        calls.append(logon)
+        return logon in names
+
+    # Patch the resources instance that is used by the context.
+    resource = context.resource
+    monkeypatch.setattr(resource, "logon_exists", logon_exists)
+    monkeypatch.setattr(
+        resource, "get_user_by_logon", lambda logon=None: FakeUser(names[logon])
+    )
+    monkeypatch.setattr(
+        resource.settings,
+        "export",
+        replace(resource.settings.export, apply_username=True),
+    )
+    return calls
+
+
+def test_render_context(users: list, make_snapshot):
+    from pytia_quick_export.const import KEEP
+    from pytia_quick_export.const import LOGON
+    from pytia_quick_export.helper import context
+    from pytia_quick_export.helper.context import create_render_context
+
+    resource = context.resource
+    snapshot = make_snapshot(
+        {
+            resource.props.project: "P0",
+            resource.props.creator: "jdoe",
+            resource.props.modifier: "someone",
+        }
+    )
+    render_context = create_render_context(
+        snapshot=snapshot,
+        project=KEEP,
+        condition=resource.settings.condition.new.name,
+        quantity=3,
+    )
+
+    assert render_context.project == "P0"
+    assert render_context.creator == "Jane Doe"
+    assert render_context.modifier == "someone"
+    assert render_context.publisher == LOGON
+    assert not render_context.overwrites
+    assert render_context.get_property(resource.props.creator) == "Jane Doe"
+    assert render_context.get_property(resource.props.project) == "P0"
+    assert render_context.get_property("pytia.missing") == ""
+    assert render_context.arguments["quantity"] == 3
+
+    # The creator, the modifier and the publisher are looked up once, when the context is
+    # created. Reading the context doesn't look them up again.
+    assert sorted(users) == sorted(["jdoe", "someone", LOGON])
+    for _ in range(3):
+        render_context.get_property(resource.props.creator)
+        _ = render_context.arguments
+    assert len(users) == 3
+
+
+def test_render_context_of_modified_condition(users: list, make_snapshot):
+    from pytia_quick_export.helper import context
+    from pytia_quick_export.helper.context import create_render_context
+
+    resource = context.resource
+    overwrite = resource.settings.condition.mod.overwrite
+    snapshot = make_snapshot({name: "Original" for name in overwrite})
+    render_context = create_render_context(
+        snapshot=snapshot,
+        project="P1",
+        condition=resource.settings.condition.mod.name,
+        quantity=1,
+    )
+
+    assert overwrite
+    assert render_context.project == "P1"
+    assert render_context.creator is None
+    assert render_context.arguments["creator"] == "Unknown"
+    for name, value in overwrite.items():
+        assert render_context.get_property(name) == value
+        assert render_context.arguments[name] == value
@@ -0,0 +1,218 @@
+"""
+    Test the worker/docket.py file.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeRenderer:
+    """Records the calls of the docket session."""
+
+    def __init__(self, fail_export: bool = False) -> None:
+        self.calls = []
+        self.filled = []
+        self.fail_export = fail_export
+
+    def fill(self, template: Path, document, config, values: dict) -> None:
+        self.calls.append("fill")
+        self.filled.append(values)
+
+    def export_pdf(self, path: Path) -> None:
+        self.calls.append("export")
+        if self.fail_export:
+            raise Exception("Export failed.")
+        path.touch()
+
+    def discard(self) -> None:
+        self.calls.append("discard")
+
+
+@pytest.fixture
+def configs(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Records the docket configs that are validated by pytia's DocketConfig."""
+    from pytia_quick_export.worker import docket
+
+    calls = []
+
+    def from_dict(config: dict):
+        calls.append(config)
+        return SimpleNamespace(config=config)
+
+    monkeypatch.setattr(docket, "DocketConfig", SimpleNamespace(from_dict=from_dict))
+    monkeypatch.setattr(docket.resource, "_docket", {"texts": []})
+    return calls
+
+
+def test_pytia_renderer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export.worker import docket
+
+    calls = []
+    drawing = SimpleNamespace(close=lambda: calls.append("close"))
+
+    def create_docket_from_template(**kwargs):
+        calls.append(("create", kwargs))
+        return drawing
+
+    def export_docket_as_pdf(**kwargs):
+        calls.append(("export", kwargs))
+
+    monkeypatch.setattr(
+        docket, "create_docket_from_template", create_docket_from_template
+    )
+    monkeypatch.setattr(docket, "export_docket_as_pdf", export_docket_as_pdf)
+
+    renderer = docket.PytiaDocketRenderer()
+    renderer.fill(
+        template=Path(tmp_path, "docket.CATDrawing"),
+        document="DOCUMENT",  # type: ignore
+        config="CONFIG",  # type: ignore
+        values={"quantity": 2},
+    )
+    renderer.export_pdf(Path(tmp_path, "a.pdf"))
+    renderer.discard()
+
+    assert calls == [
+        (
+            "create",
+            {
+                "template": Path(tmp_path, "docket.CATDrawing"),
+                "document": "DOCUMENT",
+                "config": "CONFIG",
+                "hide_unknown_properties": True,
+                "quantity": 2,
+            },
+        ),
+        (
+            "export",
+            {"docket": drawing, "name": "a.pdf", "folder": tmp_path.resolve()},
+        ),
+    ]
+
+    # A docket that hasn't been exported is closed on discard.
+    renderer.fill(
+        template=Path(tmp_path), document=None, config=None, values={}  # type: ignore
+    )
+    renderer.discard()
+    assert calls[-1] == "close"
+
+
+def test_session_validates_config_once(configs: list, tmp_path: Path):
+    from pytia_quick_export.worker.docket import DocketSession
+
+    renderer = FakeRenderer()
+    with DocketSession(renderer=renderer, template=Path(tmp_path)) as session:
+        for i in range(3):
+            session.export(path=Path(tmp_path, f"{i}.pdf"), document=None, values={})
+
+    assert session.exports == 3
+    assert configs == [{"texts": []}]
+    assert renderer.calls == ["fill", "export"] * 3
+    assert all(Path(tmp_path, f"{i}.pdf").exists() for i in range(3))
+
+
+def test_session_writes_images(configs: list, tmp_path: Path):
+    from pytia_quick_export.worker.docket import DocketSession
+
+    renderer = FakeRenderer()
+    with DocketSession(renderer=renderer, template=Path(tmp_path)) as session:
+        for i in range(2):
+            session.export(
+                path=Path(tmp_path, f"{i}.pdf"),
+                document=None,
+                values={"quantity": 1, "qr_image": b"\x89PNG"},
+            )
+        path = renderer.filled[0]["qr_path"]
+
+        # The image is written once and passed by its path argument.
+        assert renderer.filled == [{"quantity": 1, "qr_path": path}] * 2
+        assert path.read_bytes() == b"\x89PNG"
+
+    assert not path.exists()
+
+
+def test_session_discards_failed_docket(configs: list, tmp_path: Path):
+    from pytia_quick_export.worker.docket import DocketSession
+
+    renderer = FakeRenderer(fail_export=True)
+    with DocketSession(renderer=renderer, template=Path(tmp_path)) as session:
+        with pytest.raises(Exception, match="Export failed."):
+            session.export(path=Path(tmp_path, "a.pdf"), document=None, values={})
+
+    assert session.exports == 0
+    assert renderer.calls == ["fill", "export", "discard"]
+
+
+def test_session_without_template(
+    configs: list, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    from pytia.exceptions import PytiaFileOperationError
+
+    from pytia_quick_export.templates import templates
+    from pytia_quick_export.worker.docket import DocketSession
+
+    monkeypatch.setattr(templates, "_docket_path", None)
+    renderer = FakeRenderer()
+    with pytest.raises(PytiaFileOperationError):
+        DocketSession(renderer=renderer).export(
+            path=Path(tmp_path, "a.pdf"), document=None, values={}
+        )
+    assert not renderer.calls
+
+
+def test_session_with_invalid_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    from pytia.exceptions import PytiaValueError
+
+    from pytia_quick_export.worker import docket
+    from pytia_quick_export.worker.docket import DocketSession
+
+    def from_dict(config: dict):
+        return config["texts"]
+
+    monkeypatch.setattr(docket, "DocketConfig", SimpleNamespace(from_dict=from_dict))
+    monkeypatch.setattr(docket.resource, "_docket", {"views": []})
+    renderer = FakeRenderer()
+    with pytest.raises(PytiaValueError):
+        DocketSession(renderer=renderer, template=Path(tmp_path)).export(
+            path=Path(tmp_path, "a.pdf"), document=None, values={}
+        )
+    assert not renderer.calls
+
+
+def test_export_docket(configs: list, tmp_path: Path, make_snapshot):
+    from pytia_quick_export.helper.context import RenderContext
+    from pytia_quick_export.resources import resource
+    from pytia_quick_export.worker.docket import DocketSession
+    from pytia_quick_export.worker.docket import export_docket
+
+    context = RenderContext(
+        snapshot=make_snapshot({}),
+        project="P1",
+        condition=resource.settings.condition.new.name,
+        quantity=2,
+        creator="Jane Doe",
+        modifier=None,
+        publisher="John Doe",
+    )
+    renderer = FakeRenderer()
+    with DocketSession(renderer=renderer, template=Path(tmp_path)) as session:
+        export_docket(
+            path=Path(tmp_path, "a.pdf"),
+            document=None,  # type: ignore
+            context=context,
+            session=session,
+            note="Deburr",
+        )
+
+    assert renderer.calls == ["fill", "export"]
+    values = renderer.filled[0]
+    assert {name: values[name] for name in ("project", "quantity", "note")} == {
+        "project": "P1",
+        "quantity": 2,
+        "note": "Deburr",
+    }
+    assert values["creator"] == "Jane Doe"
+    assert values["modifier"] == "Unknown"
+    assert values["publisher"] == "John Doe"
@@ -0,0 +1,205 @@
+"""
+    Test the worker/drawing.py file.
+"""
+
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tests.conftest import FakeCollection
+
+
+class FakeView:
+    def __init__(self, name: str, locked: bool) -> None:
+        self.name = name
+        self._locked = locked
+        self.writes = 0
+
+    @property
+    def lock_status(self) -> bool:
+        return self._locked
+
+    @lock_status.setter
+    def lock_status(self, value: bool) -> None:
+        self.writes += 1
+        self._locked = value
+
+
+class FakeDrawing:
+    def __init__(self, path: Path, locked: list) -> None:
+        self.full_name = str(path)
+        self.com_object = self
+        views = [FakeView("Main", False), FakeView("Background", False)]
+        views += [FakeView(f"View.{i}", state) for i, state in enumerate(locked)]
+        self.sheets = FakeCollection(
+            [SimpleNamespace(name="Sheet.1", views=FakeCollection(views))]
+        )
+        self.exports = []
+        self.saves = 0
+
+    @property
+    def views(self) -> list:
+        return self.sheets.item(1).views.items
+
+    def export_data(self, path: Path, export_format: str, overwrite: bool) -> None:
+        self.exports.append((path, export_format))
+
+    def save(self) -> None:
+        self.saves += 1
+
+
+@pytest.fixture
+def catia(monkeypatch: pytest.MonkeyPatch):
+    """Patches the CATIA framework, the documents are served from a list."""
+    import pytia.framework
+    from pycatia.drafting_interfaces import drawing_document
+
+    application = SimpleNamespace(documents=FakeCollection([]), refresh_display=True)
+    monkeypatch.setattr(
+        pytia.framework, "framework", SimpleNamespace(catia=application)
+    )
+    monkeypatch.setattr(drawing_document, "DrawingDocument", lambda com: com)
+    return application
+
+
+@pytest.fixture
+def open_drawing(monkeypatch: pytest.MonkeyPatch) -> list:
+    """
+    Patches the drawing document wrapper. The drawings that are opened by the export are
+    served from the returned list.
+    """
+    from pytia_quick_export.worker import drawing
+
+    drawings = []
+
+    class FakePyDrawingDocument:
+        def __enter__(self) -> "FakePyDrawingDocument":
+            return self
+
+        def __exit__(self, *_) -> None:
+            pass
+
+        def open(self, path: Path) -> None:
+            self.drawing_document = next(
+                d for d in drawings if d.full_name == str(path)
+            )
+
+    monkeypatch.setattr(drawing, "PyDrawingDocument", FakePyDrawingDocument)
+    return drawings
+
+
+@pytest.fixture
+def lock_views(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enables the `lock_drawing_views` setting of the resources used by the export."""
+    from pytia_quick_export.worker import drawing
+
+    settings = drawing.resource.settings
+    monkeypatch.setattr(
+        settings, "export", replace(settings.export, lock_drawing_views=True)
+    )
+
+
+def test_get_drawing_path(tmp_path: Path, make_snapshot):
+    from pytia_quick_export.const import PROP_DRAWING_PATH
+    from pytia_quick_export.worker.drawing import get_drawing_path
+
+    workspace = SimpleNamespace(workspace_folder=tmp_path)
+    assert get_drawing_path(make_snapshot()) is None
+    assert get_drawing_path(
+        make_snapshot({PROP_DRAWING_PATH: ".\\drawings\\A.CATDrawing"}),
+        workspace=workspace,  # type: ignore
+    ) == Path(tmp_path, "drawings\\A.CATDrawing")
+    assert (
+        get_drawing_path(make_snapshot({PROP_DRAWING_PATH: str(tmp_path)})) == tmp_path
+    )
+
+
+def test_export_reused_drawing_is_not_saved(
+    tmp_path: Path, catia: SimpleNamespace, lock_views: None, make_snapshot
+):
+    from pytia_quick_export.const import PROP_DRAWING_PATH
+    from pytia_quick_export.worker import drawing
+
+    path = Path(tmp_path, "A.CATDrawing")
+    path.touch()
+    fake = FakeDrawing(path, locked=[True, False])
+    catia.documents.items.append(fake)
+    paths = {fmt: Path(tmp_path, f"A.{fmt}") for fmt in ("pdf", "dxf", "svg")}
+
+    locked = drawing.export_drawing(
+        paths=paths,
+        document=SimpleNamespace(document=SimpleNamespace(name="A.CATPart")),
+        snapshot=make_snapshot({PROP_DRAWING_PATH: str(path)}),
+        interactive=False,
+    )
+
+    # The open drawing is reused, each format is exported once. The drawing of the user may
+    # hold unsaved changes, hence it's neither locked nor saved.
+    assert fake.exports == [(p, fmt) for fmt, p in paths.items()]
+    assert locked == 0
+    assert not any(v.writes for v in fake.views)
+    assert fake.saves == 0
+    assert catia.refresh_display
+
+
+def test_export_drawing(
+    tmp_path: Path,
+    catia: SimpleNamespace,
+    open_drawing: list,
+    lock_views: None,
+    make_snapshot,
+):
+    from pytia_quick_export.const import PROP_DRAWING_PATH
+    from pytia_quick_export.worker import drawing
+
+    path = Path(tmp_path, "A.CATDrawing")
+    path.touch()
+    fake = FakeDrawing(path, locked=[True, False])
+    open_drawing.append(fake)
+    paths = {fmt: Path(tmp_path, f"A.{fmt}") for fmt in ("pdf", "dxf", "svg")}
+
+    locked = drawing.export_drawing(
+        paths=paths,
+        document=SimpleNamespace(document=SimpleNamespace(name="A.CATPart")),
+        snapshot=make_snapshot({PROP_DRAWING_PATH: str(path)}),
+        interactive=False,
+    )
+
+    # The drawing is opened by the export, each format is exported once. Only the unlocked
+    # view is written, the drawing is saved once.
+    assert fake.exports == [(p, fmt) for fmt, p in paths.items()]
+    assert locked == 1
+    assert all(v.lock_status for v in fake.views[2:])
+    assert [v.writes for v in fake.views] == [0, 0, 0, 1]
+    assert fake.saves == 1
+    assert catia.refresh_display
+
+
+def test_export_locked_drawing_is_not_saved(
+    tmp_path: Path,
+    catia: SimpleNamespace,
+    open_drawing: list,
+    lock_views: None,
+    make_snapshot,
+):
+    from pytia_quick_export.const import PROP_DRAWING_PATH
+    from pytia_quick_export.worker import drawing
+
+    path = Path(tmp_path, "A.CATDrawing")
+    path.touch()
+    fake = FakeDrawing(path, locked=[True, True])
+    open_drawing.append(fake)
+
+    locked = drawing.export_drawing(
+        paths={"pdf": Path(tmp_path, "A.pdf")},
+        document=SimpleNamespace(document=SimpleNamespace(name="A.CATPart")),
+        snapshot=make_snapshot({PROP_DRAWING_PATH: str(path)}),
+        interactive=False,
+    )
+
+    assert len(fake.exports) == 1
+    assert locked == 0
+    assert not any(v.writes for v in fake.views)
+    assert fake.saves == 0
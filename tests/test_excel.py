@@ -0,0 +1,209 @@
+"""
+    Test the worker/excel.py file.
+"""
+
+import tracemalloc
+from copy import copy
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment
+from openpyxl.styles import Font
+from openpyxl.styles import PatternFill
+from openpyxl.workbook import Workbook
+
+COLUMNS = 2000
+
+
+def make_data(columns: int = COLUMNS):
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+
+    return DataModel(
+        data=[
+            DatumModel(index=i, name=f"Column {i}", value=f"Value {i}" * (i % 5))
+            for i in range(columns)
+        ]
+    )
+
+
+def style_worksheet_per_cell(worksheet) -> None:
+    """The previous implementation: Creates the styles for every single cell."""
+    from pytia_quick_export.resources import resource
+
+    for column_cells in worksheet.columns:
+        for index, cell in enumerate(column_cells):
+            if index > resource.excel.data_row - 1:
+                color = (
+                    resource.excel.data_color_1
+                    if index % 2 == 0
+                    else resource.excel.data_color_2
+                )
+                bg_color = (
+                    resource.excel.data_bg_color_1
+                    if index % 2 == 0
+                    else resource.excel.data_bg_color_2
+                )
+                cell.fill = PatternFill(
+                    start_color=bg_color, end_color=bg_color, fill_type="solid"
+                )
+            else:
+                color = None
+            cell.number_format = "@"
+            cell.font = Font(
+                name=resource.excel.font, size=resource.excel.size, color=color
+            )
+            cell.alignment = Alignment(horizontal="left", vertical="center")
+
+        if isinstance(resource.excel.header_row, int):
+            worksheet.row_dimensions[resource.excel.header_row + 1].height = 20
+            column_cells[resource.excel.header_row].font = Font(
+                name=resource.excel.font,
+                size=resource.excel.size,
+                bold=True,
+                color=resource.excel.header_color,
+            )
+            column_cells[resource.excel.header_row].fill = PatternFill(
+                start_color=resource.excel.header_bg_color,
+                end_color=resource.excel.header_bg_color,
+                fill_type="solid",
+            )
+            column_cells[resource.excel.header_row].alignment = Alignment(
+                horizontal="center", vertical="center"
+            )
+
+
+def make_worksheet():
+    from pytia_quick_export.worker.excel import ColumnWidths
+    from pytia_quick_export.worker.excel import ExcelStyles
+    from pytia_quick_export.worker.excel import _write_data
+
+    workbook = Workbook()
+    worksheet = workbook.active
+    widths = ColumnWidths()
+    styles = ExcelStyles(workbook=workbook)
+    _write_data(worksheet=worksheet, data=make_data(), widths=widths, styles=styles)
+    return worksheet, widths, styles
+
+
+def test_styles_are_equal():
+    from pytia_quick_export.worker.excel import _style_worksheet
+
+    expected, _, _ = make_worksheet()
+    style_worksheet_per_cell(expected)
+    actual, widths, styles = make_worksheet()
+    _style_worksheet(worksheet=actual, widths=widths, styles=styles)
+
+    for expected_row, actual_row in zip(expected.iter_rows(), actual.iter_rows()):
+        for expected_cell, actual_cell in zip(expected_row, actual_row):
+            # Style proxies only compare equal to the style they are wrapping.
+            assert actual_cell.font == copy(expected_cell.font)
+            assert actual_cell.fill == copy(expected_cell.fill)
+            assert actual_cell.alignment == copy(expected_cell.alignment)
+            assert actual_cell.number_format == expected_cell.number_format
+
+
+def test_styles_are_interned():
+    from pytia_quick_export.worker.excel import _style_worksheet
+
+    worksheet, widths, styles = make_worksheet()
+    _style_worksheet(worksheet=worksheet, widths=widths, styles=styles)
+
+    # One named style per row type, no matter how many cells have been styled.
+    assert len(worksheet.parent.named_styles) <= 5
+    assert len(worksheet.parent._cell_styles) <= 5
+
+
+def test_style_definitions_are_cached(monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export.worker import excel
+    from pytia_quick_export.worker.excel import ExcelStyles
+
+    first = ExcelStyles(workbook=Workbook())
+    first.get(ExcelStyles.HEADER)
+    second = ExcelStyles(workbook=Workbook())
+    second.get(ExcelStyles.HEADER)
+    assert first._definitions is second._definitions
+
+    # Changing the style settings of the excel.json invalidates the definitions.
+    # Patch the resources instance that is used by the exporter.
+    monkeypatch.setattr(excel.resource.excel, "header_color", "FF0000")
+    third = ExcelStyles(workbook=Workbook())
+    third.get(ExcelStyles.HEADER)
+    assert third._definitions is not first._definitions
+    assert third._styles[ExcelStyles.HEADER].font.color.rgb == "00FF0000"
+
+
+def test_column_widths():
+    from pytia_quick_export.worker.excel import _style_worksheet
+
+    worksheet, widths, styles = make_worksheet()
+    _style_worksheet(worksheet=worksheet, widths=widths, styles=styles)
+
+    # The tracked widths equal the widths of a full rescan of all written cells.
+    for column_cells in worksheet.columns:
+        length = max(len(str(c.value)) * 1.1 for c in column_cells if c.value)
+        letter = column_cells[0].column_letter
+        assert worksheet.column_dimensions[letter].width == max(length, 2)
+
+
+def make_rows(count: int, columns: int = 20):
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+
+    for row in range(count):
+        yield DataModel(
+            data=[
+                DatumModel(index=i, name=f"Column {i}", value=f"{row}-{i}")
+                for i in range(columns)
+            ]
+        )
+
+
+def test_export_excel_rows(tmp_path: Path):
+    from pytia_quick_export.resources import resource
+    from pytia_quick_export.worker.excel import export_excel_rows
+
+    path = Path(tmp_path, "rows.xlsx")
+    assert (
+        export_excel_rows(path=path, selected_project="P1", data=make_rows(300)) == 300
+    )
+
+    worksheet = load_workbook(path).active
+    data_row = resource.excel.data_row + 1
+    assert worksheet.title == "P1"
+    assert worksheet.max_row == data_row + 299
+    assert worksheet.cell(data_row, 1).value == "0-0"
+    assert worksheet.cell(data_row + 299, 20).value == "299-19"
+    assert worksheet.column_dimensions["T"].width == len("Column 19") * 1.1
+
+    if resource.excel.header_row is not None:
+        header = worksheet.cell(resource.excel.header_row + 1, 1)
+        assert header.value == "Column 0"
+        assert header.font.b
+
+    colors = {
+        worksheet.cell(row, 1).fill.start_color.rgb[-6:]
+        for row in (data_row, data_row + 1)
+    }
+    assert colors == {resource.excel.data_bg_color_1, resource.excel.data_bg_color_2}
+
+
+def measure_peak_memory(tmp_path: Path, count: int) -> int:
+    from pytia_quick_export.worker.excel import export_excel_rows
+
+    tracemalloc.start()
+    export_excel_rows(
+        path=Path(tmp_path, f"{count}.xlsx"),
+        selected_project="P1",
+        data=make_rows(count),
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def test_export_excel_rows_memory_is_flat(tmp_path: Path):
+    small = measure_peak_memory(tmp_path, 100)
+    large = measure_peak_memory(tmp_path, 1000)
+    assert large < small * 2
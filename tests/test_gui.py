@@ -0,0 +1,38 @@
+"""
+    Test the startup of the gui.py file.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Modules that are only needed by the exporters, they must not be imported at startup.
+DEFERRED_MODULES = [
+    "openpyxl",
+    "jinja2",
+    "validators",
+    "requests",
+    "qrcode",
+    "pytia_ui_tools.utils.qr",
+    "pytia.utilities.docket",
+    "pytia.wrapper.documents.part_documents",
+    "pytia.wrapper.documents.product_documents",
+    "worker",
+]
+
+
+def test_deferred_imports():
+    # The GUI isn't constructed, this would require CATIA. Only the imports are checked.
+    code = (
+        "import json, sys; import gui; "
+        "print(json.dumps([m for m in json.loads(sys.argv[1]) if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(DEFERRED_MODULES)],
+        cwd=os.path.join(os.path.dirname(__file__), "..", "pytia_quick_export"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,29 @@
+"""
+    Test the helper/language.py file.
+"""
+
+
+class FakeParameters:
+    def __init__(self, names: list) -> None:
+        self.names = names
+        self.calls = 0
+
+    def get_item(self, name: str) -> str:
+        self.calls += 1
+        if name not in self.names:
+            raise Exception(f"Parameter {name!r} not found.")
+        return name
+
+
+def test_language_is_probed_once():
+    from pytia_quick_export.helper.language import LanguageCache
+    from pytia_quick_export.resources import resource
+
+    parameters = FakeParameters([resource.keywords.de.partnumber])
+    cache = LanguageCache()
+
+    for _ in range(40):
+        assert cache.get(parameters) == "de"  # type: ignore
+
+    assert cache.probes == 1
+    assert parameters.calls == 2
@@ -0,0 +1,16 @@
+"""
+    Test the worker/qr.py file.
+"""
+
+
+def test_render_qr():
+    from pytia_quick_export.worker.qr import render_qr
+
+    render_qr.cache_clear()
+    payload = {"project": "P1", "product": None, "partnumber": "PN", "revision": "1"}
+    image = render_qr(**payload)
+
+    assert image.startswith(b"\x89PNG")
+    assert render_qr(**payload) is image
+    assert render_qr.cache_info().hits == 1
+    assert render_qr(**{**payload, "revision": "2"}) != image
@@ -3,7 +3,10 @@
 """
 
 import os
+import subprocess
+import sys
 
+import pytest
 import validators
 
 
@@ -13,6 +16,64 @@ def test_resources_class():
     resource = Resources()
 
 
+def test_lazy_loading():
+    from pytia_quick_export.resources import Resources
+
+    resource = Resources()
+    assert resource._settings is None
+    assert resource._users is None
+    assert resource._excel is None
+
+    assert resource.excel.plan_made
+    assert resource._keywords is not None
+    assert resource._docket is None
+    assert resource._rps is None
+
+
+def test_lazy_loading_publishes_complete_configs(monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export import resources
+
+    resource = resources.Resources()
+    seen = []
+    compile_plan = resources.EXCEL.compile
+
+    def compile_and_record(excel, keywords) -> None:
+        seen.append(resource._excel)
+        compile_plan(excel, keywords)
+
+    monkeypatch.setattr(resources.EXCEL, "compile", compile_and_record)
+
+    # The excel config isn't visible to other threads before its plan is compiled.
+    assert resource.excel.plan_made
+    assert seen == [None]
+
+    # The users are set after their indexes, a set user list always comes with its indexes.
+    users = resource.users
+    assert resource._users_by_logon[users[0].logon] is users[0]
+    assert resource._users_by_name[users[0].name] is users[0]
+
+
+def test_import_is_lazy():
+    # Importing the resources neither parses a config file nor imports openpyxl.
+    code = (
+        "import json, sys; parsed = []; loads = json.loads; "
+        "json.loads = lambda *args, **kwargs: parsed.append(args) or loads(*args, **kwargs); "
+        "import resources; r = resources.resource; "
+        "print(len(parsed), 'openpyxl' in sys.modules, "
+        "[r._settings, r._users, r._excel, r._props, r._bundle])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.join(os.path.dirname(__file__), "..", "pytia_quick_export"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == (
+        "0 False [None, None, None, None, None]"
+    )
+
+
 def test_settings():
     from pytia_quick_export.resources import resource
 
@@ -44,3 +105,36 @@ def test_debug_mode():
     from pytia_quick_export.resources import resource
 
     assert resource.settings.debug == False
+
+
+def test_excel_plan():
+    from pytia_quick_export.resources import resource
+
+    for items, plan in (
+        (resource.excel.header_items_made, resource.excel.plan_made),
+        (resource.excel.header_items_bought, resource.excel.plan_bought),
+    ):
+        assert len(items) == len(plan)
+        for index, (item, compiled) in enumerate(zip(items, plan)):
+            assert compiled.index == index
+            assert compiled.value in item
+            if compiled.kind == "keyword":
+                assert compiled.value.startswith("$")
+            if compiled.kind != "keyword":
+                assert compiled.names["en"] == compiled.names["de"]
+
+
+def test_excel_formats():
+    from dataclasses import asdict
+
+    from pytia_quick_export.resources import EXCEL
+    from pytia_quick_export.resources import resource
+
+    config = asdict(resource.excel)
+    for key in ("plan_made", "plan_bought", "formats", "encoding"):
+        config.pop(key)
+
+    assert EXCEL(**config).formats == ["xlsx"]
+    assert EXCEL(**config, formats=["xlsx", "csv", "tsv"]).formats
+    with pytest.raises(ValueError):
+        EXCEL(**config, formats=["parquet"])
@@ -0,0 +1,214 @@
+"""
+    Test the worker/runner.py file.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+class FakeRoot:
+    def update_idletasks(self) -> None:
+        pass
+
+
+class FakeVariable:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def get(self) -> float:
+        return self.value
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+def make_runner():
+    from pytia_quick_export.worker.runner import Runner
+
+    return Runner(root=FakeRoot(), callback_variable=FakeVariable())  # type: ignore
+
+
+def test_dependencies_are_respected():
+    runner = make_runner()
+    order = []
+
+    runner.add(lambda: order.append("a"), name="a")
+    runner.add(lambda: order.append("b"), name="b", requires=["a"], com=False)
+    runner.add(lambda: order.append("c"), name="c", requires=["b"])
+
+    runner.run_tasks()
+
+    assert order == ["a", "b", "c"]
+    assert runner.progress_callback.get() == 100
+
+
+def test_com_tasks_run_on_calling_thread():
+    runner = make_runner()
+    threads = {}
+
+    runner.add(lambda: threads.update(com=threading.get_ident()), name="com")
+    runner.add(
+        lambda: threads.update(pool=threading.get_ident()), name="pool", com=False
+    )
+
+    runner.run_tasks()
+
+    assert threads["com"] == threading.get_ident()
+    assert threads["pool"] != threading.get_ident()
+
+
+def test_independent_tasks_run_concurrently():
+    runner = make_runner()
+    barrier = threading.Barrier(2, timeout=2)
+
+    runner.add(barrier.wait, name="com")
+    runner.add(barrier.wait, name="pool", com=False)
+
+    start = time.perf_counter()
+    runner.run_tasks()
+    assert time.perf_counter() - start < 2
+
+
+def test_unknown_requirement():
+    runner = make_runner()
+    with pytest.raises(ValueError):
+        runner.add(lambda: None, name="a", requires=["b"])
+
+
+def test_background_events():
+    runner = make_runner()
+    threads = {}
+
+    runner.add(lambda: threads.update(com=threading.get_ident()), name="com")
+    runner.add(lambda: None, name="pool", requires=["com"], com=False)
+
+    runner.start()
+    events = list(runner.iter_events())
+    kinds = [e.kind for e in events]
+
+    assert threads["com"] == threading.get_ident()
+    assert kinds[-1] == "done"
+    assert kinds.count("started") == kinds.count("finished") == 2
+    assert "call" in kinds and "log" in kinds
+    assert runner.progress_callback.get() == 100
+
+
+def test_background_failure():
+    runner = make_runner()
+
+    def fail() -> None:
+        raise RuntimeError("failed")
+
+    runner.add(fail, name="fail")
+    runner.start()
+    event = list(runner.iter_events())[-1]
+
+    assert event.kind == "failed"
+    assert isinstance(event.exception, RuntimeError)
+
+
+def test_background_cancel():
+    runner = make_runner()
+    executed = []
+
+    runner.add(runner.cancel, name="cancel")
+    runner.add(lambda: executed.append("skipped"), name="skipped")
+
+    runner.start()
+    event = list(runner.iter_events())[-1]
+
+    assert event.kind == "cancelled"
+    assert not executed
+
+
+def test_exception_is_reraised():
+    runner = make_runner()
+
+    def fail() -> None:
+        raise RuntimeError("failed")
+
+    runner.add(fail, name="fail", com=False)
+    with pytest.raises(RuntimeError):
+        runner.run_tasks()
+
+
+def test_task_metrics(tmp_path: Path):
+    runner = make_runner()
+    output = Path(tmp_path, "data.csv")
+
+    runner.add(lambda: output.write_text("a;b"), name="write", outputs=[output])
+    runner.add(lambda: time.sleep(0.05), name="sleep", requires=["write"], com=False)
+    runner.run_tasks()
+
+    metrics = runner.metrics
+    assert metrics.status == "done"
+    assert [t.name for t in metrics.tasks] == ["write", "sleep"]
+    assert all(t.status == "ok" for t in metrics.tasks)
+    assert metrics.tasks[0].artifacts == {"data.csv": 3}
+    assert metrics.tasks[1].duration >= 0.05
+    assert metrics.slowest.name == "sleep"  # type: ignore
+    assert metrics.artifacts_size == 3
+    assert metrics.duration >= metrics.tasks[1].duration
+    assert metrics.to_dict()["throughput"] > 0
+
+
+def test_task_counters():
+    from pytia_quick_export.worker.metrics import format_metrics
+
+    runner = make_runner()
+    runner.add(
+        lambda: runner.count(task="count", name="items", value=3),
+        name="count",
+        com=False,
+    )
+    runner.run_tasks()
+
+    assert runner.metrics.tasks[0].counters == {"items": 3}
+    assert "items: 3" in format_metrics(runner.metrics)
+    with pytest.raises(ValueError):
+        runner.count(task="missing", name="items", value=1)
+
+
+def test_task_metrics_of_failure():
+    runner = make_runner()
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fail() -> None:
+        barrier.wait()
+        raise RuntimeError("failed")
+
+    runner.add(fail, name="fail", com=False)
+    runner.add(lambda: (barrier.wait(), time.sleep(0.05)), name="slow", com=False)
+    runner.add(lambda: None, name="discarded", requires=["fail"])
+    with pytest.raises(RuntimeError):
+        runner.run_tasks()
+
+    metrics = runner.metrics
+    statuses = {t.name: t.status for t in metrics.tasks}
+    assert metrics.status == "failed"
+    assert statuses == {"fail": "failed", "slow": "ok"}
+    assert metrics.tasks[0].error == "RuntimeError: failed"
+
+
+def test_write_metrics(tmp_path: Path):
+    from pytia_quick_export.worker.metrics import format_metrics
+    from pytia_quick_export.worker.metrics import write_metrics
+
+    runner = make_runner()
+    runner.add(lambda: None, name="task")
+    runner.run_tasks()
+
+    path = Path(tmp_path, "metrics.jsonl")
+    write_metrics(metrics=runner.metrics, context={"document": "A"}, path=path)
+    write_metrics(metrics=runner.metrics, context={"document": "B"}, path=path)
+
+    with open(path, "r", encoding="utf8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [line["document"] for line in lines] == ["A", "B"]
+    assert lines[0]["tasks"][0]["name"] == "task"
+    assert lines[0]["status"] == "done"
+    assert "task" in format_metrics(runner.metrics)
@@ -0,0 +1,72 @@
+"""
+    Test the helper/snapshot.py file.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from tests.conftest import FakeProperties
+
+
+class FakeProduct:
+    part_number = "PN-001"
+    revision = "2"
+    definition = "Bracket"
+    source = 1
+    description_reference = "Sheet metal bracket"
+
+    def is_catpart(self) -> bool:
+        return True
+
+
+class FakeDocument:
+    def __init__(self, values: dict) -> None:
+        self.product = FakeProduct()
+        self.properties = FakeProperties(values)
+
+
+def test_snapshot_reads_each_property_once():
+    from pytia_quick_export.helper.snapshot import take_snapshot
+
+    document = FakeDocument({"pytia.project": "P1", "pytia.product": "Foo"})
+    snapshot = take_snapshot(
+        document=document,
+        language="en",
+        names=["pytia.project", "pytia.product", "pytia.missing"],
+    )
+    calls = document.properties.calls
+
+    assert snapshot.get("pytia.project") == "P1"
+    assert snapshot.get("pytia.missing") is None
+    assert snapshot.exists("pytia.product")
+    assert not snapshot.exists("pytia.missing")
+    assert snapshot.partnumber == "PN-001"
+    assert snapshot.is_part
+    assert document.properties.calls == calls == 5
+
+
+def test_snapshot_is_immutable():
+    from pytia_quick_export.helper.snapshot import take_snapshot
+
+    snapshot = take_snapshot(
+        document=FakeDocument({"pytia.project": "P1"}),
+        language="de",
+        names=["pytia.project"],
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        snapshot.revision = "3"  # type: ignore
+    with pytest.raises(TypeError):
+        snapshot.properties["pytia.project"] = "P2"  # type: ignore
+
+
+def test_default_property_names():
+    from pytia_quick_export.helper.snapshot import get_required_property_names
+    from pytia_quick_export.resources import resource
+
+    names = get_required_property_names()
+
+    assert len(names) == len(set(names))
+    assert all(v in names for v in resource.props.values)
+    assert not any(n.startswith("$") for n in names)
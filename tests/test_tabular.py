@@ -0,0 +1,65 @@
+"""
+    Test the worker/tabular.py file.
+"""
+
+import csv
+from pathlib import Path
+
+import pytest
+
+
+def make_data(columns: int = 5):
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+
+    return DataModel(
+        data=[
+            DatumModel(
+                index=i, name=f"Column {i}", value=None if i == 1 else f"Wert ä{i}"
+            )
+            for i in range(columns)
+        ]
+    )
+
+
+@pytest.mark.parametrize("export_format,delimiter", [("csv", ","), ("tsv", "\t")])
+def test_export_tabular(tmp_path: Path, export_format: str, delimiter: str):
+    from pytia_quick_export.resources import resource
+    from pytia_quick_export.worker.tabular import export_tabular
+
+    path = Path(tmp_path, f"data.{export_format}")
+    export_tabular(path=path, data=make_data(), export_format=export_format)  # type: ignore
+
+    with open(path, "r", encoding=resource.excel.encoding, newline="") as f:
+        rows = list(csv.reader(f, delimiter=delimiter))
+
+    assert rows[resource.excel.data_row] == [
+        "Wert ä0",
+        "",
+        "Wert ä2",
+        "Wert ä3",
+        "Wert ä4",
+    ]
+    if resource.excel.header_row is not None:
+        assert rows[resource.excel.header_row] == [f"Column {i}" for i in range(5)]
+
+
+def test_export_tabular_layout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export.worker import tabular
+    from pytia_quick_export.worker.tabular import export_tabular
+
+    # Patch the resources instance that is used by the exporter.
+    monkeypatch.setattr(tabular.resource.excel, "header_row", 1)
+    monkeypatch.setattr(tabular.resource.excel, "data_row", 3)
+    monkeypatch.setattr(tabular.resource.excel, "encoding", "cp1252")
+
+    path = Path(tmp_path, "data.csv")
+    export_tabular(path=path, data=make_data(), export_format="csv")
+
+    with open(path, "r", encoding="cp1252", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert len(rows) == 4
+    assert rows[0] == rows[2] == []
+    assert rows[1][0] == "Column 0"
+    assert rows[3][0] == "Wert ä0"
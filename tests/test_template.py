@@ -2,8 +2,72 @@
     Test the templates.py file.
 """
 
+import os
+import zipfile
+
 
 def test_templates_class():
     from pytia_quick_export.templates import Templates
 
     templates = Templates()
+
+
+def make_app(path, content: str) -> None:
+    with zipfile.ZipFile(path, "w") as zfile:
+        zfile.writestr("templates/docket.CATDrawing", content)
+        zfile.writestr("templates/mail.html", content)
+
+
+def test_template_cache(tmp_path, monkeypatch):
+    from pytia_quick_export import templates as module
+    from pytia_quick_export.templates import Templates
+
+    app_path = tmp_path / "app.pyz"
+    cache_root = tmp_path / "templates"
+    os.makedirs(cache_root)
+    make_app(app_path, "v1")
+
+    monkeypatch.setattr(module, "TEMP_TEMPLATES", cache_root)
+    monkeypatch.setattr(Templates, "app_path", property(lambda _: app_path))
+    instance = Templates.__new__(Templates)
+
+    first = instance._get_cache_folder()
+    assert first is not None
+    assert (first / "docket.CATDrawing").read_text() == "v1"
+
+    def fail(**_) -> None:
+        raise AssertionError("Templates have been extracted twice.")
+
+    monkeypatch.setattr(instance, "_extract", fail)
+    assert instance._get_cache_folder() == first
+    monkeypatch.undo()
+
+    monkeypatch.setattr(module, "TEMP_TEMPLATES", cache_root)
+    monkeypatch.setattr(Templates, "app_path", property(lambda _: app_path))
+    make_app(app_path, "v2 release")
+
+    second = instance._get_cache_folder()
+    assert second is not None and second != first
+    assert (second / "mail.html").read_text() == "v2 release"
+    assert not [p for p in os.listdir(cache_root) if p.endswith(".tmp")]
+
+
+def test_concurrent_extraction(tmp_path, monkeypatch):
+    from pytia_quick_export import templates as module
+    from pytia_quick_export.templates import Templates
+
+    app_path = tmp_path / "app.pyz"
+    cache_root = tmp_path / "templates"
+    os.makedirs(cache_root)
+    make_app(app_path, "v1")
+
+    monkeypatch.setattr(module, "TEMP_TEMPLATES", cache_root)
+    monkeypatch.setattr(Templates, "app_path", property(lambda _: app_path))
+    instance = Templates.__new__(Templates)
+    key = Templates.get_cache_key(app_path)
+
+    # Simulates another instance that finished extracting while this one was extracting.
+    instance._extract(key=key, cache_folder=cache_root / key)
+    instance._extract(key=key, cache_folder=cache_root / key)
+
+    assert os.listdir(cache_root) == [key]
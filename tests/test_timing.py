@@ -0,0 +1,80 @@
+"""
+    Test the timing.py file.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def test_nested_spans():
+    from pytia_quick_export.timing import Timer
+
+    timer = Timer()
+    with timer.span("Outer") as outer:
+        with timer.span("Inner") as inner:
+            pass
+    with timer.span("Next"):
+        pass
+
+    assert [(s.name, s.depth) for s in timer.spans] == [
+        ("Outer", 0),
+        ("Inner", 1),
+        ("Next", 0),
+    ]
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_span_records_error():
+    from pytia_quick_export.timing import Timer
+
+    timer = Timer()
+    with pytest.raises(ValueError):
+        with timer.span("Failing"):
+            raise ValueError("Broken")
+    with timer.span("After"):
+        pass
+
+    assert timer.spans[0].error == "ValueError: Broken"
+    assert timer.spans[1].depth == 0
+
+
+def test_spans_of_threads():
+    from pytia_quick_export.timing import Timer
+
+    timer = Timer()
+
+    def record() -> None:
+        with timer.span("Thread"):
+            pass
+
+    with timer.span("Main"):
+        thread = threading.Thread(target=record)
+        thread.start()
+        thread.join()
+
+    # The depth is tracked per thread.
+    assert {s.name: s.depth for s in timer.spans} == {"Main": 0, "Thread": 0}
+
+
+def test_report(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from pytia_quick_export import timing
+
+    monkeypatch.setattr(timing, "LOGS", str(tmp_path))
+    timer = timing.Timer()
+    timer.json_path = Path(tmp_path, "report", "startup.json")
+    with timer.span("Phase"):
+        pass
+
+    paths = timer.dump()
+    assert paths == [Path(tmp_path, timing.LOG_TIMING), timer.json_path]
+    for path in paths:
+        with open(path, "r", encoding="utf8") as f:
+            report = json.load(f)
+        assert [s["name"] for s in report["spans"]] == ["Phase"]
+        assert report["elapsed"] >= report["spans"][0]["duration"]
+
+    assert "Phase" in timer.format_report()
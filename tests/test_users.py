@@ -0,0 +1,41 @@
+"""
+    Test the user lookups of the resources.py file.
+"""
+
+import pytest
+
+from tests.conftest import make_users
+
+
+def test_lookups():
+    from pytia_quick_export.resources import Resources
+
+    resources = Resources()
+    resources._index_users(make_users(10))
+
+    assert resources.logon_exists("user3")
+    assert not resources.logon_exists("nobody")
+    assert resources.get_user_by_logon("user3").name == "User 3"
+    assert resources.get_user_by_name("User 3").logon == "user3"  # type: ignore
+    assert resources.get_user_by_name("Nobody") is None
+
+
+def test_lookups_use_the_indexes():
+    from pytia_quick_export.resources import Resources
+
+    class UnsearchableList(list):
+        def __iter__(self):
+            raise AssertionError("The users have been searched linearly.")
+
+    resources = Resources()
+    users = make_users(10)
+    resources._index_users(users)
+    resources._users = UnsearchableList(users)
+
+    assert resources._users_by_logon["user3"] is users[3]
+    assert resources._users_by_name["User 3"] is users[3]
+    assert resources.logon_exists("user3")
+    assert resources.get_user_by_logon("user3") is users[3]
+    assert resources.get_user_by_name("User 3") is users[3]
+    with pytest.raises(ValueError):
+        resources.get_user_by_logon("nobody")
@@ -0,0 +1,118 @@
+"""
+    Test the worker/xlsx.py file.
+"""
+
+import os
+import subprocess
+import sys
+from copy import copy
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+
+def make_data():
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+
+    values = ["Value", None, " Leading space", "A & B <C>", "Ümlaut", 3]
+    return DataModel(
+        data=[
+            DatumModel(index=i, name=f"Column {i}", value=value)  # type: ignore
+            for i, value in enumerate(values)
+        ]
+    )
+
+
+def export(tmp_path: Path, native: bool):
+    from pytia_quick_export.worker.excel import _export_excel_openpyxl
+    from pytia_quick_export.worker.xlsx import write_xlsx
+
+    path = Path(tmp_path, f"{'native' if native else 'openpyxl'}.xlsx")
+    if native:
+        write_xlsx(path=path, title="P & 1", data=make_data())
+    else:
+        _export_excel_openpyxl(path=path, selected_project="P & 1", data=make_data())
+    return load_workbook(path).active
+
+
+@pytest.mark.parametrize("layout", [(0, 1), (None, 1), (1, 3), (2, 0)])
+def test_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, layout: tuple):
+    from pytia_quick_export.worker import xlsx
+
+    # Patch the resources instance that is used by both writers.
+    monkeypatch.setattr(xlsx.resource.excel, "header_row", layout[0])
+    monkeypatch.setattr(xlsx.resource.excel, "data_row", layout[1])
+
+    expected = export(tmp_path, native=False)
+    actual = export(tmp_path, native=True)
+
+    # The layout is applied: The last row is the data row or the header row (zero based).
+    assert actual.max_row == max(row for row in layout if row is not None) + 1
+
+    assert actual.title == expected.title
+    assert actual.max_row == expected.max_row
+    assert actual.max_column == expected.max_column
+
+    for expected_row, actual_row in zip(expected.iter_rows(), actual.iter_rows()):
+        for expected_cell, actual_cell in zip(expected_row, actual_row):
+            assert actual_cell.value == expected_cell.value
+            assert actual_cell.style == expected_cell.style
+            assert actual_cell.number_format == expected_cell.number_format
+            assert actual_cell.font == copy(expected_cell.font)
+            assert actual_cell.fill == copy(expected_cell.fill)
+            assert actual_cell.alignment == copy(expected_cell.alignment)
+
+    for letter, dimension in expected.column_dimensions.items():
+        assert actual.column_dimensions[letter].width == dimension.width
+    for row in range(1, expected.max_row + 1):
+        assert actual.row_dimensions[row].height == expected.row_dimensions[row].height
+
+
+def test_can_write_xlsx():
+    from pytia_quick_export.models.data import DataModel
+    from pytia_quick_export.models.data import DatumModel
+    from pytia_quick_export.worker.xlsx import can_write_xlsx
+
+    assert can_write_xlsx(title="P1", data=make_data())
+    assert not can_write_xlsx(title="P/1", data=make_data())
+    assert not can_write_xlsx(title="P" * 32, data=make_data())
+    assert not can_write_xlsx(
+        title="P1",
+        data=DataModel(data=[DatumModel(index=0, name="A", value="Bell \x07")]),
+    )
+
+
+def test_export_excel_uses_native_writer(tmp_path: Path):
+    import zipfile
+
+    from pytia_quick_export.worker.excel import export_excel
+
+    path = Path(tmp_path, "export.xlsx")
+    export_excel(path=path, selected_project="P1", data=make_data(), source="made")
+
+    with zipfile.ZipFile(path) as zfile:
+        assert "docProps/app.xml" not in zfile.namelist()
+    assert load_workbook(path).active.title == "P1"
+
+
+def test_export_excel_does_not_import_openpyxl(tmp_path: Path):
+    # The native writer doesn't need openpyxl, hence the export doesn't import it.
+    code = (
+        "import sys; from pathlib import Path; "
+        "from models.data import DataModel, DatumModel; "
+        "from worker.excel import export_excel; "
+        "data = DataModel(data=[DatumModel(index=0, name='Column', value='Value')]); "
+        "export_excel(path=Path(sys.argv[1]), selected_project='P1', data=data, "
+        "source='made'); "
+        "print(Path(sys.argv[1]).exists(), 'openpyxl' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(Path(tmp_path, "data.xlsx"))],
+        cwd=os.path.join(os.path.dirname(__file__), "..", "pytia_quick_export"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "True False"